@@ -1,14 +1,29 @@
 """Agents package"""
-# Circular import önlemek için modüller direkt import edilmeli
-# from agents.base_agent import BaseAgent
-
-__all__ = [
-    'BaseAgent',
-    'Task',
-    'Message',
-    'AgentMemory',
-    'AIAgent',
-    'ManagerAgent',
-    'ExecutiveAgent',
-    'AgentFactory'
-]
+# Circular import önlemek için lazy import kullan
+# Alt modüller ilk erişimde yüklenir - `import agents` hiçbirini çekmez
+import importlib
+
+_EXPORTS = {
+    'BaseAgent': '.base_agent',
+    'Task': '.base_agent',
+    'Message': '.base_agent',
+    'AgentMemory': '.base_agent',
+    'Mailbox': '.mailbox',
+    'OverflowPolicy': '.mailbox',
+    'AIAgent': '.ai_agent',
+    'ManagerAgent': '.ai_agent',
+    'ExecutiveAgent': '.ai_agent',
+    'AgentFactory': '.factory',
+    'AgentSpec': '.org_loader',
+    'AgentKind': '.org_loader'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,16 +3,49 @@ AI-Powered Agents - LLM entegrasyonlu ajanlar
 """
 from typing import List, Dict, Optional
 from agents.base_agent import BaseAgent, Task
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.messages import HumanMessage, SystemMessage
+import json
 import os
-from systems.ai_provider import get_ai_provider, AIProvider
+import time
+from systems.ai_provider import get_ai_provider, get_llm_limiter, AIProvider
+from systems.llm_router import score_response
+from systems.task_router import estimate_call_difficulty
+from utils.clock import call_latency, get_clock
 
 
 
 import logging
 logger = logging.getLogger(__name__)
+
+
+def _chat_messages(system: str, prompt: str) -> list:
+    """Sistem ve kullanıcı mesajı - LangChain ilk LLM çağrısında yüklenir"""
+    from langchain_core.messages import HumanMessage, SystemMessage
+    return [SystemMessage(content=system), HumanMessage(content=prompt)]
+
+
+def _ewma_weight(samples: int) -> float:
+    """İlk örnek ortalamayı doğrudan belirler, sonrakiler üstel ortalamaya girer"""
+    return 1.0 if samples == 0 else 0.1
+
+
+def _parse_contributions(text: str) -> Dict[str, str]:
+    """Toplu toplantı cevabındaki JSON'u agent adı -> katkı sözlüğüne çevir"""
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        data = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+    
+    items = data.get("contributions", []) if isinstance(data, dict) else []
+    return {
+        item["agent"]: str(item["contribution"])
+        for item in items
+        if isinstance(item, dict) and item.get("agent") and item.get("contribution")
+    }
+
+
 class AIAgent(BaseAgent):
     """LLM destekli AI Agent"""
     
@@ -21,35 +54,107 @@ class AIAgent(BaseAgent):
                  ai_provider_manager: AIProvider = None):
         super().__init__(name, role, department, skills, manager)
         
-        # AI Provider Manager
-        self.ai_provider_manager = ai_provider_manager or get_ai_provider()
-        
-        # Role'e göre en uygun AI'ı seç
-        if model:
-            # Manuel model belirtilmişse onu kullan
-            self.assigned_ai = model
-            self.llm = ChatOpenAI(
-                model=model,
-                temperature=0.7,
-                api_key=os.getenv("OPENAI_API_KEY")
-            )
-        else:
-            # Role'e göre otomatik AI seçimi
-            assignment = self.ai_provider_manager.get_ai_for_role(role, department)
-            self.assigned_ai = assignment.primary_ai
-            self.fallback_ai = assignment.fallback_ai
-            self.ai_tier = assignment.tier
-            self.difficulty_level = assignment.difficulty_level
-            
-            # LLM client oluştur
-            self.llm = self.ai_provider_manager.create_llm_client(self.assigned_ai)
-            
-            logger.info(f"🤖 {name} -> {self.assigned_ai} ({self.ai_tier.value})")
-        
-        self.system_prompt = self._create_system_prompt()
+        # Ajan hafif bir tanım olarak oluşturulur; AI ataması, LLM client'ı ve
+        # sistem promptu ilk kullanımda hazırlanır
+        self._ai_provider_manager = ai_provider_manager
+        self._model = model
+        self._assignment = None
+        self._llm = None
+        self._llm_pinned = False
+        self._generation = None
+        self._system_prompt: Optional[str] = None
+    
+    @property
+    def ai_provider_manager(self) -> AIProvider:
+        if self._ai_provider_manager is None:
+            self._ai_provider_manager = get_ai_provider()
+        return self._ai_provider_manager
+    
+    def _sync_generation(self):
+        """Provider yeniden yüklendiyse atamayı ve client'ı bir sonraki kullanımda yenile"""
+        generation = getattr(self.ai_provider_manager, 'generation', 0)
+        if generation != self._generation:
+            if self._generation is not None:
+                self._assignment = None
+                if not self._llm_pinned:
+                    # Devam eden çağrılar eski client referansıyla tamamlanır
+                    self._llm = None
+            self._generation = generation
+    
+    @property
+    def assignment(self):
+        """Role göre AI ataması (manuel model verilmişse None)"""
+        self._sync_generation()
+        if self._assignment is None and not self._model:
+            self._assignment = self.ai_provider_manager.get_ai_for_role(self.role, self.department)
+        return self._assignment
+    
+    @property
+    def assigned_ai(self) -> str:
+        return self._model or self.assignment.primary_ai
+    
+    @property
+    def fallback_ai(self) -> Optional[str]:
+        return None if self._model else self.assignment.fallback_ai
+    
+    @property
+    def ai_tier(self):
+        return None if self._model else self.assignment.tier
+    
+    @property
+    def difficulty_level(self) -> Optional[int]:
+        return None if self._model else self.assignment.difficulty_level
+    
+    @property
+    def llm(self):
+        """LLM client - ilk çağrıda oluşturulur"""
+        self._sync_generation()
+        if self._llm is None:
+            if self._model:
+                # Manuel model belirtilmişse onu kullan
+                from langchain_openai import ChatOpenAI
+                self._llm = ChatOpenAI(
+                    model=self._model,
+                    temperature=0.7,
+                    api_key=os.getenv("OPENAI_API_KEY")
+                )
+            else:
+                self._llm = self.ai_provider_manager.create_llm_client(self.assigned_ai)
+                logger.debug(f"🤖 {self.name} -> {self.assigned_ai} ({self.ai_tier.value})")
+        return self._llm
+    
+    @llm.setter
+    def llm(self, client):
+        # Elle verilen client provider yenilemelerinde korunur
+        self._llm = client
+        self._llm_pinned = client is not None
+    
+    @property
+    def is_materialized(self) -> bool:
+        """LLM client'ı oluşturuldu mu?"""
+        return self._llm is not None
+    
+    @property
+    def system_prompt(self) -> str:
+        if self._system_prompt is None:
+            self._system_prompt = self._create_system_prompt()
+        return self._system_prompt
+    
+    @system_prompt.setter
+    def system_prompt(self, prompt: str):
+        self._system_prompt = prompt
+    
+    @property
+    def _length_policy_active(self) -> bool:
+        """Çıktı politikası açıksa yanıt uzunluğunu yalnızca o belirler"""
+        return self.ai_provider_manager.output_policy_enabled
     
     def _create_system_prompt(self) -> str:
         """Agent için sistem promptu oluştur"""
+        answer_style = (
+            "Net ve öz cevaplar ver, istenen uzunluğa uy" if self._length_policy_active
+            else "Detaylı ve açıklayıcı cevaplar ver"
+        )
         return f"""Sen {self.name} adında bir AI çalışansın.
 Rolün: {self.role}
 Departman: {self.department}
@@ -65,15 +170,102 @@ Görevlerin:
 
 Her zaman:
 - Profesyonel ol
-- Detaylı ve açıklayıcı cevaplar ver
+- {answer_style}
 - Sorunları proaktif şekilde çöz
 - Takım çalışmasına önem ver
 - Yüksek kaliteli iş üret
 
 Sen gerçek bir çalışan gibi davran ve verilen görevleri en iyi şekilde tamamla."""
 
+    def _llm_for_call(self, messages: List, kind: str, priority: Optional[str]):
+        """Çağrının tahmini zorluğuna göre client - rutin çağrılar daha ucuz tier'a gider"""
+        provider = self.ai_provider_manager
+        if self._model or self._llm_pinned or not messages or not provider.task_routing_enabled:
+            return self.llm
+        
+        text = str(getattr(messages[-1], 'content', ''))
+        difficulty = estimate_call_difficulty(text, kind, priority)
+        model = provider.route_call(self.assignment, difficulty)
+        if model == self.assigned_ai:
+            return self.llm
+        return provider.create_llm_client(model)
+    
+    def _cascade_model(self) -> Optional[str]:
+        """Kaskad açıksa ilk denenecek ucuz model"""
+        provider = self.ai_provider_manager
+        if self._model or self._llm_pinned or not provider.cascade_enabled:
+            return None
+        return provider.cascade_model(self.assignment)
+    
+    async def _invoke(self, messages: List, kind: str = "general", priority: Optional[str] = None):
+        """LLM çağrısı - paylaşılan eşzamanlılık sınırı altında"""
+        provider = self.ai_provider_manager
+        policy, params = None, {}
+        if provider.output_policy_enabled:
+            tier = self.ai_tier.value if self.ai_tier else None
+            policy = provider.output_policy.resolve(kind, tier, priority)
+            messages = policy.apply(messages)
+            params = {"max_tokens": policy.max_tokens}
+        
+        if not (self._model or self._llm_pinned) and provider.is_batch_call(kind):
+            # Toplu işler gerçek zamanlı eşzamanlılık sınırının dışında bekler; kuyruk ve
+            # iş bekleme süresi yanıt süresi değildir, ayrı bir ortalamada tutulur
+            started = get_clock().timestamp()
+            response = await provider.create_batch_client(self.assigned_ai).ainvoke(messages, **params)
+            self._record_batch_response(get_clock().timestamp() - started, response)
+            return response
+        
+        cheap_model = self._cascade_model()
+        if cheap_model:
+            async with get_llm_limiter():
+                started = time.perf_counter()
+                response, escalated = await provider.cascade.ainvoke(
+                    messages, kind,
+                    cheap=(cheap_model, provider.create_llm_client(cheap_model)),
+                    strong=(self.assigned_ai, self.llm),
+                    **params
+                )
+            if escalated:
+                self.performance_metrics["cascade_escalations"] = (
+                    self.performance_metrics.get("cascade_escalations", 0) + 1
+                )
+        else:
+            llm = self._llm_for_call(messages, kind, priority)
+            async with get_llm_limiter():
+                started = time.perf_counter()
+                response = await llm.ainvoke(messages, **params)
+        
+        latency = call_latency(started, response)
+        if policy:
+            provider.output_policy.record(policy, latency, response)
+        self._record_response(latency, response)
+        return response
+    
+    def _record_response(self, latency: float, response):
+        """Yanıt süresi ve kalite puanının hareketli ortalaması"""
+        metrics = self.performance_metrics
+        realtime = metrics.get("llm_calls", 0) - metrics.get("batch_calls", 0)
+        metrics["response_time_avg"] += _ewma_weight(realtime) * (latency - metrics["response_time_avg"])
+        self._record_quality(response)
+    
+    def _record_batch_response(self, turnaround: float, response):
+        """Toplu iş dönüş süresi - response_time_avg'yi etkilemez"""
+        metrics = self.performance_metrics
+        batch_calls = metrics.get("batch_calls", 0)
+        average = metrics.get("batch_turnaround_avg", 0.0)
+        metrics["batch_turnaround_avg"] = average + _ewma_weight(batch_calls) * (turnaround - average)
+        self._record_quality(response)
+        metrics["batch_calls"] = batch_calls + 1
+    
+    def _record_quality(self, response):
+        metrics = self.performance_metrics
+        calls = metrics.get("llm_calls", 0)
+        metrics["quality_score"] += _ewma_weight(calls) * (score_response(response) - metrics["quality_score"])
+        metrics["llm_calls"] = calls + 1
+    
     async def execute_task(self, task: Task) -> str:
         """Görevi AI ile yürüt"""
+        solution = "Çözümü üret" if self._length_policy_active else "Detaylı bir çözüm üret"
         prompt = f"""
 Görev: {task.title}
 Açıklama: {task.description}
@@ -81,15 +273,12 @@ Açıklama: {task.description}
 Son Tarih: {task.deadline}
 
 Bu görevi senin yeteneklerin ({', '.join(self.skills)}) kullanarak tamamla.
-Detaylı bir çözüm üret ve sonucu açıkla.
+{solution} ve sonucu açıkla.
 """
         
-        messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=prompt)
-        ]
+        messages = _chat_messages(self.system_prompt, prompt)
         
-        response = await self.llm.ainvoke(messages)
+        response = await self._invoke(messages, "task", task.priority)
         result = response.content
         
         logger.info(f"🎯 {self.name} - Görev tamamlandı: {task.title}")
@@ -114,12 +303,9 @@ Departmanın ({self.department}) perspektifinden:
 Kısa ve öz bir katkı hazırla.
 """
         
-        messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=prompt)
-        ]
+        messages = _chat_messages(self.system_prompt, prompt)
         
-        response = await self.llm.ainvoke(messages)
+        response = await self._invoke(messages, "meeting_contribution")
         
         return {
             "agent": self.name,
@@ -127,6 +313,38 @@ Kısa ve öz bir katkı hazırla.
             "contribution": response.content
         }
     
+    async def synthesize_meeting_contributions(
+        self,
+        meeting_info: Dict,
+        participants: List[BaseAgent]
+    ) -> Dict[str, str]:
+        """Tüm katılımcıların katkılarını tek yapılandırılmış çağrıda üret"""
+        meeting_type = meeting_info.get("type", "general")
+        agenda = meeting_info.get("agenda", [])
+        role_cards = "\n".join(f"- {agent.role_card()}" for agent in participants)
+        
+        prompt = f"""
+Toplantı Türü: {meeting_type}
+Gündem: {', '.join(agenda)}
+
+Katılımcılar (ad | rol | departman | yetenekler):
+{role_cards}
+
+Her katılımcı için, kendi rolü ve departmanı perspektifinden kısa bir katkı yaz:
+durum güncellemesi, önemli konular, koordinasyon ihtiyaçları ve öneriler.
+
+Sadece şu JSON formatında cevap ver:
+{{"contributions": [{{"agent": "<ad>", "contribution": "<katkı>"}}]}}
+"""
+        
+        messages = _chat_messages(f"Sen {self.name} ({self.role}) olarak toplantıyı yönetiyorsun. Katılımcıların sesini tarafsızca yansıt.", prompt)
+        
+        response = await self._invoke(messages, "meeting_synthesis")
+        contributions = _parse_contributions(response.content)
+        
+        names = {agent.name for agent in participants}
+        return {name: text for name, text in contributions.items() if name in names}
+    
     async def make_decision(self, context: str, options: List[str]) -> Dict:
         """Karar ver"""
         prompt = f"""
@@ -151,12 +369,9 @@ JSON formatında cevap ver:
 }}
 """
         
-        messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=prompt)
-        ]
+        messages = _chat_messages(self.system_prompt, prompt)
         
-        response = await self.llm.ainvoke(messages)
+        response = await self._invoke(messages, "decision")
         
         return {
             "agent": self.name,
@@ -177,12 +392,9 @@ Karşı tarafın rolü: {other_agent}
 3. İş birliği planı öner
 """
         
-        messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=prompt)
-        ]
+        messages = _chat_messages(self.system_prompt, prompt)
         
-        response = await self.llm.ainvoke(messages)
+        response = await self._invoke(messages, "collaboration")
         return response.content
 
 
@@ -217,12 +429,9 @@ Takım Üyeleri: {', '.join(self.team_members)}
 4. Önümüzdeki dönem için hedefler belirle
 """
         
-        messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=prompt)
-        ]
+        messages = _chat_messages(self.system_prompt, prompt)
         
-        response = await self.llm.ainvoke(messages)
+        response = await self._invoke(messages, "team_review")
         
         return {
             "manager": self.name,
@@ -245,12 +454,9 @@ Sprint için:
 4. Başarı metriklerini tanımla
 """
         
-        messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=prompt)
-        ]
+        messages = _chat_messages(self.system_prompt, prompt)
         
-        response = await self.llm.ainvoke(messages)
+        response = await self._invoke(messages, "sprint_planning")
         
         return {
             "sprint_planner": self.name,
@@ -283,12 +489,9 @@ C-level perspektiften:
 5. Riskleri ve fırsatları belirt
 """
         
-        messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=prompt)
-        ]
+        messages = _chat_messages(self.system_prompt, prompt)
         
-        response = await self.llm.ainvoke(messages)
+        response = await self._invoke(messages, "strategic_decision")
         
         return {
             "executive": self.name,
@@ -307,12 +510,9 @@ C-level perspektiften:
 5. Gelecek çeyrek stratejisi
 """
         
-        messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=prompt)
-        ]
+        messages = _chat_messages(self.system_prompt, prompt)
         
-        response = await self.llm.ainvoke(messages)
+        response = await self._invoke(messages, "quarterly_review")
         
         return {
             "executive": self.name,
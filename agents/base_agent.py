@@ -1,11 +1,14 @@
 """
 Base Agent Class - Tüm AI çalışanların temel sınıfı
 """
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable
 from datetime import datetime
 from pydantic import BaseModel, Field
 import asyncio
 from abc import ABC, abstractmethod
+from utils.ids import new_id
+from utils.clock import get_clock
+from agents.mailbox import Mailbox, OverflowPolicy
 
 
 
@@ -21,10 +24,11 @@ class Task(BaseModel):
     department: str
     priority: str = "medium"  # low, medium, high, critical
     status: str = "pending"  # pending, in_progress, completed, blocked
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=lambda: get_clock().now())
     deadline: Optional[datetime] = None
     dependencies: List[str] = []
     result: Optional[str] = None
+    goal_id: Optional[str] = None  # bağlı yaprak hedef
     
 
 class Message(BaseModel):
@@ -34,7 +38,7 @@ class Message(BaseModel):
     to_agent: str
     subject: str
     content: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=lambda: get_clock().now())
     read: bool = False
 
 
@@ -51,6 +55,8 @@ class AgentMemory(BaseModel):
 class BaseAgent(ABC):
     """Tüm AI ajanların temel sınıfı"""
     
+    DEFAULT_MAILBOX_CAPACITY = 100
+    
     def __init__(
         self,
         name: str,
@@ -58,7 +64,9 @@ class BaseAgent(ABC):
         department: str,
         skills: List[str],
         manager: Optional[str] = None,
-        llm_config: Optional[Dict] = None
+        llm_config: Optional[Dict] = None,
+        mailbox_capacity: int = DEFAULT_MAILBOX_CAPACITY,
+        mailbox_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
     ):
         self.name = name
         self.role = role
@@ -76,11 +84,73 @@ class BaseAgent(ABC):
             "response_time_avg": 0.0,
             "quality_score": 0.0
         }
+        # Görev tamamlandığında çağrılır (örn: görev yöneticisi / hedef ilerlemesi)
+        self.completion_callbacks: List[Callable[[Task], None]] = []
+        self.configure_mailbox(mailbox_capacity, mailbox_policy)
+        # Kanal/toplu mesaj kaynağı (okunanları döndür, bekleyen sayısı)
+        self._message_feed: Optional[tuple] = None
+    
+    def configure_mailbox(
+        self,
+        capacity: int = DEFAULT_MAILBOX_CAPACITY,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        block_timeout: Optional[float] = 5.0
+    ):
+        """Mesaj ve görev kutularının sınırını ve taşma politikasını ayarla"""
+        self.inbox = Mailbox(
+            capacity=capacity,
+            policy=policy,
+            coalesce_key=lambda m: (m.from_agent, m.subject),
+            block_timeout=block_timeout
+        )
+        self.task_inbox = Mailbox(
+            capacity=capacity,
+            policy=policy,
+            coalesce_key=lambda t: t.id,
+            block_timeout=block_timeout,
+            on_evict=self._drop_task,
+            # Yürütülmekte olan görev kutu dolsa da iptal edilmez
+            evictable=lambda t: t.status != "in_progress"
+        )
+    
+    def _drop_task(self, task: Task):
+        """Kutudan atılan görevi aktif listeden çıkar"""
+        task.status = "cancelled"
+        if task in self.memory.tasks_active:
+            self.memory.tasks_active.remove(task)
+        logger.warning(f"⚠️ {self.name} - Görev kutusu dolu, görev atıldı: {task.title}")
+    
+    def attach_message_feed(self, poll: Callable[[], List["Message"]], pending: Callable[[], int]):
+        """Mesaj bus'ından okuma kaynağını bağla - çalışma döngüsü kutuyla birlikte okur"""
+        self._message_feed = (poll, pending)
+    
+    def fetch_messages(self) -> List["Message"]:
+        """Kutudaki direkt mesajlar ve bus'taki kanal/toplu mesajlar"""
+        messages = self.inbox.drain()
+        if self._message_feed:
+            messages.extend(self._message_feed[0]())
+        return messages
+    
+    @property
+    def unread_count(self) -> int:
+        pending = self._message_feed[1]() if self._message_feed else 0
+        return self.inbox.depth + pending
+    
+    def get_mailbox_metrics(self) -> Dict:
+        """Kutu derinliği ve atılma metrikleri"""
+        return {
+            "messages": self.inbox.get_metrics(),
+            "tasks": self.task_inbox.get_metrics()
+        }
     
     async def receive_task(self, task: Task) -> bool:
         """Görev al"""
         if task.assigned_to == self.name:
-            self.memory.tasks_active.append(task)
+            if not await self.task_inbox.put(task):
+                logger.warning(f"⚠️ {self.name} - Görev kutusu dolu, görev reddedildi: {task.title}")
+                return False
+            if task not in self.memory.tasks_active:
+                self.memory.tasks_active.append(task)
             logger.info(f"✅ {self.name} ({self.role}) - Yeni görev alındı: {task.title}")
             return True
         return False
@@ -93,15 +163,18 @@ class BaseAgent(ABC):
                 task.result = result
                 self.memory.tasks_completed.append(task)
                 self.memory.tasks_active.remove(task)
+                self.task_inbox.remove(lambda t: t.id == task_id)
                 self.performance_metrics["tasks_completed"] += 1
                 logger.info(f"✅ {self.name} - Görev tamamlandı: {task.title}")
+                for callback in self.completion_callbacks:
+                    callback(task)
                 return True
         return False
     
     async def send_message(self, to_agent: str, subject: str, content: str) -> Message:
         """Mesaj gönder"""
         message = Message(
-            id=f"msg_{datetime.now().timestamp()}",
+            id=new_id("msg"),
             from_agent=self.name,
             to_agent=to_agent,
             subject=subject,
@@ -113,7 +186,15 @@ class BaseAgent(ABC):
     async def receive_message(self, message: Message) -> bool:
         """Mesaj al"""
         if message.to_agent == self.name:
-            self.memory.messages_received.append(message)
+            if not await self.inbox.put(message):
+                logger.warning(f"⚠️ {self.name} - Mesaj kutusu dolu, mesaj reddedildi: {message.subject}")
+                return False
+            
+            # Geçmiş, kutu kapasitesinin iki katını aşınca kırpılır
+            history = self.memory.messages_received
+            history.append(message)
+            if len(history) > 2 * self.inbox.capacity:
+                del history[:-self.inbox.capacity]
             logger.info(f"📨 {self.name} - Yeni mesaj: {message.subject} (from: {message.from_agent})")
             return True
         return False
@@ -124,6 +205,23 @@ class BaseAgent(ABC):
         contribution = await self.generate_meeting_contribution(meeting_info)
         return contribution
     
+    def role_card(self) -> str:
+        """Toplu istemler için tek satırlık sıkıştırılmış rol kartı"""
+        skills = ', '.join(self.skills[:3]) or '-'
+        return f"{self.name} | {self.role} | {self.department} | {skills}"
+    
+    async def synthesize_meeting_contributions(
+        self,
+        meeting_info: Dict,
+        participants: List["BaseAgent"]
+    ) -> Dict[str, str]:
+        """Tüm katılımcıların katkılarını tek çağrıda üret (agent adı -> katkı)
+        
+        Varsayılan implementasyon sentez yapmaz; boş sözlük dönen katılımcılar
+        için toplantı sistemi tek tek katkı ister.
+        """
+        return {}
+    
     @abstractmethod
     async def execute_task(self, task: Task) -> str:
         """Görevi yürüt - Her agent kendi implementasyonunu yapar"""
@@ -136,9 +234,10 @@ class BaseAgent(ABC):
     
     async def daily_standup_update(self) -> Dict:
         """Günlük standup güncellesi"""
+        now = get_clock().now()
         yesterday_tasks = [
             t for t in self.memory.tasks_completed 
-            if (datetime.now() - t.created_at).days < 1
+            if (now - t.created_at).days < 1
         ]
         
         return {
@@ -162,7 +261,8 @@ class BaseAgent(ABC):
             "current_task": self.current_task.title if self.current_task else None,
             "active_tasks": len(self.memory.tasks_active),
             "completed_tasks": len(self.memory.tasks_completed),
-            "unread_messages": len([m for m in self.memory.messages_received if not m.read]),
+            "unread_messages": self.unread_count,
+            "mailbox": self.get_mailbox_metrics(),
             "performance": self.performance_metrics
         }
     
@@ -175,24 +275,32 @@ class BaseAgent(ABC):
     async def work_cycle(self):
         """Sürekli çalışma döngüsü"""
         while self.is_active:
-            # Aktif görevleri kontrol et
-            if self.memory.tasks_active:
-                for task in self.memory.tasks_active:
-                    if task.status == "pending":
-                        task.status = "in_progress"
-                        self.current_task = task
+            # Görev kutusundaki bekleyen görevleri sırayla yürüt - kutunun anlık
+            # kopyası üzerinde gezilir, yürütme sırasında atılan görevler atlanır
+            for task in self.task_inbox.peek():
+                if task.status == "pending":
+                    task.status = "in_progress"
+                    self.current_task = task
+                    try:
                         result = await self.execute_task(task)
+                    except Exception as e:
+                        # Yürütülen görevler kutudan atılmaz; başarısız görev kapasiteyi tutmasın
+                        task.status = "blocked"
+                        self.task_inbox.remove(lambda t, task_id=task.id: t.id == task_id)
+                        self.performance_metrics["tasks_failed"] += 1
+                        logger.error(f"❌ {self.name} - Görev başarısız: {task.title} ({e})")
+                    else:
                         await self.complete_task(task.id, result)
+                    finally:
                         self.current_task = None
             
             # Mesajları kontrol et
-            unread = [m for m in self.memory.messages_received if not m.read]
-            for msg in unread:
+            for msg in self.fetch_messages():
                 await self.process_message(msg)
                 msg.read = True
             
             # Kısa bekleme
-            await asyncio.sleep(5)
+            await get_clock().sleep(5)
     
     async def process_message(self, message: Message):
         """Mesajı işle"""
@@ -1,11 +1,14 @@
 """
 Agent Factory - YAML config'den ajanları oluştur
 """
-import yaml
 import logging
-from typing import Dict, List
+import time
+from typing import Dict, Iterable, List, Optional
 from agents.ai_agent import AIAgent, ManagerAgent, ExecutiveAgent
+from agents.mailbox import OverflowPolicy
+from agents.org_loader import AgentKind, AgentSpec, iter_org_specs
 from systems.ai_provider import get_ai_provider, AIProvider
+from utils.config_service import MailboxConfig, get_config_service
 
 logger = logging.getLogger(__name__)
 
@@ -13,149 +16,89 @@ logger = logging.getLogger(__name__)
 class AgentFactory:
     """YAML config'den AI ajanları oluşturur"""
     
-    def __init__(self, config_path: str = "config/company_config.yaml"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f)
+    _AGENT_CLASSES = {
+        AgentKind.EXECUTIVE: ExecutiveAgent,
+        AgentKind.MANAGER: ManagerAgent,
+        AgentKind.MEMBER: AIAgent
+    }
+    
+    def __init__(
+        self,
+        config_path: str = "config/company_config.yaml",
+        ai_provider_manager: Optional[AIProvider] = None,
+        config: Optional[Dict] = None
+    ):
+        # Şirket config'i zaten yüklediyse tekrar okunmaz
+        self.config = config if config is not None else get_config_service().load_company(config_path)
         
+        # None ise ajanlar ilk LLM ihtiyacında paylaşılan provider'ı alır
+        self.ai_provider_manager = ai_provider_manager
         self.agents: Dict[str, AIAgent] = {}
         self.departments: Dict[str, List[AIAgent]] = {}
+        self.startup_metrics: Dict[str, float] = {}
     
     def create_all_agents(self) -> Dict[str, AIAgent]:
-        """Tüm ajanları oluştur"""
-        departments_config = self.config.get('departments', {})
-        
-        # Technology Department
-        tech_dept = departments_config.get('technology', {})
-        self._create_tech_agents(tech_dept)
-        
-        # Marketing Department
-        marketing_dept = departments_config.get('marketing', {})
-        self._create_department_agents('marketing', marketing_dept)
-        
-        # Business Development
-        bizdev_dept = departments_config.get('business_development', {})
-        self._create_department_agents('business_development', bizdev_dept)
-        
-        # Finance
-        finance_dept = departments_config.get('finance', {})
-        self._create_department_agents('finance', finance_dept)
+        """Config'deki tüm departmanların ajanlarını oluştur"""
+        return self.create_agents(iter_org_specs(self.config.get('departments', {})))
+    
+    def create_agents(self, specs: Iterable[AgentSpec]) -> Dict[str, AIAgent]:
+        """
+        Ajan tanımlarından hafif ajanlar oluştur - LLM client'ları ilk kullanımda kurulur
         
-        # HR
-        hr_dept = departments_config.get('human_resources', {})
-        self._create_department_agents('human_resources', hr_dept)
+        Tanımlar akış halinde tüketilir; yöneticilere kendi takımlarındaki
+        çalışanlar akış bittikten sonra atanır.
+        """
+        started = time.perf_counter()
+        # (departman, takım) -> (yöneticiler, çalışan adları)
+        teams: Dict[tuple, tuple] = {}
         
-        # Customer Service
-        cs_dept = departments_config.get('customer_service', {})
-        self._create_department_agents('customer_service', cs_dept)
+        for spec in specs:
+            agent = self._AGENT_CLASSES[spec.kind](
+                name=spec.name,
+                role=spec.role,
+                department=spec.department,
+                skills=spec.skills,
+                ai_provider_manager=self.ai_provider_manager
+            )
+            self.agents[spec.name] = agent
+            self.departments.setdefault(spec.group, []).append(agent)
+            
+            managers, members = teams.setdefault((spec.group, spec.team), ([], []))
+            if spec.kind == AgentKind.MANAGER:
+                managers.append(agent)
+            elif spec.kind == AgentKind.MEMBER:
+                members.append(spec.name)
         
-        # Management
-        mgmt_dept = departments_config.get('management', {})
-        self._create_management_agents(mgmt_dept)
+        for managers, members in teams.values():
+            for manager in managers:
+                manager.team_members = list(members)
         
-        # Legal
-        legal_dept = departments_config.get('legal', {})
-        self._create_department_agents('legal', legal_dept)
+        self._configure_mailboxes()
         
-        logger.info(f"✅ Toplam {len(self.agents)} AI çalışan oluşturuldu")
+        elapsed = time.perf_counter() - started
+        self.startup_metrics = {"agents": len(self.agents), "seconds": elapsed}
+        logger.info(f"✅ Toplam {len(self.agents)} AI çalışan oluşturuldu ({elapsed * 1000:.1f} ms)")
         return self.agents
     
-    def _create_tech_agents(self, tech_config: Dict):
-        """Teknoloji departmanı ajanlarını oluştur"""
-        teams = tech_config.get('teams', {})
-        
-        for team_name, members in teams.items():
-            for member in members:
-                agent = AIAgent(
-                    name=member['name'],
-                    role=member['role'],
-                    department=f"Technology/{team_name}",
-                    skills=member['skills'],
-                    ai_provider_manager=self.ai_provider_manager
-                )
-                self.agents[member['name']] = agent
-                
-                dept_key = 'technology'
-                if dept_key not in self.departments:
-                    self.departments[dept_key] = []
-                self.departments[dept_key].append(agent)
-    
-    def _create_department_agents(self, dept_name: str, dept_config: Dict):
-        """Genel departman ajanlarını oluştur"""
-        team = dept_config.get('team', [])
-        manager_name = dept_config.get('manager')
-        
-        team_members = []
-        
-        for member in team:
-            # Manager ise ManagerAgent, değilse AIAgent oluştur
-            if 'Manager' in member['role'] or 'Director' in member['role'] or member['role'] == 'CFO':
-                agent = ManagerAgent(
-                    name=member['name'],
-                    role=member['role'],
-                    department=dept_name,
-                    skills=member['skills'],
-                    team_members=[],  # Sonra doldurulacak
-                    ai_provider_manager=self.ai_provider_manager
-                )
-            else:
-                agent = AIAgent(
-                    name=member['name'],
-                    role=member['role'],
-                    department=dept_name,
-                    skills=member['skills'],
-                    ai_provider_manager=self.ai_provider_manager
-                )
-                team_members.append(member['name'])
-            
-            self.agents[member['name']] = agent
-            
-            if dept_name not in self.departments:
-                self.departments[dept_name] = []
-            self.departments[dept_name].append(agent)
-        
-        # Manager'a takım üyelerini ata
-        for member in team:
-            if 'Manager' in member['role'] or 'Director' in member['role']:
-                if isinstance(self.agents[member['name']], ManagerAgent):
-                    self.agents[member['name']].team_members = team_members
+    def get_materialization_stats(self) -> Dict[str, int]:
+        """LLM client'ı kurulmuş ajan sayısı"""
+        materialized = sum(1 for a in self.agents.values() if getattr(a, 'is_materialized', False))
+        return {"agents": len(self.agents), "materialized": materialized}
     
-    def _create_management_agents(self, mgmt_config: Dict):
-        """Yönetim kadrosu ajanlarını oluştur"""
-        team = mgmt_config.get('team', [])
+    def _configure_mailboxes(self):
+        """Config'deki kutu sınırlarını tüm ajanlara uygula"""
+        mailbox_config = self.config.get('runtime', {}).get('mailbox')
+        if not mailbox_config:
+            return
         
-        for member in team:
-            # CEO ve C-level için ExecutiveAgent
-            if member['role'] in ['CEO', 'CTO', 'CFO', 'CMO', 'COO']:
-                agent = ExecutiveAgent(
-                    name=member['name'],
-                    role=member['role'],
-                    department='management',
-                    skills=member['skills'],
-                    ai_provider_manager=self.ai_provider_manager
-                )
-            # Project Manager vb için ManagerAgent
-            elif 'Manager' in member['role']:
-                agent = ManagerAgent(
-                    name=member['name'],
-                    role=member['role'],
-                    department='management',
-                    skills=member['skills'],
-                    ai_provider_manager=self.ai_provider_manager
-                )
-            else:
-                agent = AIAgent(
-                    name=member['name'],
-                    role=member['role'],
-                    department='management',
-                    skills=member['skills'],
-                    ai_provider_manager=self.ai_provider_manager
-                )
-            
-            self.agents[member['name']] = agent
-            
-            if 'management' not in self.departments:
-                self.departments['management'] = []
-            self.departments['management'].append(agent)
+        # Varsayılanlar şemadan gelir
+        settings = MailboxConfig.model_validate(mailbox_config)
+        for agent in self.agents.values():
+            agent.configure_mailbox(
+                capacity=settings.capacity,
+                policy=OverflowPolicy(settings.policy),
+                block_timeout=settings.block_timeout
+            )
     
     def get_agent(self, name: str) -> AIAgent:
         """İsme göre ajan al"""
@@ -0,0 +1,182 @@
+"""
+Mailbox - Agent başına sınırlı gelen kutusu ve geri basınç politikaları
+"""
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from collections import OrderedDict, deque
+from enum import Enum
+import asyncio
+import itertools
+
+from utils.clock import get_clock
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """Kutu dolduğunda uygulanacak politika"""
+    BLOCK = "block"              # Gönderen yer açılana kadar bekler
+    DROP_OLDEST = "drop_oldest"  # En eski kayıt atılır
+    COALESCE = "coalesce"        # Aynı anahtarlı kayıt güncellenir, yoksa en eski atılır
+
+
+class Mailbox:
+    """Sınırlı, politika destekli FIFO kutu"""
+
+    def __init__(
+        self,
+        capacity: int = 100,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        coalesce_key: Optional[Callable[[Any], Hashable]] = None,
+        block_timeout: Optional[float] = 5.0,
+        on_evict: Optional[Callable[[Any], None]] = None,
+        evictable: Optional[Callable[[Any], bool]] = None
+    ):
+        if capacity < 1:
+            raise ValueError("Mailbox kapasitesi en az 1 olmalı")
+
+        self.capacity = capacity
+        self.policy = OverflowPolicy(policy)
+        self.coalesce_key = coalesce_key
+        self.block_timeout = block_timeout
+        self.on_evict = on_evict  # atılan/birleştirilen kayıtlar için geri çağrı
+        # False dönen kayıtlar (ör. yürütülen görev) atılmaz ve birleştirilmez
+        self.evictable = evictable or (lambda item: True)
+
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._seq = itertools.count()
+        self._space_waiters: deque = deque()  # BLOCK politikasında bekleyen gönderenler
+        self.metrics: Dict[str, int] = {
+            "enqueued": 0,
+            "delivered": 0,
+            "dropped": 0,
+            "coalesced": 0,
+            "blocked": 0,
+            "max_depth": 0
+        }
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def depth(self) -> int:
+        return len(self._items)
+
+    def _key_for(self, item: Any) -> Hashable:
+        if self.policy == OverflowPolicy.COALESCE and self.coalesce_key:
+            return ("key", self.coalesce_key(item))
+        return ("seq", next(self._seq))
+
+    def _insert(self, key: Hashable, item: Any):
+        self._items[key] = item
+        self.metrics["enqueued"] += 1
+        self.metrics["max_depth"] = max(self.metrics["max_depth"], len(self._items))
+
+    def _notify_space(self, count: int = 1):
+        """Yer açıldığında bekleyen gönderenleri uyandır"""
+        while count > 0 and self._space_waiters:
+            waiter = self._space_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
+    def _evicted(self, item: Any):
+        if self.on_evict:
+            self.on_evict(item)
+
+    async def put(self, item: Any) -> bool:
+        """Kayıt ekle - kabul edilmezse False döner"""
+        key = self._key_for(item)
+
+        # Aynı anahtarlı kayıt bekliyorsa yerinde güncelle
+        if key in self._items:
+            existing = self._items[key]
+            if existing is item:
+                return True
+            if self.evictable(existing):
+                self._evicted(existing)
+                self._items[key] = item
+                self.metrics["coalesced"] += 1
+                return True
+            key = ("seq", next(self._seq))
+
+        if len(self._items) < self.capacity:
+            self._insert(key, item)
+            return True
+
+        if self.policy == OverflowPolicy.BLOCK:
+            self.metrics["blocked"] += 1
+            loop = asyncio.get_running_loop()
+            clock = get_clock()
+            deadline = None if self.block_timeout is None else clock.timestamp() + self.block_timeout
+
+            while len(self._items) >= self.capacity:
+                remaining = None if deadline is None else deadline - clock.timestamp()
+                if remaining is not None and remaining <= 0:
+                    self.metrics["dropped"] += 1
+                    return False
+
+                waiter = loop.create_future()
+                self._space_waiters.append(waiter)
+                try:
+                    await clock.wait_for(waiter, remaining)
+                except asyncio.TimeoutError:
+                    self.metrics["dropped"] += 1
+                    return False
+
+            self._insert(key, item)
+            return True
+
+        # DROP_OLDEST ve COALESCE: atılabilir en eski kaydı at
+        victim = next((k for k, existing in self._items.items() if self.evictable(existing)), None)
+        if victim is None:
+            self.metrics["dropped"] += 1
+            return False
+        oldest = self._items.pop(victim)
+        self.metrics["dropped"] += 1
+        self._evicted(oldest)
+        self._insert(key, item)
+        return True
+
+    def get_nowait(self) -> Optional[Any]:
+        """En eski kaydı al (yoksa None)"""
+        if not self._items:
+            return None
+        _, item = self._items.popitem(last=False)
+        self.metrics["delivered"] += 1
+        self._notify_space()
+        return item
+
+    def drain(self, limit: Optional[int] = None) -> List[Any]:
+        """Bekleyen kayıtları sırayla al"""
+        items = []
+        while self._items and (limit is None or len(items) < limit):
+            _, item = self._items.popitem(last=False)
+            items.append(item)
+        self.metrics["delivered"] += len(items)
+        if items:
+            self._notify_space(len(items))
+        return items
+
+    def remove(self, predicate: Callable[[Any], bool]) -> bool:
+        """Koşula uyan ilk kaydı kutudan çıkar"""
+        for key, item in self._items.items():
+            if predicate(item):
+                del self._items[key]
+                self._notify_space()
+                return True
+        return False
+
+    def peek(self) -> List[Any]:
+        """Bekleyen kayıtları çıkarmadan al"""
+        return list(self._items.values())
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Kutu metrikleri"""
+        return {
+            "depth": len(self._items),
+            "capacity": self.capacity,
+            "policy": self.policy.value,
+            **self.metrics
+        }
@@ -0,0 +1,156 @@
+"""
+Org Loader - Departman/takım ağacından ajan tanımları üreten genel yükleyici
+
+Config'deki departmanlar isimlerine bakılmadan aynı kurallarla gezilir: bir
+departman ya düz bir `team` listesi ya da takım adı -> üye listesi olan
+`teams` sözlüğü taşır. Her üye için bir AgentSpec üretilir; ajan tipi
+(yönetici, üst yönetici, çalışan) üyenin `kind` alanından ya da rol adından
+belirlenir.
+
+Tanımlar generator olarak akar - 100k ajanlık sentetik bir şirket bile
+bellekte ikinci bir kopya tutulmadan fabrikaya beslenebilir.
+"""
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from enum import Enum
+import random
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class AgentKind(str, Enum):
+    """Ajan tipi"""
+    EXECUTIVE = "executive"
+    MANAGER = "manager"
+    MEMBER = "member"
+
+
+# Üst yönetim departmanında ExecutiveAgent olan unvanlar
+EXECUTIVE_ROLES = {"CEO", "CTO", "CFO", "CMO", "COO"}
+MANAGER_KEYWORDS = ("Manager", "Director")
+EXECUTIVE_DEPARTMENT = "management"
+
+
+@dataclass
+class AgentSpec:
+    """Oluşturulacak bir ajanın tanımı"""
+    name: str
+    role: str
+    department: str                  # ajanın görünen departmanı (ör. Technology/web_development)
+    group: str                       # company.departments anahtarı (ör. technology)
+    skills: List[str] = field(default_factory=list)
+    kind: AgentKind = AgentKind.MEMBER
+    team: Optional[str] = None
+
+
+def classify_role(role: str, executive_department: bool = False) -> AgentKind:
+    """Rol adından ajan tipi"""
+    if executive_department and role in EXECUTIVE_ROLES:
+        return AgentKind.EXECUTIVE
+    if role in EXECUTIVE_ROLES or any(keyword in role for keyword in MANAGER_KEYWORDS):
+        return AgentKind.MANAGER
+    return AgentKind.MEMBER
+
+
+def _member_spec(member: Dict, department: str, group: str, team: Optional[str],
+                 executive_department: bool) -> AgentSpec:
+    kind = member.get("kind")
+    return AgentSpec(
+        name=member["name"],
+        role=member["role"],
+        department=department,
+        group=group,
+        skills=list(member.get("skills", [])),
+        kind=AgentKind(kind) if kind else classify_role(member["role"], executive_department),
+        team=team
+    )
+
+
+def iter_org_specs(departments_config: Dict) -> Iterator[AgentSpec]:
+    """Config'deki departman ağacını gez ve ajan tanımlarını sırayla üret"""
+    for group, dept_config in departments_config.items():
+        dept_config = dept_config or {}
+        executive_department = dept_config.get("executive", group == EXECUTIVE_DEPARTMENT)
+
+        for member in dept_config.get("team", []):
+            yield _member_spec(member, group, group, None, executive_department)
+
+        for team, members in dept_config.get("teams", {}).items():
+            department = f"{group.title()}/{team}"
+            for member in members:
+                yield _member_spec(member, department, group, team, executive_department)
+
+
+# Sentetik şirketlerde varsayılan rol karışımı: rol -> (ağırlık, yetenekler)
+DEFAULT_ROLE_MIX: Dict[str, Tuple[float, List[str]]] = {
+    "Software Engineer": (0.40, ["python", "apis", "testing"]),
+    "Senior Engineer": (0.15, ["architecture", "code-review", "mentoring"]),
+    "Designer": (0.10, ["figma", "prototyping", "user-research"]),
+    "Data Analyst": (0.10, ["sql", "statistics", "visualization"]),
+    "Content Writer": (0.10, ["copywriting", "documentation", "seo"]),
+    "Support Agent": (0.15, ["customer-support", "communication", "triage"])
+}
+
+
+def generate_synthetic_org(
+    departments: int = 10,
+    teams_per_department: int = 5,
+    team_size: Union[int, Tuple[int, int]] = 10,
+    role_mix: Optional[Dict[str, Tuple[float, List[str]]]] = None,
+    managers_per_team: int = 1,
+    with_executives: bool = True,
+    seed: int = 0
+) -> Iterator[AgentSpec]:
+    """
+    Sentetik bir şirketin ajan tanımlarını akıt
+
+    team_size sabit bir sayı ya da (min, max) aralığıdır ve yöneticiler dahil
+    takım başına kişi sayısını verir. Aynı seed aynı şirketi üretir.
+    """
+    rng = random.Random(seed)
+    role_mix = role_mix or DEFAULT_ROLE_MIX
+    roles = list(role_mix)
+    weights = [role_mix[role][0] for role in roles]
+
+    if with_executives:
+        for role in sorted(EXECUTIVE_ROLES):
+            yield AgentSpec(
+                name=f"{role} 0",
+                role=role,
+                department=EXECUTIVE_DEPARTMENT,
+                group=EXECUTIVE_DEPARTMENT,
+                skills=["leadership", "strategy", "vision"],
+                kind=AgentKind.EXECUTIVE
+            )
+
+    for d in range(departments):
+        group = f"department_{d}"
+        for t in range(teams_per_department):
+            team = f"team_{t}"
+            department = f"{group}/{team}"
+            size = team_size if isinstance(team_size, int) else rng.randint(*team_size)
+
+            for m in range(min(managers_per_team, size)):
+                yield AgentSpec(
+                    name=f"Manager {d}-{t}-{m}",
+                    role="Team Manager",
+                    department=department,
+                    group=group,
+                    skills=["leadership", "planning", "delegation"],
+                    kind=AgentKind.MANAGER,
+                    team=team
+                )
+
+            members = max(size - managers_per_team, 0)
+            for i, role in enumerate(rng.choices(roles, weights=weights, k=members)):
+                yield AgentSpec(
+                    name=f"Agent {d}-{t}-{i}",
+                    role=role,
+                    department=department,
+                    group=group,
+                    skills=list(role_mix[role][1]),
+                    kind=AgentKind.MEMBER,
+                    team=team
+                )
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import asyncio
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 import sys
@@ -21,6 +22,7 @@ sys.path.insert(0, str(ROOT_DIR))
 from core.company import AutonomousCompany
 from systems.ai_provider import get_ai_provider, AIProvider
 from systems.auto_config import get_auto_configurator
+from utils.config_helper import Config
 
 # FastAPI uygulaması
 app = FastAPI(
@@ -92,9 +94,9 @@ def get_company_status():
     return {
         "status": "running" if company_running else "idle",
         "total_agents": len(company.agents),
-        "departments": len(set(a.department for a in company.agents)),
+        "departments": len(set(a.department for a in company.agents.values())),
         "total_goals": len(company.goal_manager.goals),
-        "completed_goals": len([g for g in company.goal_manager.goals if g.status == 'completed'])
+        "completed_goals": len(company.goal_manager.completed_goals)
     }
 
 # API Endpoints
@@ -126,23 +128,38 @@ async def get_status():
 async def configure_api_keys(config: APIKeyConfig):
     """API anahtarlarını yapılandır"""
     try:
-        env_file = ROOT_DIR / '.env'
+        updates = {
+            name: value
+            for name, value in (
+                ("OPENAI_API_KEY", config.openai_key),
+                ("ANTHROPIC_API_KEY", config.anthropic_key),
+                ("GOOGLE_API_KEY", config.google_key)
+            )
+            if value
+        }
+        try:
+            Config.update_env_file(ROOT_DIR / '.env', updates)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
-        with open(env_file, 'w') as f:
-            if config.openai_key:
-                f.write(f"OPENAI_API_KEY={config.openai_key}\n")
-            if config.anthropic_key:
-                f.write(f"ANTHROPIC_API_KEY={config.anthropic_key}\n")
-            if config.google_key:
-                f.write(f"GOOGLE_API_KEY={config.google_key}\n")
+        # Yeniden başlatmadan uygula - ajanlar bir sonraki çağrılarında yeni havuza geçer
+        os.environ.update(updates)
+        provider = get_ai_provider()
+        provider.reload()
         
         await broadcast_update({
             "type": "config_updated",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat(),
+            "generation": provider.generation
         })
         
-        return {"message": "API anahtarları başarıyla kaydedildi"}
+        return {
+            "message": "API anahtarları kaydedildi ve uygulandı",
+            "generation": provider.generation
+        }
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -164,7 +181,7 @@ async def start_company(background_tasks: BackgroundTasks):
         )
         
         # Initialize
-        company.initialize()
+        await company.initialize()
         company_running = True
         
         await broadcast_update({
@@ -176,7 +193,7 @@ async def start_company(background_tasks: BackgroundTasks):
         return {
             "message": "Şirket başarıyla başlatıldı",
             "agents": len(company.agents),
-            "departments": len(set(a.department for a in company.agents)),
+            "departments": len(set(a.department for a in company.agents.values())),
             "goals": len(company.goal_manager.goals)
         }
     
@@ -209,7 +226,7 @@ async def get_agents(department: Optional[str] = None):
     if not company:
         raise HTTPException(status_code=400, detail="Şirket başlatılmamış")
     
-    agents = company.agents
+    agents = list(company.agents.values())
     
     if department:
         agents = [a for a in agents if a.department == department]
@@ -236,7 +253,7 @@ async def get_agent_details(agent_name: str):
     if not company:
         raise HTTPException(status_code=400, detail="Şirket başlatılmamış")
     
-    agent = next((a for a in company.agents if a.name == agent_name), None)
+    agent = company.agents.get(agent_name)
     
     if not agent:
         raise HTTPException(status_code=404, detail="Çalışan bulunamadı")
@@ -275,7 +292,7 @@ async def get_tasks(status: Optional[str] = None):
         raise HTTPException(status_code=400, detail="Şirket başlatılmamış")
     
     all_tasks = []
-    for agent in company.agents:
+    for agent in company.agents.values():
         for task in agent.memory.completed_tasks:
             all_tasks.append({
                 "agent": agent.name,
@@ -302,12 +319,12 @@ async def create_task(task: TaskCreate):
     
     # Görev oluştur ve ata
     if task.agent_name:
-        agent = next((a for a in company.agents if a.name == task.agent_name), None)
+        agent = company.agents.get(task.agent_name)
         if not agent:
             raise HTTPException(status_code=404, detail="Çalışan bulunamadı")
     else:
         # Rastgele bir çalışana ata
-        agent = company.agents[0]
+        agent = next(iter(company.agents.values()))
     
     from agents.base_agent import Task
     
@@ -339,12 +356,13 @@ async def get_goals():
     if not company:
         raise HTTPException(status_code=400, detail="Şirket başlatılmamış")
     
-    goals = company.goal_manager.goals
+    goals = company.goal_manager.find_goals()
     
     return {
         "total": len(goals),
         "goals": [
             {
+                "id": goal.id,
                 "title": goal.title,
                 "description": goal.description,
                 "department": goal.department,
@@ -364,17 +382,17 @@ async def add_goal(goal: Goal):
     if not company:
         raise HTTPException(status_code=400, detail="Şirket başlatılmamış")
     
-    from systems.goals import Goal as GoalModel
+    from systems.goals import GoalPeriod
     
-    new_goal = GoalModel(
+    new_goal = company.goal_manager.set_department_goal(
+        department=goal.department,
         title=goal.title,
         description=goal.description,
-        department=goal.department,
-        priority=goal.priority,
-        metrics=goal.metrics or {}
+        period=GoalPeriod.MONTHLY,
+        owner=goal.department,
+        metrics=goal.metrics,
+        priority=goal.priority
     )
-    
-    company.goal_manager.goals.append(new_goal)
     company.goal_manager.save_goals()
     
     await broadcast_update({
@@ -385,7 +403,8 @@ async def add_goal(goal: Goal):
     
     return {
         "message": "Hedef eklendi",
-        "goal": goal.title
+        "goal": goal.title,
+        "id": new_goal.id
     }
 
 @app.get("/api/meetings")
@@ -394,19 +413,23 @@ async def get_meetings():
     if not company:
         raise HTTPException(status_code=400, detail="Şirket başlatılmamış")
     
-    meetings = company.meeting_system.meetings
+    store = company.meeting_system.store
+    meetings = store.history(limit=50)
     
     return {
-        "total": len(meetings),
+        "total": store.completed_count,
         "meetings": [
             {
+                "id": meeting.id,
                 "title": meeting.title,
                 "type": meeting.type,
-                "date": meeting.date.isoformat(),
+                "department": meeting.department,
+                "date": meeting.scheduled_time.isoformat(),
                 "participants": meeting.participants,
-                "notes": meeting.notes,
+                "notes": getattr(meeting, "notes", []),
                 "decisions": meeting.decisions,
-                "action_items": meeting.action_items
+                "action_items": meeting.action_items,
+                "compacted": getattr(meeting, "compacted", False)
             }
             for meeting in meetings
         ]
@@ -458,7 +481,7 @@ async def get_departments():
         raise HTTPException(status_code=400, detail="Şirket başlatılmamış")
     
     departments = {}
-    for agent in company.agents:
+    for agent in company.agents.values():
         dept = agent.department
         if dept not in departments:
             departments[dept] = {
@@ -516,12 +539,12 @@ async def get_statistics():
     
     # Departman dağılımı
     dept_distribution = {}
-    for agent in company.agents:
+    for agent in company.agents.values():
         dept_distribution[agent.department] = dept_distribution.get(agent.department, 0) + 1
     
     # Görev istatistikleri
     all_tasks = []
-    for agent in company.agents:
+    for agent in company.agents.values():
         all_tasks.extend(agent.memory.completed_tasks)
     
     task_stats = {
@@ -532,11 +555,23 @@ async def get_statistics():
     
     # AI kullanımı
     ai_usage = {}
-    for agent in company.agents:
+    for agent in company.agents.values():
         if hasattr(agent, 'assigned_ai'):
-            model = agent.assigned_ai.get('model', 'Unknown')
+            model = agent.assigned_ai or 'Unknown'
             ai_usage[model] = ai_usage.get(model, 0) + 1
     
+    # Çağrı başına yönlendirme ve kaskad metrikleri
+    provider = get_ai_provider()
+    llm_routing = {}
+    if provider.task_routing_enabled:
+        llm_routing["task_routing"] = provider.task_router.get_stats()
+    if provider.cascade_enabled:
+        llm_routing["cascade"] = provider.cascade.get_stats()
+    if provider.batch_enabled:
+        llm_routing["batch"] = provider.batch_executor.get_stats()
+    if provider.output_policy_enabled:
+        llm_routing["output_policy"] = provider.output_policy.get_stats()
+    
     return {
         "total_agents": len(company.agents),
         "total_departments": len(dept_distribution),
@@ -544,9 +579,10 @@ async def get_statistics():
         "task_statistics": task_stats,
         "total_tasks": len(all_tasks),
         "ai_usage": ai_usage,
+        "llm_routing": llm_routing,
         "total_goals": len(company.goal_manager.goals),
-        "completed_goals": len([g for g in company.goal_manager.goals if g.status == 'completed']),
-        "total_meetings": len(company.meeting_system.meetings)
+        "completed_goals": len(company.goal_manager.completed_goals),
+        "total_meetings": company.meeting_system.store.completed_count
     }
 
 # Health check
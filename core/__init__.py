@@ -1,4 +1,19 @@
 """Core package"""
-from .company import AutonomousCompany
+# Alt modüller ilk erişimde yüklenir - `import core` tüm alt sistemleri çekmez
+import importlib
 
-__all__ = ['AutonomousCompany']
+_EXPORTS = {
+    'AutonomousCompany': '.company',
+    'PacingPolicy': '.pacing',
+    'SimulationEngine': '.simulation'
+}
+
+__all__ = ['AutonomousCompany', 'PacingPolicy', 'SimulationEngine']
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
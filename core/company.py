@@ -1,10 +1,9 @@
 """
 Company Core - Ana şirket sınıfı ve yönetimi
 """
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import asyncio
-import yaml
 
 from agents.factory import AgentFactory
 from agents.ai_agent import AIAgent, ManagerAgent, ExecutiveAgent
@@ -14,41 +13,80 @@ import logging
 logger = logging.getLogger(__name__)
 # Lazy import circular dependency önlemek için
 from systems.meeting import MeetingSystem
-from systems.task import TaskManager, TaskPriority
+from systems.task import TaskManager, TaskPriority, TaskStatus
 from systems.messaging import MessagingSystem, CollaborationSystem
 from systems.goals import GoalManager
+from core.pacing import PacingPolicy
+from core.simulation import SimulationEngine
+from utils.clock import get_clock, set_clock, VirtualClock
+from utils.config_service import get_config_service
+from systems.ai_provider import get_ai_provider
 
 
 class AutonomousCompany:
     """Otonom AI Şirketi - Ana sınıf"""
     
-    def __init__(self, config_path: str = "config/company_config.yaml"):
+    def __init__(
+        self,
+        config_path: str = "config/company_config.yaml",
+        pacing: Optional[PacingPolicy] = None
+    ):
         logger.info("🏢 Otonom AI Şirketi başlatılıyor...\n")
         
-        # Config yükle
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f)
+        # Config yükle - doğrulanmış ve tüm alt sistemlerce paylaşılan tek kopya
+        self.config = get_config_service().load_company(config_path)
         
         self.company_name = self.config['company']['name']
         self.vision = self.config['company']['vision']
         self.mission = self.config['company']['mission']
+        self.pacing = pacing or PacingPolicy.from_config(self.config)
+        
+        # Simülasyon saati - sanal saatte günler anında ilerler
+        if self.config.get('runtime', {}).get('clock') == 'virtual':
+            set_clock(VirtualClock())
         
         # Sistemleri başlat
-        self.agent_factory = AgentFactory(config_path)
+        self.agent_factory = AgentFactory(config_path, config=self.config)
         self.agents: Dict[str, AIAgent] = {}
         self.departments: Dict[str, List[AIAgent]] = {}
         
-        self.meeting_system = MeetingSystem()
+        self.meeting_system = MeetingSystem.from_config(self.config)
         self.task_manager = TaskManager()
         self.messaging_system = MessagingSystem()
         self.collaboration_system = CollaborationSystem(self.messaging_system)
-        self.goal_manager = GoalManager()
+        self.goal_manager = GoalManager(
+            catalog_path=self.config.get('runtime', {}).get('goals', {}).get('catalog_path')
+        )
+        
+        # Hedefli görevler oluşturulunca bağlanır, tamamlanınca hedef ağacı güncellenir
+        self.task_manager.subscribe("created", self.goal_manager.on_task_created)
+        self.task_manager.subscribe("completed", self.goal_manager.on_task_completed)
         
         self.is_running = False
         self.start_time = None
         
         logger.info(f"✅ {self.company_name} hazır!\n")
     
+    def _plan_models(self):
+        """runtime.models.daily_budget verilmişse tüm org için bütçe planı kur"""
+        models_config = self.config.get('runtime', {}).get('models') or {}
+        if models_config.get('daily_budget') is None:
+            return
+        
+        # Ajanlar henüz LLM'e bağlanmadı - ilk kullanımda plandaki modeli alırlar
+        provider = self.agent_factory.ai_provider_manager or get_ai_provider()
+        demands = provider.role_demands(
+            (agent.role for agent in self.agents.values()),
+            calls_per_agent=models_config.get('calls_per_agent', 40),
+            tokens_per_call=models_config.get('tokens_per_call', 1500),
+            max_latency=models_config.get('max_latency')
+        )
+        provider.plan_models(
+            demands,
+            daily_budget=models_config['daily_budget'],
+            rate_limits=models_config.get('rate_limits')
+        )
+    
     async def initialize(self):
         """Şirketi başlat ve ajanları oluştur"""
         logger.info("🚀 Şirket başlatılıyor...\n")
@@ -56,10 +94,12 @@ class AutonomousCompany:
         # Ajanları oluştur
         self.agents = self.agent_factory.create_all_agents()
         self.departments = self.agent_factory.departments
+        self._plan_models()
         
-        # Mesajlaşma sistemine kaydet
+        # Mesajlaşma sistemine kaydet, tamamlanan görevleri görev yöneticisine bildir
         for agent in self.agents.values():
             self.messaging_system.register_agent(agent)
+            agent.completion_callbacks.append(self._on_task_completed)
         
         # Departman kanallarını oluştur
         self.messaging_system.create_department_channels(self.departments)
@@ -77,40 +117,63 @@ class AutonomousCompany:
         logger.info(f"   • Departman Sayısı: {len(self.departments)}")
         logger.info(f"   • Yönetici Sayısı: {len(self.agent_factory.get_managers())}")
         logger.info(f"   • Üst Yönetim: {len(self.agent_factory.get_executives())}")
+        logger.info(f"   • Başlatma Süresi: {self.agent_factory.startup_metrics.get('seconds', 0.0) * 1000:.1f} ms")
         logger.info(f"{'='*60}\n")
         
         self.is_running = True
-        self.start_time = datetime.now()
+        self.start_time = get_clock().now()
     
-    async def morning_standup(self):
-        """Sabah standup toplantıları - Her departman için"""
+    def _on_task_completed(self, task):
+        """Agent tarafında tamamlanan görevi görev yöneticisine işle"""
+        self.task_manager.update_task_status(task.id, TaskStatus.COMPLETED)
+    
+    async def morning_standup(self, scheduled_time: Optional[datetime] = None):
+        """Sabah standup toplantıları - Departmanlar eşzamanlı toplanır"""
         logger.info("\n☀️  SABAH STANDUP TOPLANTILARI BAŞLIYOR\n")
         
-        for dept_name, dept_agents in self.departments.items():
-            if len(dept_agents) > 0:
-                # Departman yöneticisini bul
-                facilitator = dept_agents[0]  # İlk agent veya manager
-                for agent in dept_agents:
-                    if isinstance(agent, ManagerAgent):
-                        facilitator = agent
-                        break
-                
-                # Toplantı planla ve yürüt
-                meeting = await self.meeting_system.schedule_daily_standup(
-                    department=dept_name,
-                    participants=dept_agents,
-                    facilitator=facilitator,
-                    scheduled_time=datetime.now()
-                )
-                
-                await self.meeting_system.conduct_daily_standup(
-                    meeting=meeting,
-                    agents=dept_agents
-                )
-                
-                await asyncio.sleep(2)  # Toplantılar arası bekleme
+        departments = [
+            (dept_name, dept_agents)
+            for dept_name, dept_agents in self.departments.items()
+            if len(dept_agents) > 0
+        ]
+        
+        await asyncio.gather(*(
+            self._department_standup(dept_name, dept_agents, slot, scheduled_time)
+            for slot, (dept_name, dept_agents) in enumerate(departments)
+        ))
+    
+    async def _department_standup(
+        self,
+        dept_name: str,
+        dept_agents: List[AIAgent],
+        slot: int = 0,
+        scheduled_time: Optional[datetime] = None
+    ):
+        """Tek departmanın standup toplantısı"""
+        # Pacing tanımlıysa toplantılar sırayla kaydırılarak başlar
+        await self.pacing.pause("between_meetings", multiplier=slot)
+        
+        # Departman yöneticisini bul
+        facilitator = dept_agents[0]  # İlk agent veya manager
+        for agent in dept_agents:
+            if isinstance(agent, ManagerAgent):
+                facilitator = agent
+                break
+        
+        # Toplantı planla ve yürüt
+        meeting = await self.meeting_system.schedule_daily_standup(
+            department=dept_name,
+            participants=dept_agents,
+            facilitator=facilitator,
+            scheduled_time=scheduled_time or get_clock().now()
+        )
+        
+        await self.meeting_system.conduct_daily_standup(
+            meeting=meeting,
+            agents=dept_agents
+        )
     
-    async def weekly_review(self):
+    async def weekly_review(self, scheduled_time: Optional[datetime] = None):
         """Haftalık değerlendirme toplantıları"""
         logger.info("\n📊 HAFTALIK DEĞERLENDİRME TOPLANTILARI\n")
         
@@ -123,7 +186,7 @@ class AutonomousCompany:
                 department="All Departments",
                 participants=managers,
                 facilitator=facilitator,
-                scheduled_time=datetime.now()
+                scheduled_time=scheduled_time or get_clock().now()
             )
             
             await self.meeting_system.conduct_weekly_review(
@@ -131,7 +194,7 @@ class AutonomousCompany:
                 agents=managers
             )
     
-    async def monthly_planning(self):
+    async def monthly_planning(self, scheduled_time: Optional[datetime] = None):
         """Aylık planlama toplantısı"""
         logger.info("\n📈 AYLIK PLANLAMA TOPLANTISI\n")
         
@@ -146,7 +209,7 @@ class AutonomousCompany:
             meeting = await self.meeting_system.schedule_monthly_planning(
                 participants=participants,
                 facilitator=facilitator,
-                scheduled_time=datetime.now()
+                scheduled_time=scheduled_time or get_clock().now()
             )
             
             await self.meeting_system.conduct_monthly_planning(
@@ -176,19 +239,20 @@ class AutonomousCompany:
                         available_agents=team_members[:3]  # İlk 3 üye
                     )
     
-    async def simulate_work_day(self):
+    async def simulate_work_day(self, standup: bool = True, standup_time: Optional[datetime] = None):
         """Bir iş gününü simüle et"""
         logger.info("\n🌅 YENİ İŞ GÜNÜ BAŞLIYOR\n")
         
         # 1. Sabah standup
-        await self.morning_standup()
+        if standup:
+            await self.morning_standup(standup_time)
         
         # 2. Görev dağıtımı
         await self.assign_tasks_to_departments()
         
         # 3. Görevleri çalıştır (simüle)
         logger.info("\n⚙️  ÇALIŞANLAR GÖREVLERİNİ YÜRÜTÜYOR...\n")
-        await asyncio.sleep(5)
+        await self.pacing.pause("work_execution")
         
         # 4. Departmanlar arası iş birliği örneği
         tech_agents = self.departments.get('technology', [])
@@ -210,26 +274,54 @@ class AutonomousCompany:
         
         await self.initialize()
         
+        # Tekrarlayan toplantılar takvimden çekilir
+        start = get_clock().now()
+        day_zero = datetime.combine(start.date(), datetime.min.time())
+        self.meeting_system.calendar.load_recurring(self.config.get('meetings', {}), day_zero)
+        
+        # Her gün simülasyon motorunda bir olay olarak planlanır
+        engine = SimulationEngine()
         for day in range(days):
-            logger.info(f"\n{'='*60}")
-            logger.info(f"📅 GÜN {day + 1}")
-            logger.info(f"{'='*60}\n")
-            
-            # Günlük işler
-            await self.simulate_work_day()
-            
-            # Haftalık kontrol (7 günde bir)
-            if (day + 1) % 7 == 0:
-                await self.weekly_review()
-            
-            # Aylık kontrol (30 günde bir)
-            if (day + 1) % 30 == 0:
-                await self.monthly_planning()
-            
-            # Gece molası simülasyonu
-            if day < days - 1:
-                logger.info("\n🌙 Gece vardiyası devam ediyor... (7/24 çalışma)\n")
-                await asyncio.sleep(3)
+            engine.schedule_at(
+                start + timedelta(days=day),
+                lambda day=day: self._run_day(day, days, day_zero + timedelta(days=day)),
+                name=f"day_{day + 1}"
+            )
+        
+        await engine.run()
+        self.goal_manager.save_goals()
+    
+    async def _run_day(self, day: int, days: int, day_start: Optional[datetime] = None):
+        """Tek bir simülasyon günü - o gün vakti gelen toplantılar takvimden alınır"""
+        logger.info(f"\n{'='*60}")
+        logger.info(f"📅 GÜN {day + 1}")
+        logger.info(f"{'='*60}\n")
+        
+        day_start = day_start or datetime.combine(get_clock().now().date(), datetime.min.time())
+        due = self.meeting_system.calendar.pop_due(day_start + timedelta(days=1))
+        standups = [o for o in due if o.kind == "daily_standup"]
+        
+        # Günlük işler
+        await self.simulate_work_day(
+            standup=bool(standups),
+            standup_time=standups[0].scheduled_time if standups else None
+        )
+        
+        # Haftalık ve aylık toplantılar
+        for occurrence in due:
+            if occurrence.kind == "weekly_review":
+                await self.weekly_review(occurrence.scheduled_time)
+            elif occurrence.kind == "monthly_planning":
+                await self.monthly_planning(occurrence.scheduled_time)
+        
+        # Gün sonu bakımı - eski transcript'leri ve geçmiş takvim aralıklarını temizle
+        self.meeting_system.compact_transcripts(before=day_start)
+        self.goal_manager.save_goals()
+        
+        # Gece molası simülasyonu
+        if day < days - 1:
+            logger.info("\n🌙 Gece vardiyası devam ediyor... (7/24 çalışma)\n")
+            await self.pacing.pause("between_days")
     
     async def quick_demo(self):
         """Hızlı demo - Tüm özellikleri göster"""
@@ -245,11 +337,11 @@ class AutonomousCompany:
                 department="Technology",
                 participants=tech_agents,
                 facilitator=tech_agents[0],
-                scheduled_time=datetime.now()
+                scheduled_time=get_clock().now()
             )
             await self.meeting_system.conduct_daily_standup(meeting, tech_agents)
         
-        await asyncio.sleep(2)
+        await self.pacing.pause("demo_step")
         
         # 2. Görev atama
         logger.info("\n2️⃣  Görev Atama Örneği\n")
@@ -260,7 +352,7 @@ class AutonomousCompany:
             if team:
                 await self.task_manager.auto_assign_tasks(manager, team)
         
-        await asyncio.sleep(2)
+        await self.pacing.pause("demo_step")
         
         # 3. Departmanlar arası iş birliği
         logger.info("\n3️⃣  Departmanlar Arası İş Birliği\n")
@@ -270,7 +362,7 @@ class AutonomousCompany:
             agents=self.agents
         )
         
-        await asyncio.sleep(2)
+        await self.pacing.pause("demo_step")
         
         # 4. Rapor
         logger.info("\n4️⃣  Görev Raporu\n")
@@ -286,7 +378,7 @@ class AutonomousCompany:
         logger.info(f"{'='*60}\n")
         
         logger.info(f"🏢 Şirket: {self.company_name}")
-        logger.info(f"⏱️  Çalışma Süresi: {datetime.now() - self.start_time if self.start_time else 'N/A'}")
+        logger.info(f"⏱️  Çalışma Süresi: {get_clock().now() - self.start_time if self.start_time else 'N/A'}")
         logger.info(f"👥 Toplam Çalışan: {len(self.agents)}")
         
         logger.info(f"\n📋 Görev Durumu:")
@@ -297,7 +389,7 @@ class AutonomousCompany:
         logger.info(f"   • Tamamlanma: %{stats['completion_rate']:.1f}")
         
         logger.info(f"\n📅 Toplantılar:")
-        logger.info(f"   • Geçmiş Toplantı: {len(self.meeting_system.meeting_history)}")
+        logger.info(f"   • Geçmiş Toplantı: {self.meeting_system.store.completed_count}")
         logger.info(f"   • Planlanan: {len(self.meeting_system.get_upcoming_meetings())}")
         
         logger.info(f"\n{'='*60}\n")
@@ -317,4 +409,7 @@ class AutonomousCompany:
         # Final rapor
         await self.print_company_status()
         
+        # Bekleyen hedef değişiklikleri kataloğa yazılır
+        self.goal_manager.save_goals()
+        
         logger.info("✅ Şirket başarıyla kapatıldı.\n")
@@ -0,0 +1,34 @@
+"""
+Pacing Policy - Simülasyon adımları arasındaki bekleme süreleri
+"""
+from dataclasses import dataclass, fields
+from typing import Dict, Optional
+
+from utils.clock import get_clock
+
+
+@dataclass
+class PacingPolicy:
+    """Simülasyon adımları arası bekleme süreleri (saniye) - üretimde hepsi 0"""
+    between_meetings: float = 0.0   # departman toplantılarının başlangıç aralığı
+    work_execution: float = 0.0     # görev yürütme simülasyonu
+    between_days: float = 0.0       # sürekli çalışma modunda günler arası
+    demo_step: float = 0.0          # hızlı demo adımları arası
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict]) -> "PacingPolicy":
+        """Config'deki runtime.pacing bölümünden oluştur"""
+        pacing = (config or {}).get('runtime', {}).get('pacing', {}) or {}
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: float(v) for k, v in pacing.items() if k in known})
+
+    @classmethod
+    def demo(cls) -> "PacingPolicy":
+        """İnsan tarafından izlenen demolar için eski sabit beklemeler"""
+        return cls(between_meetings=2.0, work_execution=5.0, between_days=3.0, demo_step=2.0)
+
+    async def pause(self, step: str, multiplier: float = 1.0):
+        """Adım için tanımlı süre kadar bekle (0 ise hemen döner)"""
+        seconds = getattr(self, step) * multiplier
+        if seconds > 0:
+            await get_clock().sleep(seconds)
@@ -0,0 +1,79 @@
+"""
+Simulation Engine - Heap kuyruklu discrete-event simülasyon motoru
+"""
+from typing import Any, Callable, List, Optional, Tuple
+from datetime import datetime, timedelta
+import heapq
+import inspect
+import itertools
+
+from utils.clock import Clock, get_clock
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+EventAction = Callable[[], Any]
+
+
+class SimulationEngine:
+    """Zamanlanmış olayları sırayla çalıştıran motor
+
+    Sanal saatte olaylar arasındaki süre anında atlanır. Duvar saatinde
+    olaylar varsayılan olarak beklemeden, sırayla çalışır; realtime=True
+    verilirse olay zamanına kadar gerçekten beklenir.
+    """
+
+    def __init__(self, clock: Optional[Clock] = None, realtime: bool = False):
+        self.clock = clock or get_clock()
+        self.realtime = realtime
+        self._queue: List[Tuple[datetime, int, str, EventAction]] = []
+        self._seq = itertools.count()
+        self.processed_events = 0
+
+    def schedule_at(self, when: datetime, action: EventAction, name: str = "") -> None:
+        """Olayı belirli bir zamana planla"""
+        heapq.heappush(self._queue, (when, next(self._seq), name, action))
+
+    def schedule_in(self, delay: timedelta, action: EventAction, name: str = "") -> None:
+        """Olayı şimdiden belirli süre sonraya planla"""
+        self.schedule_at(self.clock.now() + delay, action, name)
+
+    def peek_time(self) -> Optional[datetime]:
+        """Sıradaki olayın zamanı"""
+        return self._queue[0][0] if self._queue else None
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    async def _wait_until(self, when: datetime):
+        if self.clock.is_virtual:
+            self.clock.advance_to(when)
+        elif self.realtime:
+            delay = (when - self.clock.now()).total_seconds()
+            if delay > 0:
+                await self.clock.sleep(delay)
+
+    async def run(self, until: Optional[datetime] = None, max_events: Optional[int] = None) -> int:
+        """Kuyruk boşalana (veya until/max_events sınırına) kadar olayları çalıştır"""
+        processed = 0
+        while self._queue:
+            if max_events is not None and processed >= max_events:
+                break
+            if until is not None and self._queue[0][0] > until:
+                break
+
+            when, _, name, action = heapq.heappop(self._queue)
+            await self._wait_until(when)
+
+            logger.debug(f"⏱️  Olay: {name or action} @ {when}")
+            result = action()
+            if inspect.isawaitable(result):
+                await result
+
+            processed += 1
+            self.processed_events += 1
+
+        if until is not None and self.clock.is_virtual:
+            self.clock.advance_to(until)
+        return processed
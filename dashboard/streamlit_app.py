@@ -301,7 +301,7 @@ def main():
             with col2:
                 active_tasks = sum(
                     len([t for t in agent.memory.completed_tasks if t.status == 'in_progress'])
-                    for agent in st.session_state.company.agents
+                    for agent in st.session_state.company.agents.values()
                 )
                 st.metric("📋 Aktif Görevler", active_tasks)
             
@@ -309,10 +309,7 @@ def main():
                 st.metric("🎯 Hedefler", len(st.session_state.company.goal_manager.goals))
             
             with col4:
-                completed_goals = len([
-                    g for g in st.session_state.company.goal_manager.goals
-                    if g.status == 'completed'
-                ])
+                completed_goals = len(st.session_state.company.goal_manager.completed_goals)
                 st.metric("✅ Tamamlanan", completed_goals)
             
             st.markdown("---")
@@ -322,7 +319,7 @@ def main():
             
             dept_cols = st.columns(4)
             departments = {}
-            for agent in st.session_state.company.agents:
+            for agent in st.session_state.company.agents.values():
                 dept = agent.department
                 if dept not in departments:
                     departments[dept] = []
@@ -366,7 +363,7 @@ def main():
                 search = st.text_input("🔍 Çalışan Ara", "")
             
             # Çalışan listesi
-            filtered_agents = st.session_state.company.agents
+            filtered_agents = list(st.session_state.company.agents.values())
             
             if dept_filter != "Tümü":
                 filtered_agents = [a for a in filtered_agents if a.department == dept_filter]
@@ -390,8 +387,7 @@ def main():
                         
                         # AI Assignment
                         if hasattr(agent, 'assigned_ai'):
-                            ai_info = agent.assigned_ai
-                            st.info(f"🤖 AI: {ai_info.get('model', 'N/A')}")
+                            st.info(f"🤖 AI: {agent.assigned_ai or 'N/A'}")
                         
                         # Stats
                         completed = len(agent.memory.completed_tasks)
@@ -405,7 +401,7 @@ def main():
             
             # Task istatistikleri
             all_tasks = []
-            for agent in st.session_state.company.agents:
+            for agent in st.session_state.company.agents.values():
                 all_tasks.extend(agent.memory.completed_tasks)
             
             col1, col2, col3 = st.columns(3)
@@ -447,7 +443,7 @@ def main():
         with tabs[3]:
             st.header("🎯 Şirket Hedefleri")
             
-            goals = st.session_state.company.goal_manager.goals
+            goals = st.session_state.company.goal_manager.find_goals()
             
             if goals:
                 for goal in goals:
@@ -472,15 +468,15 @@ def main():
             st.header("💬 Toplantı Kayıtları")
             
             if hasattr(st.session_state.company, 'meeting_system'):
-                meetings = st.session_state.company.meeting_system.meetings
+                meetings = st.session_state.company.meeting_system.get_meeting_history(limit=10)
                 
                 if meetings:
-                    for meeting in reversed(meetings[-10:]):
-                        with st.expander(f"📅 {meeting.title} - {meeting.date.strftime('%d/%m/%Y')}"):
+                    for meeting in reversed(meetings):
+                        with st.expander(f"📅 {meeting.title} - {meeting.scheduled_time.strftime('%d/%m/%Y')}"):
                             st.write(f"**Tip:** {meeting.type}")
                             st.write(f"**Katılımcılar:** {len(meeting.participants)} kişi")
                             
-                            if meeting.notes:
+                            if getattr(meeting, 'notes', None):
                                 st.write("**Notlar:**")
                                 for note in meeting.notes[:5]:
                                     st.write(f"- {note}")
@@ -525,9 +521,9 @@ def main():
             st.subheader("🤖 AI Sağlayıcı Dağılımı")
             
             ai_usage = {}
-            for agent in st.session_state.company.agents:
+            for agent in st.session_state.company.agents.values():
                 if hasattr(agent, 'assigned_ai'):
-                    model = agent.assigned_ai.get('model', 'Unknown')
+                    model = agent.assigned_ai or 'Unknown'
                     ai_usage[model] = ai_usage.get(model, 0) + 1
             
             if ai_usage:
@@ -56,7 +56,7 @@ async def main():
                     agents=agents[:5]
                 )
                 
-                await asyncio.sleep(1)
+                await company.pacing.pause("between_meetings")
     
     elif meeting_type == "weekly-review":
         await company.weekly_review()
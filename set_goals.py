@@ -112,7 +112,8 @@ async def main():
             owner=owner
         )
     
-    # Raporu göster
+    # Hedefleri kataloğa kaydet ve raporu göster
+    company.goal_manager.save_goals()
     print(company.goal_manager.get_goal_report())
     
     # CEO'ya hedefleri sun
@@ -68,7 +68,7 @@ async def main():
         dept_idx = int(input("\nSeçim: ")) - 1
         dept_name = list(company.departments.keys())[dept_idx]
         
-        goals = company.goal_manager.get_department_goals(dept_name)
+        goals = company.goal_manager.find_goals(department=dept_name)
         
         logger.info(f"\n🏢 {dept_name.upper()} HEDEFLERİ:\n")
         for goal in goals:
@@ -95,6 +95,7 @@ async def main():
             new_progress,
             notes
         )
+        company.goal_manager.save_goals()
 
 
 if __name__ == "__main__":
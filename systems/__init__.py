@@ -1,19 +1,53 @@
 """Systems package"""
 # Circular import önlemek için lazy import kullan
-# Her modül direkt import edilerek kullanılmalı
+# Alt modüller ilk erişimde yüklenir - `import systems` hiçbirini çekmez
+import importlib
 
-__all__ = [
-    'MeetingSystem',
-    'Meeting',
-    'MeetingAgenda',
-    'TaskManager',
-    'TaskPriority',
-    'TaskStatus',
-    'MessagingSystem',
-    'CollaborationSystem',
-    'Channel',
-    'GoalManager',
-    'GoalPeriod',
-    'GoalStatus',
-    'Goal'
-]
+_EXPORTS = {
+    'MeetingSystem': '.meeting',
+    'Meeting': '.meeting',
+    'MeetingAgenda': '.meeting',
+    'MeetingMode': '.meeting',
+    'MeetingStore': '.meeting_store',
+    'MeetingDigest': '.meeting_store',
+    'CalendarEngine': '.calendar_engine',
+    'RecurrenceRule': '.calendar_engine',
+    'SchedulingConflict': '.calendar_engine',
+    'TaskManager': '.task',
+    'TaskPriority': '.task',
+    'TaskStatus': '.task',
+    'MessagingSystem': '.messaging',
+    'CollaborationSystem': '.messaging',
+    'Collaboration': '.messaging',
+    'CollaborationStatus': '.messaging',
+    'Channel': '.messaging',
+    'MessageBus': '.message_bus',
+    'TopicLog': '.message_bus',
+    'GoalManager': '.goals',
+    'GoalPeriod': '.goals',
+    'GoalStatus': '.goals',
+    'Goal': '.goals',
+    'GoalCatalog': '.goal_catalog',
+    'ModelPlanner': '.model_planner',
+    'ModelPlan': '.model_planner',
+    'RoleDemand': '.model_planner',
+    'LLMRouter': '.llm_router',
+    'RoutedLLM': '.llm_router',
+    'BanditPolicy': '.llm_router',
+    'SimulatedLLM': '.simulated_provider',
+    'Cassette': '.cassette',
+    'TaskRouter': '.task_router',
+    'Cascade': '.cascade',
+    'BatchExecutor': '.batch',
+    'OutputPolicyEngine': '.output_policy'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
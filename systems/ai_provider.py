@@ -2,11 +2,24 @@
 AI Provider Yöneticisi
 Farklı AI provider'larını (OpenAI, Anthropic, Google) yönetir
 """
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List, TYPE_CHECKING
+from collections import Counter
+from pathlib import Path
 from enum import Enum
 from dataclasses import dataclass
+import asyncio
+import atexit
 import os
 
+if TYPE_CHECKING:
+    from systems.model_planner import ModelPlan
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+PROVIDERS_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "ai_providers_config.yaml"
+
 
 class AITier(str, Enum):
     """AI Model seviyeleri"""
@@ -52,6 +65,35 @@ class AIProvider:
         
         self.providers = self._load_provider_config()
         self.api_keys = self._load_api_keys()
+        
+        # Aynı rol ve model için tekrar hesaplama/oluşturma yapılmaz
+        self._role_assignments: Dict[tuple, RoleAIAssignment] = {}
+        self._clients: Dict[str, object] = {}
+        
+        # Bütçe planı (plan_models ile kurulur, anahtar/bütçe değişince yenilenir)
+        self.model_plan: Optional["ModelPlan"] = None
+        self._plan_inputs: Optional[Dict] = None
+        
+        # Her reload/replan'da artar - ajanlar atamalarını bir sonraki çağrıda yeniler
+        self.generation = 0
+        
+        # Kayıt/oynatma kaseti (LLM_CASSETTE, LLM_CASSETTE_MODE=record|replay)
+        self.cassette = None
+        self.cassette_mode: Optional[str] = None
+        self._cassette_options: Dict = {}
+        if os.getenv('LLM_CASSETTE'):
+            self.use_cassette(
+                os.getenv('LLM_CASSETTE'),
+                os.getenv('LLM_CASSETTE_MODE', 'replay'),
+                reproduce_latency=os.getenv('LLM_CASSETTE_LATENCY', '0') == '1'
+            )
+        
+        # ai_providers_config.yaml multi_ai_strategy bölümü
+        self.strategy = self._load_strategy()
+        self._task_router = None
+        self._cascade = None
+        self._batch_executor = None
+        self._output_policy = None
     
     def _load_provider_config(self) -> Dict:
         """Provider konfigürasyonları"""
@@ -134,6 +176,16 @@ class AIProvider:
             }
         }
     
+    def _load_strategy(self) -> Dict:
+        """Çoklu AI stratejisi (yük dengeleme, kalite izleme)"""
+        from utils.config_service import get_config_service
+        
+        try:
+            config = get_config_service().load_providers(PROVIDERS_CONFIG_PATH)
+        except FileNotFoundError:
+            return {}
+        return config.get('multi_ai_strategy') or {}
+    
     def _load_api_keys(self) -> Dict[str, str]:
         """API anahtarlarını yükle"""
         return {
@@ -167,6 +219,431 @@ class AIProvider:
             reasoning="Demo mode - add API keys for real AI"
         )
     
+    def _estimate_role_difficulty(self, role: str) -> int:
+        """Role'e göre zorluk seviyesi tahmin et"""
+        role_lower = role.lower()
+        
+        # Executive/Leadership roles (9-10)
+        if any(x in role_lower for x in ['ceo', 'cto', 'cfo', 'chief', 'vp', 'director']):
+            return 9
+        
+        # Senior/Lead roles (7-9)
+        if any(x in role_lower for x in ['lead', 'senior', 'architect', 'principal']):
+            return 8
+        
+        # Specialist/Expert roles and managers (6-7)
+        if any(x in role_lower for x in ['scientist', 'researcher', 'specialist', 'manager']):
+            return 7
+        
+        # Developer/Engineer roles (5-7)
+        if any(x in role_lower for x in ['developer', 'engineer', 'programmer']):
+            return 6
+        
+        # Support/Junior roles (3-4)
+        if any(x in role_lower for x in ['support', 'agent', 'assistant', 'junior']):
+            return 3
+        
+        # Designer/Analyst roles ve varsayılan (5)
+        return 5
+    
+    def get_ai_for_role(self, role: str, department: Optional[str] = None) -> RoleAIAssignment:
+        """Role için AI ataması - rol başına bir kez hesaplanır, bütçe planı varsa ondan gelir"""
+        key = (role, department)
+        if key not in self._role_assignments:
+            planned = self.model_plan.get(role) if self.model_plan else None
+            if planned:
+                self._role_assignments[key] = RoleAIAssignment(
+                    role=role,
+                    primary_ai=planned.primary,
+                    fallback_ai=planned.fallback,
+                    tier=AITier(planned.tier),
+                    difficulty_level=planned.difficulty,
+                    reasoning="Budget plan"
+                )
+            else:
+                self._role_assignments[key] = self.assign_ai_to_role(
+                    role, self._estimate_role_difficulty(role)
+                )
+        return self._role_assignments[key]
+    
+    def model_options(self) -> List:
+        """API anahtarı olan provider'ların modelleri ve her zaman erişilebilir demo"""
+        from systems.model_planner import ModelOption, TIER_CAPABILITY, TIER_LATENCY
+        
+        options = []
+        for provider, provider_config in self.providers.items():
+            if provider != 'demo' and not self.api_keys.get(provider):
+                continue
+            for model_name, model_config in provider_config.get('models', {}).items():
+                tier = model_config['tier']
+                options.append(ModelOption(
+                    path=f"{provider}/{model_name}",
+                    tier=tier,
+                    cost_per_1k=model_config['cost'],
+                    capability=TIER_CAPABILITY.get(tier, 1),
+                    latency=model_config.get('latency', TIER_LATENCY.get(tier, 0.0))
+                ))
+        return options
+    
+    def role_demands(
+        self,
+        roles: Iterable[str],
+        calls_per_agent: float = 40.0,
+        tokens_per_call: int = 1500,
+        max_latency: Optional[Dict[str, float]] = None
+    ) -> List:
+        """Ajan rollerinden (her ajan için bir rol) planlama talepleri
+        
+        max_latency: rol -> çağrı başına izin verilen en uzun gecikme (sn)
+        """
+        from systems.model_planner import RoleDemand
+        
+        max_latency = max_latency or {}
+        return [
+            RoleDemand(
+                role=role,
+                difficulty=self._estimate_role_difficulty(role),
+                agents=count,
+                calls_per_agent=calls_per_agent,
+                tokens_per_call=tokens_per_call,
+                max_latency=max_latency.get(role)
+            )
+            for role, count in Counter(roles).items()
+        ]
+    
+    def plan_models(
+        self,
+        demands: List,
+        daily_budget: Optional[float] = None,
+        rate_limits: Optional[Dict[str, float]] = None
+    ) -> "ModelPlan":
+        """Tüm org için bütçe kısıtlı model planı kur - sonraki atamalar plandan gelir"""
+        self._plan_inputs = {
+            "demands": list(demands),
+            "daily_budget": daily_budget,
+            "rate_limits": dict(rate_limits or {})
+        }
+        return self.replan()
+    
+    def replan(self) -> Optional["ModelPlan"]:
+        """Kayıtlı girdilerle ve güncel API anahtarlarıyla planı yeniden çöz"""
+        if self._plan_inputs is None:
+            return None
+        from systems.model_planner import ModelPlanner
+        
+        planner = ModelPlanner(
+            self.model_options(),
+            daily_budget=self._plan_inputs["daily_budget"],
+            rate_limits=self._plan_inputs["rate_limits"]
+        )
+        self.model_plan = planner.plan(self._plan_inputs["demands"])
+        self._role_assignments = {}
+        self.generation += 1
+        return self.model_plan
+    
+    def set_daily_budget(self, daily_budget: Optional[float]) -> Optional["ModelPlan"]:
+        """Günlük bütçeyi değiştir ve yeniden planla"""
+        if self._plan_inputs is None:
+            return None
+        self._plan_inputs["daily_budget"] = daily_budget
+        return self.replan()
+    
+    def reload(self) -> bool:
+        """
+        API anahtarlarını ve provider konfigürasyonunu yeniden yükle
+        
+        Yeni anahtarlar, strateji ve boş bir client havuzu tek adımda yerine
+        konur; devam eden çağrılar ellerindeki eski client'larla biter. Ajanlar
+        değişen nesli bir sonraki LLM çağrılarında fark edip yeniden atanır.
+        Anahtarlar veya strateji değiştiyse True döner.
+        """
+        if self.auto_config:
+            self.auto_config.reload()
+        api_keys = self._load_api_keys()
+        strategy = self._load_strategy()
+        changed = api_keys != self.api_keys or strategy != self.strategy
+        
+        self.api_keys, self.strategy = api_keys, strategy
+        self._clients = {}
+        self._role_assignments = {}
+        self._task_router = None
+        self._cascade = None
+        # Devam eden toplu işler eski yürütücüde tamamlanır
+        self._batch_executor = None
+        self._output_policy = None
+        self.generation += 1
+        if self._plan_inputs is not None:
+            self.replan()
+        
+        available = [p for p, key in api_keys.items() if key] or ['demo']
+        logger.info(f"🔄 AI provider'lar yeniden yüklendi (nesil {self.generation}): {', '.join(available)}")
+        return changed
+    
+    def refresh_api_keys(self) -> bool:
+        """API anahtarlarını ortamdan tekrar oku - değiştiyse yeniden yükle ve planla"""
+        if self._load_api_keys() == self.api_keys:
+            return False
+        return self.reload()
+    
+    def create_llm_client(self, model_path: str):
+        """
+        Model başına paylaşılan LLM client'ı (ilk istekte oluşturulur)
+        
+        Yük dengeleme açıksa ve aynı tier'da anahtarı olan birden fazla model
+        varsa, tier'ın ortak router'ı döner.
+        """
+        model_path = self._resolve_model_path(model_path)
+        if self.cassette_mode == 'replay':
+            return self._replay_client(model_path)
+        
+        pool = self._equivalent_models(model_path)
+        if len(pool) > 1:
+            client = self._create_routed_client(model_path, pool)
+        else:
+            client = self._raw_client(model_path)
+        
+        if self.cassette_mode == 'record':
+            return self._recording_client(model_path, client)
+        return client
+    
+    @property
+    def task_routing_enabled(self) -> bool:
+        return bool((self.strategy.get('task_routing') or {}).get('enabled'))
+    
+    @property
+    def task_router(self):
+        """Çağrı başına tier yönlendiricisi (provider'lar değişince yeniden kurulur)"""
+        if self._task_router is None:
+            from systems.task_router import TaskRouter
+            self._task_router = TaskRouter(self._tier_models())
+        return self._task_router
+    
+    def _tier_models(self) -> Dict[str, str]:
+        """Tier başına kullanılacak model - otomatik konfigürasyon ya da en ucuz anahtarlı model"""
+        if self.auto_mode and self.auto_config and self.auto_config.optimal_config.mode != 'demo':
+            return {
+                tier: assignment['primary']
+                for tier, assignment in self.auto_config.optimal_config.assignments.items()
+            }
+        
+        models: Dict[str, tuple] = {}
+        for provider, provider_config in self.providers.items():
+            if provider == 'demo' or not self.api_keys.get(provider):
+                continue
+            for model_name, model_config in provider_config.get('models', {}).items():
+                tier = model_config['tier']
+                if tier not in models or model_config['cost'] < models[tier][0]:
+                    models[tier] = (model_config['cost'], f"{provider}/{model_name}")
+        return {tier: path for tier, (_, path) in models.items()}
+    
+    def route_call(self, assignment: RoleAIAssignment, difficulty: int) -> str:
+        """Çağrının zorluğuna göre model - rolün modelinden pahalı olamaz"""
+        return self.task_router.route(assignment.primary_ai, assignment.tier.value, difficulty)
+    
+    @property
+    def cascade_enabled(self) -> bool:
+        return bool((self.strategy.get('cascade') or {}).get('enabled'))
+    
+    @property
+    def cascade(self):
+        """Ucuz modelden başlayıp gerekirse yükselten kaskad yürütücüsü"""
+        if self._cascade is None:
+            from systems.cascade import Cascade
+            settings = self.strategy.get('cascade') or {}
+            self._cascade = Cascade(
+                min_confidence=settings.get('min_confidence', 0.6),
+                min_length=settings.get('min_length', 20),
+                model_cost=self.model_cost
+            )
+        return self._cascade
+    
+    def cascade_model(self, assignment: RoleAIAssignment) -> Optional[str]:
+        """Kaskadın ilk denediği model - rol zaten basic tier'daysa None"""
+        from systems.task_router import TIER_RANK
+        if TIER_RANK.get(assignment.tier.value, 0) <= TIER_RANK['basic']:
+            return None
+        model = self._tier_models().get('basic')
+        if not model or self._resolve_model_path(model) == self._resolve_model_path(assignment.primary_ai):
+            return None
+        return model
+    
+    @property
+    def batch_enabled(self) -> bool:
+        return bool((self.strategy.get('batch') or {}).get('enabled'))
+    
+    def is_batch_call(self, kind: str) -> bool:
+        """Çağrı tipi toplu iş moduna uygun mu?"""
+        from systems.batch import BATCH_CALL_KINDS
+        settings = self.strategy.get('batch') or {}
+        return self.batch_enabled and kind in set(settings.get('call_kinds') or BATCH_CALL_KINDS)
+    
+    @property
+    def batch_executor(self):
+        """Gecikmeye duyarsız çağrıları toplu işlerde biriktiren yürütücü"""
+        if self._batch_executor is None:
+            from systems.batch import BatchExecutor, LocalFileBatchBackend
+            settings = self.strategy.get('batch') or {}
+            backend = settings.get('backend', 'local')
+            if backend != 'local':
+                raise ValueError(f"Bilinmeyen batch backend'i: {backend}")
+            
+            # Toplu iş istekleri gerçek zamanlı çağrılarla aynı client yolundan
+            # (kaset, yük dengeleme havuzu, demo) geçer
+            async def respond(model_path, messages, **params):
+                return await self.create_llm_client(model_path).ainvoke(messages, **params)
+            
+            self._batch_executor = BatchExecutor(
+                LocalFileBatchBackend(
+                    settings.get('directory', 'data/batch'),
+                    respond,
+                    completion_delay=settings.get('completion_delay_seconds', 60)
+                ),
+                max_batch_size=settings.get('max_batch_size', 50),
+                flush_interval=settings.get('flush_interval_seconds', 30),
+                poll_interval=settings.get('poll_interval_seconds', 30),
+                discount=settings.get('discount', 0.5),
+                model_cost=self.model_cost
+            )
+        return self._batch_executor
+    
+    def create_batch_client(self, model_path: str):
+        """Çağrıları toplu işe ekleyen client"""
+        from systems.batch import BatchLLM
+        return BatchLLM(self.batch_executor, self._resolve_model_path(model_path))
+    
+    @property
+    def output_policy_enabled(self) -> bool:
+        return bool((self.strategy.get('output_policy') or {}).get('enabled'))
+    
+    @property
+    def output_policy(self):
+        """Çağrı tipine göre max_tokens ve kısalık talimatı"""
+        if self._output_policy is None:
+            from systems.output_policy import OutputPolicyEngine
+            settings = self.strategy.get('output_policy') or {}
+            self._output_policy = OutputPolicyEngine(
+                overrides=settings.get('max_tokens') or {},
+                min_tokens=settings.get('min_tokens', 64)
+            )
+        return self._output_policy
+    
+    def model_cost(self, model_path: str) -> float:
+        """1k token başına maliyet (bilinmeyen model için 0)"""
+        info = self.get_model_info(self._resolve_model_path(model_path))
+        return info.cost if info else 0.0
+    
+    def use_cassette(
+        self,
+        path,
+        mode: str = 'replay',
+        reproduce_latency: bool = False,
+        strict: bool = True
+    ):
+        """
+        Çağrıları kasete kaydet (record) ya da kasetten oynat (replay)
+        
+        Replay modunda hiçbir gerçek client oluşturulmaz. Ajanlar değişikliği
+        bir sonraki LLM çağrılarında alır.
+        """
+        from systems.cassette import Cassette
+        
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Bilinmeyen kaset modu: {mode}")
+        self.close_cassette()
+        self.cassette = Cassette(path)
+        self.cassette_mode = mode
+        self._cassette_options = {'reproduce_latency': reproduce_latency, 'strict': strict}
+        if mode == 'record':
+            atexit.register(self.cassette.flush)
+        self._clients = {}
+        self.generation += 1
+        logger.info(f"📼 Kaset modu: {mode} ({path})")
+    
+    def close_cassette(self):
+        """Kaydı diske yaz ve kaset modunu kapat"""
+        if self.cassette is None:
+            return
+        self.cassette.flush()
+        if self.cassette_mode == 'record':
+            atexit.unregister(self.cassette.flush)
+        self.cassette = None
+        self.cassette_mode = None
+        self._clients = {}
+        self.generation += 1
+    
+    def _replay_client(self, model_path: str):
+        from systems.cassette import ReplayLLM
+        
+        key = f"replay:{model_path}"
+        if key not in self._clients:
+            self._clients[key] = ReplayLLM(model_path, self.cassette, **self._cassette_options)
+        return self._clients[key]
+    
+    def _recording_client(self, model_path: str, client):
+        from systems.cassette import RecordingLLM
+        
+        key = f"record:{model_path}"
+        if key not in self._clients:
+            self._clients[key] = RecordingLLM(client, model_path, self.cassette)
+        return self._clients[key]
+    
+    def _raw_client(self, model_path: str):
+        if model_path not in self._clients:
+            self._clients[model_path] = self.create_client(model_path)
+        return self._clients[model_path]
+    
+    def _equivalent_models(self, model_path: str) -> List[str]:
+        """Yük dengelemeye katılacak aynı tier'daki modeller (anahtarı olan provider'lar)"""
+        load_balancing = self.strategy.get('load_balancing') or {}
+        model = self.get_model_info(model_path)
+        if not load_balancing.get('enabled') or model is None or model.tier == AITier.DEMO:
+            return [model_path]
+        
+        pool = [
+            f"{provider}/{model_name}"
+            for provider, provider_config in self.providers.items()
+            if provider != 'demo' and self.api_keys.get(provider)
+            for model_name, model_config in provider_config.get('models', {}).items()
+            if model_config['tier'] == model.tier.value
+        ]
+        return pool if model_path in pool else [model_path]
+    
+    def _create_routed_client(self, model_path: str, pool: List[str]):
+        """Tier başına tek router - tüm ajanlar aynı havuzu ve sağlık durumunu paylaşır"""
+        from systems.llm_router import Backend, LLMRouter, RoutedLLM, load_quality_scorer
+        
+        key = "pool:" + ",".join(sorted(pool))
+        if key not in self._clients:
+            load_balancing = self.strategy.get('load_balancing') or {}
+            limits = load_balancing.get('requests_per_minute') or {}
+            backends = [
+                Backend(path, self._raw_client(path), limits.get(path.split('/')[0]))
+                for path in pool
+            ]
+            quality = self.strategy.get('quality_monitoring') or {}
+            auto_switch = quality.get('enabled') and quality.get('auto_switch_on_poor_performance')
+            router = LLMRouter.from_strategy(
+                backends,
+                load_balancing.get('strategy', 'round-robin'),
+                failure_threshold=load_balancing.get('failure_threshold', 3),
+                cooldown=load_balancing.get('cooldown_seconds', 30.0),
+                quality_scorer=load_quality_scorer(quality.get('scorer')),
+                min_quality_score=quality.get('min_quality_score') if auto_switch else None,
+                min_quality_samples=quality.get('min_samples', 10)
+            )
+            self._clients[key] = RoutedLLM(router)
+            logger.info(f"🔀 Yük dengeleme havuzu: {', '.join(pool)}")
+        return self._clients[key]
+    
+    def _resolve_model_path(self, model: str) -> str:
+        """Provider öneki olmayan model adını 'provider/model' biçimine çevir"""
+        if '/' in model:
+            return model
+        for provider, provider_config in self.providers.items():
+            if model in provider_config.get('models', {}):
+                return f"{provider}/{model}"
+        return f"demo/{model}"
+    
     def get_model_info(self, model_path: str) -> Optional[AIModel]:
         """Model bilgisini al (örn: 'openai/gpt-4')"""
         try:
@@ -241,17 +718,51 @@ class AIProvider:
     
     def _create_demo_client(self):
         """Demo client - API key olmadan"""
-        from langchain.schema import AIMessage
+        from langchain_core.messages import AIMessage
         
         class DemoLLM:
-            async def ainvoke(self, messages):
+            async def ainvoke(self, messages, **kwargs):
                 return AIMessage(content="[Demo Mode] Bu bir simülasyon yanıtıdır. Gerçek AI yanıtı için API key ekleyin.")
         
         return DemoLLM()
 
 
+class LLMConcurrencyLimiter:
+    """Tüm ajanların paylaştığı eşzamanlı LLM çağrısı sınırı"""
+    
+    def __init__(self, max_concurrent: int = 8):
+        self.max_concurrent = max_concurrent
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop = None
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.total_calls = 0
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore event loop'a bağlıdır - loop değişirse yeniden oluştur"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._loop = loop
+            self.in_flight = 0
+        return self._semaphore
+    
+    async def __aenter__(self):
+        await self._get_semaphore().acquire()
+        self.in_flight += 1
+        self.total_calls += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.in_flight -= 1
+        self._semaphore.release()
+        return False
+
+
 # Singleton instance
 _provider = None
+_llm_limiter = None
 
 def get_ai_provider(auto_mode: bool = True) -> AIProvider:
     """Singleton AIProvider instance al"""
@@ -259,3 +770,11 @@ def get_ai_provider(auto_mode: bool = True) -> AIProvider:
     if _provider is None:
         _provider = AIProvider(auto_mode=auto_mode)
     return _provider
+
+
+def get_llm_limiter() -> LLMConcurrencyLimiter:
+    """Paylaşılan LLM eşzamanlılık sınırlayıcısını al (LLM_MAX_CONCURRENCY)"""
+    global _llm_limiter
+    if _llm_limiter is None:
+        _llm_limiter = LLMConcurrencyLimiter(int(os.getenv('LLM_MAX_CONCURRENCY', '8')))
+    return _llm_limiter
@@ -23,6 +23,11 @@ class AutoConfigurator:
         self.available_providers = self._detect_providers()
         self.optimal_config = self._create_optimal_config()
     
+    def reload(self):
+        """Provider'ları ortamdan tekrar algıla"""
+        self.available_providers = self._detect_providers()
+        self.optimal_config = self._create_optimal_config()
+    
     def _detect_providers(self) -> Dict[str, bool]:
         """Hangi provider'lar kullanılabilir?"""
         return {
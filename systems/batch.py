@@ -0,0 +1,244 @@
+"""
+Batch - Gecikmeye duyarsız çağrılar için toplu iş (batch job) modu
+
+Sprint planlama, çeyrek değerlendirmesi ve takım raporları gibi işler anlık
+yanıt gerektirmez. Bu çağrılar gerçek zamanlı ainvoke yolunu ve onun hız
+sınırını kullanmak yerine kuyruğa alınır; kuyruk dolduğunda ya da
+flush_interval geçtiğinde tek bir toplu iş olarak provider'ın batch
+arayüzüne gönderilir. İş belirli aralıklarla yoklanır, tamamlandığında
+sonuçlar bekleyen çağıranlara dağıtılır. Provider'lar toplu işleri
+genellikle indirimli fiyatlandırır.
+
+LocalFileBatchBackend gerçek batch API'sinin yerine geçen dosya tabanlı
+bir taklittir: istekler JSONL olarak yazılır, completion_delay sonunda
+verilen responder ile işlenip çıktı dosyasına yazılır.
+"""
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
+import asyncio
+import itertools
+import json
+import uuid
+
+from systems.cassette import estimate_tokens
+from utils.clock import get_clock
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Varsayılan olarak toplu işe uygun çağrı tipleri
+BATCH_CALL_KINDS = {"sprint_planning", "quarterly_review", "team_review"}
+
+
+class BatchError(RuntimeError):
+    """Toplu iş içindeki istek başarısız oldu"""
+
+
+@dataclass
+class BatchMessage:
+    """Toplu işten dönen yanıt - LangChain AIMessage ile aynı alanlar"""
+    content: str
+    response_metadata: Dict = field(default_factory=dict)
+
+
+@dataclass
+class BatchRequest:
+    """Toplu işe eklenen tek çağrı"""
+    custom_id: str
+    model: str
+    messages: List[Tuple[str, str]]   # (tip, içerik) - 'system', 'human', 'ai'
+    params: Dict = field(default_factory=dict)   # ör. max_tokens
+
+
+def serialize_messages(messages) -> List[Tuple[str, str]]:
+    """LangChain mesajları ya da (tip, içerik) çiftleri -> (tip, içerik) listesi"""
+    return [
+        tuple(message) if isinstance(message, tuple)
+        else (getattr(message, "type", "human"), str(getattr(message, "content", message)))
+        for message in messages
+    ]
+
+
+class LocalFileBatchBackend:
+    """Batch API'sinin dosya tabanlı yerel taklidi"""
+
+    def __init__(
+        self,
+        directory,
+        responder: Callable[..., Awaitable],
+        completion_delay: float = 60.0
+    ):
+        self.directory = Path(directory)
+        # (model, mesajlar, **params) -> yanıt; iş tamamlanırken her istek için çağrılır
+        self.responder = responder
+        self.completion_delay = completion_delay
+        self._submitted: Dict[str, float] = {}
+
+    def _path(self, job_id: str, kind: str) -> Path:
+        return self.directory / f"{job_id}.{kind}.jsonl"
+
+    async def submit(self, requests: List[BatchRequest]) -> str:
+        """İstekleri giriş dosyasına yaz, iş kimliği döndür"""
+        job_id = f"batch_{uuid.uuid4().hex[:12]}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self._path(job_id, "input"), "w", encoding="utf-8") as f:
+            for request in requests:
+                f.write(json.dumps({
+                    "custom_id": request.custom_id,
+                    "model": request.model,
+                    "messages": request.messages,
+                    "params": request.params
+                }, ensure_ascii=False) + "\n")
+        self._submitted[job_id] = get_clock().timestamp()
+        return job_id
+
+    async def poll(self, job_id: str) -> str:
+        """İş durumu: 'in_progress' ya da 'completed'"""
+        if self._path(job_id, "output").exists():
+            return "completed"
+        if get_clock().timestamp() - self._submitted[job_id] < self.completion_delay:
+            return "in_progress"
+        await self._process(job_id)
+        return "completed"
+
+    async def _process(self, job_id: str):
+        lines = []
+        with open(self._path(job_id, "input"), encoding="utf-8") as f:
+            requests = [json.loads(line) for line in f if line.strip()]
+        for request in requests:
+            try:
+                messages = [tuple(message) for message in request["messages"]]
+                response = await self.responder(request["model"], messages, **request.get("params", {}))
+                lines.append({"custom_id": request["custom_id"],
+                              "content": str(getattr(response, "content", response))})
+            except Exception as e:
+                lines.append({"custom_id": request["custom_id"], "error": str(e)})
+        output = self._path(job_id, "output")
+        with open(output.with_suffix(".tmp"), "w", encoding="utf-8") as f:
+            for line in lines:
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+        output.with_suffix(".tmp").replace(output)
+
+    async def results(self, job_id: str) -> Dict[str, Dict]:
+        """custom_id -> {'content': ...} ya da {'error': ...}"""
+        with open(self._path(job_id, "output"), encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        return {line["custom_id"]: line for line in lines}
+
+
+class BatchExecutor:
+    """Çağrıları toplu işlerde biriktirip sonuçları bekleyen çağıranlara dağıtır"""
+
+    def __init__(
+        self,
+        backend,
+        max_batch_size: int = 50,
+        flush_interval: float = 30.0,
+        poll_interval: float = 30.0,
+        discount: float = 0.5,
+        model_cost: Optional[Callable[[str], float]] = None
+    ):
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.poll_interval = poll_interval
+        # Toplu iş fiyatının gerçek zamanlı fiyata göre indirimi
+        self.discount = discount
+        self.model_cost = model_cost or (lambda model: 0.0)
+        self._pending: List[Tuple[BatchRequest, asyncio.Future]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._jobs: set = set()
+        self._ids = itertools.count()
+        self.stats = {"requests": 0, "jobs": 0, "completed": 0, "failed": 0,
+                      "turnaround_total": 0.0, "cost_saved": 0.0}
+
+    async def submit(self, model: str, messages, **params) -> BatchMessage:
+        """Çağrıyı kuyruğa al ve toplu iş tamamlanınca yanıtı döndür"""
+        future = asyncio.get_running_loop().create_future()
+        request = BatchRequest(f"req-{next(self._ids)}", model, serialize_messages(messages), params)
+        self._pending.append((request, future))
+        self.stats["requests"] += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            await self.flush()
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.ensure_future(self._flush_later())
+        return await future
+
+    async def _flush_later(self):
+        await get_clock().sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self):
+        """Kuyruktaki istekleri tek toplu iş olarak gönder"""
+        # Kapanmış bir event loop'a ait bekleyenler atılır
+        pending = [
+            (request, future) for request, future in self._pending
+            if not future.done() and not future.get_loop().is_closed()
+        ]
+        self._pending = []
+        if not pending:
+            return
+        job_id = await self.backend.submit([request for request, _ in pending])
+        self.stats["jobs"] += 1
+        logger.info(f"📦 Toplu iş gönderildi: {job_id} ({len(pending)} istek)")
+        task = asyncio.ensure_future(self._wait_for(job_id, pending, get_clock().timestamp()))
+        self._jobs.add(task)
+        task.add_done_callback(self._jobs.discard)
+
+    async def _wait_for(self, job_id: str, pending: List, submitted_at: float):
+        clock = get_clock()
+        try:
+            while await self.backend.poll(job_id) != "completed":
+                await clock.sleep(self.poll_interval)
+            results = await self.backend.results(job_id)
+        except Exception as e:
+            logger.warning(f"⚠️ Toplu iş {job_id} başarısız: {e}")
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(BatchError(str(e)))
+            self.stats["failed"] += len(pending)
+            return
+
+        turnaround = clock.timestamp() - submitted_at
+        for request, future in pending:
+            result = results.get(request.custom_id) or {"error": "sonuç yok"}
+            if future.done():
+                continue
+            if "error" in result:
+                self.stats["failed"] += 1
+                future.set_exception(BatchError(result["error"]))
+                continue
+            self.stats["completed"] += 1
+            self.stats["turnaround_total"] += turnaround
+            tokens = estimate_tokens(" ".join(c for _, c in request.messages)) + estimate_tokens(result["content"])
+            self.stats["cost_saved"] += tokens / 1000 * self.model_cost(request.model) * self.discount
+            future.set_result(BatchMessage(
+                content=result["content"],
+                response_metadata={"model": request.model, "batch_id": job_id}
+            ))
+
+    def get_stats(self) -> Dict:
+        completed = self.stats["completed"]
+        return {
+            "requests": self.stats["requests"],
+            "jobs": self.stats["jobs"],
+            "completed": completed,
+            "failed": self.stats["failed"],
+            "queued": len(self._pending),
+            "avg_turnaround": self.stats["turnaround_total"] / completed if completed else 0.0,
+            "cost_saved": round(self.stats["cost_saved"], 6)
+        }
+
+
+class BatchLLM:
+    """Toplu iş yürütücüsünü LLM client arayüzüyle (ainvoke) sunan sarmalayıcı"""
+
+    def __init__(self, executor: BatchExecutor, model: str):
+        self.executor = executor
+        self.model = model
+
+    async def ainvoke(self, messages, **kwargs) -> BatchMessage:
+        return await self.executor.submit(self.model, messages, **kwargs)
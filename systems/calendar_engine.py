@@ -0,0 +1,274 @@
+"""
+Calendar Engine - Katılımcı takvimleri, çakışma kontrolü ve tekrarlayan toplantılar
+
+Her katılımcının dolu aralıkları başlangıca göre sıralı, birbirine değmeyen
+aralıklar olarak tutulur. Bir katılımcı için "şu andan sonraki ilk boş an"
+sorgusu ikili aramayla O(log n) maliyetle bulunur; N katılımcı için ortak
+boş slot, aday zamanı katılımcılar arasında ileri iterek hesaplanır.
+
+Tekrarlayan toplantılar (günlük, haftalık, aylık) bir heap'te sıradaki
+vakitlerine göre tutulur. Simülasyon döngüsü gün sonuna kadar vakti gelen
+toplantıları pop_due ile çeker.
+"""
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+import bisect
+import calendar
+import heapq
+import itertools
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = {name.lower(): index for index, name in enumerate(calendar.day_name)}
+
+
+class SchedulingConflict(ValueError):
+    """İstenen aralıkta katılımcılardan biri dolu"""
+
+
+class BusyIndex:
+    """Bir katılımcının sıralı, çakışmasız dolu aralıkları"""
+
+    __slots__ = ("starts", "ends", "labels")
+
+    def __init__(self):
+        self.starts: List[datetime] = []
+        self.ends: List[datetime] = []
+        self.labels: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def is_free(self, start: datetime, end: datetime) -> bool:
+        """[start, end) aralığı boş mu?"""
+        index = bisect.bisect_right(self.starts, start) - 1
+        if index >= 0 and self.ends[index] > start:
+            return False
+        return index + 1 >= len(self.starts) or self.starts[index + 1] >= end
+
+    def next_free(self, start: datetime, duration: timedelta) -> datetime:
+        """start'tan itibaren duration kadar boş kalan ilk an"""
+        index = bisect.bisect_right(self.starts, start) - 1
+        if index >= 0 and self.ends[index] > start:
+            start = self.ends[index]
+        index += 1
+        # Aralıklar çakışmadığı için bitişler de sıralı - sadece engelleyenler taranır
+        while index < len(self.starts) and self.starts[index] < start + duration:
+            start = max(start, self.ends[index])
+            index += 1
+        return start
+
+    def add(self, start: datetime, end: datetime, label: str = ""):
+        """Dolu aralık ekle - çakışma varsa SchedulingConflict"""
+        if not self.is_free(start, end):
+            raise SchedulingConflict(f"Aralık dolu: {start} - {end}")
+        index = bisect.bisect_left(self.starts, start)
+        self.starts.insert(index, start)
+        self.ends.insert(index, end)
+        self.labels.insert(index, label)
+
+    def prune(self, before: datetime) -> int:
+        """before'dan önce biten aralıkları at"""
+        count = bisect.bisect_right(self.ends, before)
+        if count:
+            del self.starts[:count]
+            del self.ends[:count]
+            del self.labels[:count]
+        return count
+
+
+@dataclass
+class RecurrenceRule:
+    """Günlük, haftalık veya aylık tekrar kuralı"""
+    frequency: str                       # daily, weekly, monthly
+    at: time = time(9, 0)
+    weekday: Optional[int] = None        # weekly için (0 = Pazartesi)
+    day_of_month: Optional[int] = None   # monthly için
+    interval: int = 1
+
+    def __post_init__(self):
+        if self.frequency not in ("daily", "weekly", "monthly"):
+            raise ValueError(f"Bilinmeyen tekrar sıklığı: {self.frequency}")
+        if self.frequency == "weekly" and self.weekday is None:
+            self.weekday = 0
+        if self.frequency == "monthly" and self.day_of_month is None:
+            self.day_of_month = 1
+
+    def _in_month(self, year: int, month: int) -> datetime:
+        day = min(self.day_of_month, calendar.monthrange(year, month)[1])
+        return datetime.combine(datetime(year, month, day).date(), self.at)
+
+    def first_on_or_after(self, moment: datetime) -> datetime:
+        """moment anından itibaren ilk tekrar"""
+        if self.frequency == "daily":
+            candidate = datetime.combine(moment.date(), self.at)
+            return candidate if candidate >= moment else candidate + timedelta(days=1)
+
+        if self.frequency == "weekly":
+            days_ahead = (self.weekday - moment.weekday()) % 7
+            candidate = datetime.combine(moment.date() + timedelta(days=days_ahead), self.at)
+            return candidate if candidate >= moment else candidate + timedelta(days=7)
+
+        candidate = self._in_month(moment.year, moment.month)
+        if candidate >= moment:
+            return candidate
+        year, month = divmod(moment.month, 12)
+        return self._in_month(moment.year + year, month + 1)
+
+    def following(self, occurrence: datetime) -> datetime:
+        """Bir tekrardan sonraki tekrar"""
+        if self.frequency == "daily":
+            return occurrence + timedelta(days=self.interval)
+        if self.frequency == "weekly":
+            return occurrence + timedelta(weeks=self.interval)
+        year, month = divmod(occurrence.month - 1 + self.interval, 12)
+        return self._in_month(occurrence.year + year, month + 1)
+
+    @classmethod
+    def from_config(cls, frequency: str, settings: Dict) -> "RecurrenceRule":
+        """company_config.yaml meetings bölümündeki bir girdiden kural oluştur"""
+        hour, minute = (int(part) for part in str(settings.get("time", "09:00")).split(":"))
+        weekday = settings.get("day") if frequency == "weekly" else None
+        if isinstance(weekday, str):
+            weekday = WEEKDAYS[weekday.lower()]
+        return cls(
+            frequency=frequency,
+            at=time(hour, minute),
+            weekday=weekday,
+            day_of_month=settings.get("day") if frequency == "monthly" else None,
+            interval=settings.get("interval", 1)
+        )
+
+
+@dataclass
+class RecurringMeeting:
+    """Tekrarlayan toplantı tanımı"""
+    kind: str                # daily_standup, weekly_review, monthly_planning
+    rule: RecurrenceRule
+    duration: int = 30       # dakika
+    next_due: Optional[datetime] = None
+
+
+@dataclass(order=True)
+class Occurrence:
+    """Vakti gelen tekrarlayan toplantı"""
+    scheduled_time: datetime
+    kind: str = field(compare=False)
+    duration: int = field(compare=False, default=30)
+
+
+# Config'deki toplantı tipleri ve varsayılan sıklıkları
+DEFAULT_FREQUENCIES = {
+    "daily_standup": "daily",
+    "weekly_review": "weekly",
+    "monthly_planning": "monthly"
+}
+
+
+class CalendarEngine:
+    """Katılımcı takvimleri ve tekrarlayan toplantı planlayıcısı"""
+
+    def __init__(self):
+        self.busy: Dict[str, BusyIndex] = {}
+        self.recurring: Dict[str, RecurringMeeting] = {}
+        self._due_heap: List = []  # (next_due, seq, kind)
+        self._seq = itertools.count()
+
+    def _index(self, participant: str) -> BusyIndex:
+        if participant not in self.busy:
+            self.busy[participant] = BusyIndex()
+        return self.busy[participant]
+
+    def is_free(self, participants: List[str], start: datetime, duration: timedelta) -> bool:
+        """Tüm katılımcılar [start, start + duration) aralığında boş mu?"""
+        end = start + duration
+        return all(
+            participant not in self.busy or self.busy[participant].is_free(start, end)
+            for participant in participants
+        )
+
+    def find_slot(
+        self,
+        participants: List[str],
+        earliest: datetime,
+        duration: timedelta,
+        latest: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        """Tüm katılımcıların boş olduğu ilk slot (latest'ten sonraysa None)"""
+        candidate = earliest
+        indexes = [self.busy[p] for p in participants if p in self.busy]
+        while True:
+            moved = False
+            for index in indexes:
+                free_at = index.next_free(candidate, duration)
+                if free_at > candidate:
+                    candidate = free_at
+                    moved = True
+            if latest is not None and candidate > latest:
+                return None
+            if not moved:
+                return candidate
+
+    def book(self, participants: List[str], start: datetime, duration: timedelta, label: str = ""):
+        """Aralığı tüm katılımcılar için ayır - biri doluysa hiçbirine yazılmaz"""
+        if not self.is_free(participants, start, duration):
+            raise SchedulingConflict(f"Katılımcılardan biri dolu: {label or start}")
+        end = start + duration
+        for participant in participants:
+            self._index(participant).add(start, end, label)
+
+    def book_earliest(
+        self,
+        participants: List[str],
+        earliest: datetime,
+        duration: timedelta,
+        label: str = ""
+    ) -> datetime:
+        """İlk ortak boş slotu bul ve ayır"""
+        slot = self.find_slot(participants, earliest, duration)
+        self.book(participants, slot, duration, label)
+        return slot
+
+    def prune(self, before: datetime, participants: Optional[List[str]] = None) -> int:
+        """before'dan önce biten dolu aralıkları at (katılımcı verilmezse tüm takvimlerden)"""
+        removed = 0
+        for participant in list(self.busy) if participants is None else participants:
+            if participant not in self.busy:
+                continue
+            removed += self.busy[participant].prune(before)
+            if not self.busy[participant]:
+                del self.busy[participant]
+        return removed
+
+    def add_recurring(self, kind: str, rule: RecurrenceRule, duration: int, start: datetime):
+        """Tekrarlayan toplantı ekle (aynı tip varsa değiştirilir)"""
+        meeting = RecurringMeeting(kind, rule, duration, rule.first_on_or_after(start))
+        self.recurring[kind] = meeting
+        heapq.heappush(self._due_heap, (meeting.next_due, next(self._seq), kind))
+
+    def load_recurring(self, meetings_config: Dict, start: datetime):
+        """company_config.yaml meetings bölümündeki toplantıları tekrarlayan olarak yükle"""
+        self.recurring.clear()
+        self._due_heap.clear()
+        for kind, frequency in DEFAULT_FREQUENCIES.items():
+            settings = meetings_config.get(kind)
+            if settings is None:
+                continue
+            rule = RecurrenceRule.from_config(settings.get("frequency", frequency), settings)
+            self.add_recurring(kind, rule, settings.get("duration", 30), start)
+
+    def pop_due(self, until: datetime) -> List[Occurrence]:
+        """until anından önce vakti gelen tekrarları zaman sırasıyla al"""
+        due = []
+        while self._due_heap and self._due_heap[0][0] < until:
+            next_due, _, kind = heapq.heappop(self._due_heap)
+            meeting = self.recurring.get(kind)
+            if meeting is None or meeting.next_due != next_due:
+                continue  # kaldırılmış veya değiştirilmiş tanım
+            due.append(Occurrence(next_due, kind, meeting.duration))
+            meeting.next_due = meeting.rule.following(next_due)
+            heapq.heappush(self._due_heap, (meeting.next_due, next(self._seq), kind))
+        return due
@@ -0,0 +1,208 @@
+"""
+Cascade - Önce ucuz model, düşük güvende atanmış modele yükseltme
+
+Kaskad modunda çağrı önce rolün basic tier modeline gider. Yanıt çağrı
+tipine göre doğrulanır (boş/kısa yanıt, reddetme, beklenen JSON yapısı) ve
+bir güven puanı hesaplanır. Doğrulamayı geçemeyen ya da güveni eşiğin
+altında kalan yanıtlar rolün atanmış modeline yükseltilir; kalan çağrılar
+hızlı modelde tamamlanır.
+
+Yükseltme oranı ve her çağrının atanmış modele gitseydi ödenecek maliyete
+göre tasarruf çevrimiçi tutulur.
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+from collections import Counter
+from dataclasses import dataclass
+import json
+import re
+
+from systems.cassette import estimate_tokens
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ValidationResult:
+    """Bir yanıtın doğrulama sonucu"""
+    ok: bool
+    confidence: float = 1.0
+    reason: str = ""
+
+
+# make_decision'ın istediği JSON alanları ve tipleri
+DECISION_SCHEMA = {"decision": str, "reasoning": str, "risks": list, "action_plan": list}
+MEETING_SYNTHESIS_SCHEMA = {"contributions": list}
+
+_REFUSAL = re.compile(
+    r"I can(?:no|')t (?:help|assist)|I'm unable to|as an AI|yardımcı olamam|"
+    r"bunu yapamam|yanıt veremem|cevap veremem",
+    re.IGNORECASE
+)
+_HEDGE = re.compile(
+    r"not sure|unsure|I think|might be|possibly|emin değilim|sanırım|belki|galiba|tahminen",
+    re.IGNORECASE
+)
+
+
+def _content(response) -> str:
+    return str(getattr(response, "content", response) or "")
+
+
+def extract_json(text: str) -> Optional[Dict]:
+    """Metindeki ilk { ile son } arasını JSON olarak çöz"""
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    try:
+        data = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def check_not_empty(text: str) -> ValidationResult:
+    if not text.strip():
+        return ValidationResult(False, 0.0, "empty")
+    return ValidationResult(True)
+
+
+def check_refusal(text: str) -> ValidationResult:
+    if _REFUSAL.search(text):
+        return ValidationResult(False, 0.0, "refusal")
+    return ValidationResult(True)
+
+
+def check_length(min_chars: int) -> Callable[[str], ValidationResult]:
+    def validator(text: str) -> ValidationResult:
+        if len(text.strip()) < min_chars:
+            return ValidationResult(False, 0.2, "too_short")
+        return ValidationResult(True)
+    return validator
+
+
+def check_json_schema(schema: Dict[str, type]) -> Callable[[str], ValidationResult]:
+    """Yanıtta şemadaki alanları doğru tiplerle içeren bir JSON nesnesi olmalı"""
+    def validator(text: str) -> ValidationResult:
+        data = extract_json(text)
+        if data is None:
+            return ValidationResult(False, 0.0, "invalid_json")
+        for key, expected in schema.items():
+            value = data.get(key)
+            if not isinstance(value, expected) or not value:
+                return ValidationResult(False, 0.3, "schema")
+        return ValidationResult(True)
+    return validator
+
+
+def hedging_confidence(text: str) -> float:
+    """Yanıttaki çekingen ifadelerden kaba güven puanı (0-1)"""
+    return max(1.0 - 0.25 * len(_HEDGE.findall(text)), 0.0)
+
+
+# Çağrı tipi -> ek doğrulayıcılar (boşluk ve reddetme her çağrıda kontrol edilir)
+CALL_VALIDATORS: Dict[str, List[Callable[[str], ValidationResult]]] = {
+    "decision": [check_json_schema(DECISION_SCHEMA)],
+    "meeting_synthesis": [check_json_schema(MEETING_SYNTHESIS_SCHEMA)],
+    "task": [check_length(80)],
+    "strategic_decision": [check_length(80)],
+    "quarterly_review": [check_length(80)]
+}
+
+
+def validate_response(response, kind: str = "general", min_length: int = 20) -> ValidationResult:
+    """Yanıtı çağrı tipinin doğrulayıcılarından geçir ve güven puanı hesapla"""
+    text = _content(response)
+    validators = [check_not_empty, check_refusal, check_length(min_length)]
+    validators += CALL_VALIDATORS.get(kind, [])
+    for validator in validators:
+        result = validator(text)
+        if not result.ok:
+            return result
+
+    # Model kendi güvenini bildiriyorsa o kullanılır
+    metadata = getattr(response, "response_metadata", None) or {}
+    if "confidence" in metadata:
+        return ValidationResult(True, float(metadata["confidence"]))
+    return ValidationResult(True, hedging_confidence(text))
+
+
+class CascadeStats:
+    """Yükseltme oranı ve atanmış modele göre tasarruf"""
+
+    def __init__(self):
+        self.calls = 0
+        self.escalations = 0
+        self.reasons: Counter = Counter()
+        self.baseline_cost = 0.0   # hepsi atanmış modele gitseydi
+        self.actual_cost = 0.0
+
+    def record(self, escalated: bool, reason: str, cheap_cost: float, strong_cost: float):
+        self.calls += 1
+        self.baseline_cost += strong_cost
+        self.actual_cost += cheap_cost
+        if escalated:
+            self.escalations += 1
+            self.reasons[reason] += 1
+            self.actual_cost += strong_cost
+
+    def to_dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "escalations": self.escalations,
+            "escalation_rate": self.escalations / self.calls if self.calls else 0.0,
+            "escalation_reasons": dict(self.reasons),
+            "baseline_cost": round(self.baseline_cost, 6),
+            "actual_cost": round(self.actual_cost, 6),
+            "savings": round(self.baseline_cost - self.actual_cost, 6)
+        }
+
+
+class Cascade:
+    """Ucuz modelden başlayıp gerekirse atanmış modele yükselten çağrı yürütücü"""
+
+    def __init__(self, min_confidence: float = 0.6, min_length: int = 20,
+                 model_cost: Optional[Callable[[str], float]] = None):
+        self.min_confidence = min_confidence
+        self.min_length = min_length
+        # model yolu -> 1k token başına maliyet
+        self.model_cost = model_cost or (lambda model: 0.0)
+        self.stats = CascadeStats()
+
+    def _call_cost(self, model: str, messages, response) -> float:
+        usage = getattr(response, "usage_metadata", None) or {}
+        tokens = usage.get("total_tokens")
+        if tokens is None:
+            prompt = " ".join(str(getattr(m, "content", m)) for m in messages)
+            tokens = estimate_tokens(prompt) + estimate_tokens(_content(response))
+        return tokens / 1000 * self.model_cost(model)
+
+    async def ainvoke(self, messages, kind: str, cheap: Tuple[str, object],
+                      strong: Tuple[str, object], **kwargs) -> Tuple[object, bool]:
+        """(yanıt, yükseltildi mi) - cheap ve strong (model, client) çiftleri"""
+        cheap_model, cheap_client = cheap
+        strong_model, strong_client = strong
+
+        try:
+            response = await cheap_client.ainvoke(messages, **kwargs)
+            result = validate_response(response, kind, self.min_length)
+        except Exception as e:
+            logger.warning(f"↪️ {cheap_model} kaskad çağrısı başarısız, yükseltiliyor: {e}")
+            response, result = None, ValidationResult(False, 0.0, "error")
+
+        if result.ok and result.confidence >= self.min_confidence:
+            cost = self._call_cost(cheap_model, messages, response)
+            # Baz maliyet aynı token sayısıyla atanmış modelin fiyatı
+            self.stats.record(False, "", cost, self._call_cost(strong_model, messages, response))
+            return response, False
+
+        reason = result.reason or "low_confidence"
+        cheap_cost = self._call_cost(cheap_model, messages, response) if response is not None else 0.0
+        escalated = await strong_client.ainvoke(messages, **kwargs)
+        self.stats.record(True, reason, cheap_cost, self._call_cost(strong_model, messages, escalated))
+        logger.debug(f"⬆️ {cheap_model} -> {strong_model} ({reason})")
+        return escalated, True
+
+    def get_stats(self) -> Dict:
+        return self.stats.to_dict()
@@ -0,0 +1,187 @@
+"""
+Cassette - LLM çağrılarını kaydedip deterministik olarak geri oynatma
+
+Kayıt modunda her çağrı (model, mesajlar) -> (yanıt, gecikme, token sayıları)
+olarak gzip'li JSONL kasete yazılır. Oynatma modunda aynı anahtar kasetteki
+yanıtı döndürür; istenirse kaydedilen gecikme simülasyon saati üzerinden
+beklenir. Böylece simulate_work_day gibi akışlar ağ olmadan, gerçekçi yanıt
+boyutları ve süreleriyle uçtan uca profillenebilir.
+
+Aynı istem birden çok kez kaydedildiyse yanıtlar kayıt sırasıyla, sona
+gelince baştan verilir.
+"""
+from typing import Dict, List, Optional
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+import gzip
+import hashlib
+import json
+
+from utils.clock import call_latency, get_clock
+import time
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class CassetteMiss(KeyError):
+    """Oynatılan kasette istenen çağrı yok"""
+
+
+@dataclass
+class CassetteEntry:
+    """Kaydedilmiş tek bir LLM çağrısı"""
+    key: str
+    model: str
+    response: str
+    latency: float
+    input_tokens: int
+    output_tokens: int
+
+
+@dataclass
+class ReplayedMessage:
+    """Kasetten dönen yanıt - LangChain AIMessage ile aynı alanlar"""
+    content: str
+    response_metadata: Dict = field(default_factory=dict)
+    usage_metadata: Dict = field(default_factory=dict)
+
+
+def _message_parts(messages) -> List[List[str]]:
+    # (tip, içerik) çiftleri (ör. toplu işten gelen mesajlar) LangChain mesajıyla aynı anahtarı üretir
+    return [
+        [str(message[0]), str(message[1])] if isinstance(message, tuple)
+        else [getattr(message, "type", type(message).__name__), str(getattr(message, "content", message))]
+        for message in messages
+    ]
+
+
+def call_key(model: str, messages) -> str:
+    """(model, mesajlar) için kararlı anahtar"""
+    payload = json.dumps([model, _message_parts(messages)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """Token sayısı bilinmiyorsa kaba tahmin (~4 karakter/token)"""
+    return max(len(text) // 4, 1) if text else 0
+
+
+class Cassette:
+    """gzip'li JSONL kaset dosyası"""
+
+    def __init__(self, path, flush_every: int = 50):
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self._entries: Dict[str, List[CassetteEntry]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._pending: List[CassetteEntry] = []
+        if self.path.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def load(self):
+        """Kaseti diskten oku"""
+        self._entries.clear()
+        self._cursors.clear()
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = CassetteEntry(**json.loads(line))
+                    self._entries.setdefault(entry.key, []).append(entry)
+        logger.info(f"📼 {len(self)} kayıtlı çağrı yüklendi: {self.path}")
+
+    def record(self, entry: CassetteEntry):
+        """Çağrıyı kaydet - belirli aralıklarla diske eklenir"""
+        self._entries.setdefault(entry.key, []).append(entry)
+        self._pending.append(entry)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Bekleyen kayıtları dosyanın sonuna ekle (gzip çok parçalı dosyayı destekler)"""
+        if not self._pending:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "at", encoding="utf-8") as f:
+            for entry in self._pending:
+                f.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+        self._pending.clear()
+
+    def lookup(self, key: str) -> Optional[CassetteEntry]:
+        """Anahtarın sıradaki kaydı"""
+        entries = self._entries.get(key)
+        if not entries:
+            return None
+        cursor = self._cursors.get(key, 0)
+        self._cursors[key] = cursor + 1
+        return entries[cursor % len(entries)]
+
+    def rewind(self):
+        """Oynatmayı baştan başlat"""
+        self._cursors.clear()
+
+
+class RecordingLLM:
+    """Gerçek client'ı saran ve her çağrıyı kasete yazan LLM"""
+
+    def __init__(self, client, model: str, cassette: Cassette):
+        self.client = client
+        self.model = model
+        self.cassette = cassette
+
+    async def ainvoke(self, messages, **kwargs):
+        started = time.perf_counter()
+        response = await self.client.ainvoke(messages, **kwargs)
+        latency = call_latency(started, response)
+
+        content = str(getattr(response, "content", response))
+        usage = getattr(response, "usage_metadata", None) or {}
+        prompt = " ".join(part[1] for part in _message_parts(messages))
+        self.cassette.record(CassetteEntry(
+            key=call_key(self.model, messages),
+            model=self.model,
+            response=content,
+            latency=latency,
+            input_tokens=usage.get("input_tokens", estimate_tokens(prompt)),
+            output_tokens=usage.get("output_tokens", estimate_tokens(content))
+        ))
+        return response
+
+
+class ReplayLLM:
+    """Kasetteki yanıtları deterministik olarak döndüren LLM"""
+
+    def __init__(self, model: str, cassette: Cassette, reproduce_latency: bool = False,
+                 strict: bool = True):
+        self.model = model
+        self.cassette = cassette
+        self.reproduce_latency = reproduce_latency
+        # strict değilse kayıtsız çağrılar hata yerine boş yanıt alır
+        self.strict = strict
+        self.misses = 0
+
+    async def ainvoke(self, messages, **kwargs) -> ReplayedMessage:
+        entry = self.cassette.lookup(call_key(self.model, messages))
+        if entry is None:
+            self.misses += 1
+            if self.strict:
+                raise CassetteMiss(f"Kasette kayıt yok: {self.model}")
+            return ReplayedMessage(content="", response_metadata={"model": self.model, "replayed": False})
+
+        metadata = {"model": entry.model, "replayed": True}
+        if self.reproduce_latency and entry.latency > 0:
+            await get_clock().sleep(entry.latency)
+            metadata["simulated_latency"] = entry.latency
+        return ReplayedMessage(
+            content=entry.response,
+            response_metadata=metadata,
+            usage_metadata={
+                "input_tokens": entry.input_tokens,
+                "output_tokens": entry.output_tokens,
+                "total_tokens": entry.input_tokens + entry.output_tokens
+            }
+        )
@@ -0,0 +1,194 @@
+"""
+Goal Catalog - İndeksli ve SQLite ile kalıcı hedef kataloğu
+
+Hedefler bellekte kimliğe göre tutulur ve dönem, departman, sorumlu ve
+durum indeksleriyle sorgulanır; filtreler tüm hedefleri taramak yerine en
+küçük indeks kümesinden başlar. Değişen hedefler kirli olarak işaretlenir
+ve save() tek bir transaction'da sadece onları diske yazar. Açılışta tüm
+katalog tek sorguyla yüklenir.
+
+Katalog bir Mapping'dir: goals[id], id in goals, len(goals) ve
+goals.values() sözlükteki gibi çalışır.
+"""
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Type
+from collections.abc import Mapping
+from contextlib import closing
+from pathlib import Path
+import sqlite3
+from pydantic import BaseModel
+
+# Hedef modeli (systems.goals.Goal) döngüsel import olmaması için parametre olarak alınır
+Goal = BaseModel
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+_INDEXED_FIELDS = ("period", "department", "owner", "status")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS goals (
+    id TEXT PRIMARY KEY,
+    period TEXT NOT NULL,
+    department TEXT,
+    owner TEXT,
+    status TEXT NOT NULL,
+    parent_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_goals_period ON goals(period);
+CREATE INDEX IF NOT EXISTS idx_goals_department ON goals(department);
+CREATE INDEX IF NOT EXISTS idx_goals_owner ON goals(owner);
+CREATE INDEX IF NOT EXISTS idx_goals_status ON goals(status);
+"""
+
+
+def _field_value(goal: Goal, field: str) -> Optional[str]:
+    value = getattr(goal, field)
+    return getattr(value, "value", value)
+
+
+class GoalCatalog(Mapping):
+    """Dönem, departman, sorumlu ve durum indeksli hedef kataloğu"""
+
+    def __init__(self, model: Type[BaseModel], path: Optional[Path] = None):
+        self.model = model
+        self.path = Path(path) if path else None
+        self._goals: Dict[str, Goal] = {}
+        # alan -> değer -> (ekleme sıralı) kimlikler
+        self._indexes: Dict[str, Dict[Optional[str], Dict[str, None]]] = {
+            field: {} for field in _INDEXED_FIELDS
+        }
+        self._keys: Dict[str, Tuple] = {}  # kimlik -> indekslenen değerler
+        self._dirty: Set[str] = set()
+
+        if self.path and self.path.exists():
+            self.load()
+
+    def __getitem__(self, goal_id: str) -> Goal:
+        return self._goals[goal_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._goals)
+
+    def __len__(self) -> int:
+        return len(self._goals)
+
+    def _index(self, goal: Goal):
+        keys = tuple(_field_value(goal, field) for field in _INDEXED_FIELDS)
+        old_keys = self._keys.get(goal.id)
+        if old_keys == keys:
+            return
+
+        for field, old, new in zip(_INDEXED_FIELDS, old_keys or (None,) * len(keys), keys):
+            if old_keys is not None and old == new:
+                continue
+            index = self._indexes[field]
+            if old_keys is not None:
+                bucket = index.get(old)
+                if bucket is not None:
+                    bucket.pop(goal.id, None)
+                    if not bucket:
+                        del index[old]
+            index.setdefault(new, {})[goal.id] = None
+        self._keys[goal.id] = keys
+
+    def add(self, goal: Goal):
+        """Hedefi kataloğa ekle"""
+        self._goals[goal.id] = goal
+        self._index(goal)
+        self._dirty.add(goal.id)
+
+    def touch(self, goal: Goal):
+        """Değişen hedefi yeniden indeksle ve kaydedilecekler arasına al"""
+        if goal.id in self._goals:
+            self._index(goal)
+            self._dirty.add(goal.id)
+
+    def find(
+        self,
+        period: Optional[str] = None,
+        department: Optional[str] = None,
+        owner: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> List[Goal]:
+        """İndeksler üzerinden filtrele - sonuçlar ekleme sırasında"""
+        filters = {
+            field: getattr(value, "value", value)
+            for field, value in (
+                ("period", period), ("department", department),
+                ("owner", owner), ("status", status)
+            )
+            if value is not None
+        }
+        if not filters:
+            return list(self._goals.values())
+
+        buckets = sorted(
+            (self._indexes[field].get(value, {}) for field, value in filters.items()),
+            key=len
+        )
+        smallest, others = buckets[0], buckets[1:]
+        return [
+            self._goals[goal_id] for goal_id in smallest
+            if all(goal_id in bucket for bucket in others)
+        ]
+
+    def count(self, **filters) -> int:
+        """Filtreye uyan hedef sayısı"""
+        if len(filters) == 1:
+            field, value = next(iter(filters.items()))
+            if value is not None:
+                return len(self._indexes[field].get(getattr(value, "value", value), {}))
+        return len(self.find(**filters))
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def load(self):
+        """Kataloğu diskten yükle"""
+        with closing(self._connect()) as connection:
+            rows = connection.execute("SELECT data FROM goals ORDER BY rowid").fetchall()
+
+        self._goals.clear()
+        self._keys.clear()
+        for index in self._indexes.values():
+            index.clear()
+        for (data,) in rows:
+            goal = self.model.model_validate_json(data)
+            self._goals[goal.id] = goal
+            self._index(goal)
+        self._dirty.clear()
+        logger.info(f"🎯 {len(self._goals)} hedef yüklendi: {self.path}")
+
+    def save(self) -> int:
+        """Değişen hedefleri diske yaz - yazılan kayıt sayısını döndürür"""
+        if not self.path or not self._dirty:
+            return 0
+
+        rows = [
+            (
+                goal.id,
+                _field_value(goal, "period"),
+                goal.department,
+                goal.owner,
+                _field_value(goal, "status"),
+                goal.parent_id,
+                goal.model_dump_json()
+            )
+            for goal in (self._goals[goal_id] for goal_id in self._dirty if goal_id in self._goals)
+        ]
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT INTO goals (id, period, department, owner, status, parent_id, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET period=excluded.period, "
+                "department=excluded.department, owner=excluded.owner, "
+                "status=excluded.status, parent_id=excluded.parent_id, data=excluded.data",
+                rows
+            )
+        self._dirty.clear()
+        return len(rows)
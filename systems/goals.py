@@ -1,15 +1,22 @@
 """
 Goal Management System - Hedef belirleme ve takip sistemi
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TYPE_CHECKING
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from enum import Enum
+from utils.ids import new_id
+from utils.clock import get_clock
+from systems.goal_catalog import GoalCatalog
 
 
 
 import logging
 logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from agents.base_agent import Task
+
+
 class GoalPeriod(str, Enum):
     """Hedef periyodu"""
     DAILY = "daily"
@@ -37,20 +44,184 @@ class Goal(BaseModel):
     status: GoalStatus = GoalStatus.NOT_STARTED
     owner: Optional[str] = None  # CEO, CTO, department name, etc.
     department: Optional[str] = None
-    created_at: datetime = datetime.now()
+    created_at: datetime = Field(default_factory=lambda: get_clock().now())
     deadline: Optional[datetime] = None
     progress: float = 0.0  # 0-100
     metrics: Dict = {}
+    priority: int = 5  # 1 (en yüksek) - 10
     sub_goals: List[str] = []
+    parent_id: Optional[str] = None
+    weight: float = 1.0  # üst hedefin ilerlemesindeki ağırlığı
+    total_tasks: int = 0
+    completed_tasks: int = 0
 
 
 class GoalManager:
-    """Hedef yönetim sistemi"""
+    """Hedef yönetim sistemi
+    
+    Hedefler parent_id ile bir ağaç oluşturur. Görevler yaprak hedeflere
+    bağlanır; yaprağın ilerlemesi tamamlanan görev oranıdır, üst hedeflerin
+    ilerlemesi çocuklarının ağırlıklı ortalamasıdır. Her hedef için çocuk
+    ağırlıkları toplamı ve ağırlıklı ilerleme toplamı tutulur, böylece bir
+    değişiklik sadece ata yolunu O(derinlik) maliyetle günceller.
+    """
+    
+    def __init__(self, catalog_path: Optional[str] = None):
+        # Kimlik -> hedef; dönem/departman/sorumlu/durum indeksli, isteğe bağlı kalıcı
+        self.goals = GoalCatalog(Goal, catalog_path)
+        # Ekleme sıralı sözlükler - durum geçişleri O(1)
+        self.active_goals: Dict[str, Goal] = {}
+        self.completed_goals: Dict[str, Goal] = {}
+        self._child_weight: Dict[str, float] = {}    # hedef -> çocuk ağırlıkları toplamı
+        self._weighted_progress: Dict[str, float] = {}  # hedef -> Σ ağırlık × ilerleme
+        self._linked_tasks: Dict[str, str] = {}      # bekleyen görev -> yaprak hedef
+        self._rebuild()
+    
+    def _rebuild(self):
+        """Diskten yüklenen katalogdan durum kümelerini ve ağaç toplamlarını kur"""
+        for goal in self.goals.values():
+            if goal.status == GoalStatus.COMPLETED:
+                self.completed_goals[goal.id] = goal
+            elif goal.status in (GoalStatus.NOT_STARTED, GoalStatus.IN_PROGRESS):
+                self.active_goals[goal.id] = goal
+            if goal.parent_id:
+                self._child_weight[goal.parent_id] = self._child_weight.get(goal.parent_id, 0.0) + goal.weight
+                self._weighted_progress[goal.parent_id] = (
+                    self._weighted_progress.get(goal.parent_id, 0.0) + goal.weight * goal.progress
+                )
+    
+    def save_goals(self) -> int:
+        """Değişen hedefleri kataloğa kaydet"""
+        saved = self.goals.save()
+        if saved:
+            logger.info(f"💾 {saved} hedef kaydedildi")
+        return saved
+    
+    def find_goals(
+        self,
+        period: Optional[GoalPeriod] = None,
+        department: Optional[str] = None,
+        owner: Optional[str] = None,
+        status: Optional[GoalStatus] = None
+    ) -> List[Goal]:
+        """Hedefleri indeksler üzerinden filtrele - API, dashboard ve scriptlerin okuma yolu"""
+        return self.goals.find(period=period, department=department, owner=owner, status=status)
+    
+    def get_summary(self) -> Dict:
+        """Hedef sayıları özeti"""
+        return {
+            "total": len(self.goals),
+            "active": len(self.active_goals),
+            "completed": len(self.completed_goals),
+            "by_period": {
+                period.value: self.goals.count(period=period) for period in GoalPeriod
+            }
+        }
+    
+    def _register(self, goal: Goal, parent_id: Optional[str] = None) -> Goal:
+        """Hedefi kaydet ve varsa üst hedefe bağla"""
+        self.goals.add(goal)
+        self.active_goals[goal.id] = goal
+        if parent_id:
+            self.add_sub_goal(parent_id, goal.id)
+        return goal
+    
+    def add_sub_goal(self, parent_id: str, child_id: str):
+        """Hedefi başka bir hedefin alt hedefi yap"""
+        parent = self.goals.get(parent_id)
+        child = self.goals.get(child_id)
+        if parent is None or child is None:
+            raise ValueError(f"Hedef bulunamadı: {parent_id if parent is None else child_id}")
+        if parent.total_tasks:
+            raise ValueError(f"Görev bağlı hedef alt hedef alamaz: {parent.title}")
+        if child.parent_id:
+            raise ValueError(f"Hedefin zaten üst hedefi var: {child.title}")
+        
+        # Döngü kontrolü - ata yolu O(derinlik)
+        ancestor = parent
+        while ancestor is not None:
+            if ancestor.id == child_id:
+                raise ValueError(f"Hedef ağacında döngü oluşur: {child.title}")
+            ancestor = self.goals.get(ancestor.parent_id) if ancestor.parent_id else None
+        
+        child.parent_id = parent_id
+        parent.sub_goals.append(child_id)
+        self.goals.touch(child)
+        self.goals.touch(parent)
+        
+        self._child_weight[parent_id] = self._child_weight.get(parent_id, 0.0) + child.weight
+        self._weighted_progress[parent_id] = (
+            self._weighted_progress.get(parent_id, 0.0) + child.weight * child.progress
+        )
+        self._set_progress(parent, self._weighted_progress[parent_id] / self._child_weight[parent_id])
+    
+    def _set_progress(self, goal: Goal, progress: float):
+        """İlerlemeyi ayarla ve farkı ata yoluna yay"""
+        progress = min(100.0, max(0.0, progress))
+        while goal is not None:
+            delta = progress - goal.progress
+            if abs(delta) < 1e-9:
+                return
+            goal.progress = progress
+            self._update_status(goal)
+            self.goals.touch(goal)
+            
+            if not goal.parent_id:
+                return
+            parent = self.goals[goal.parent_id]
+            self._weighted_progress[parent.id] += goal.weight * delta
+            progress = min(100.0, max(0.0, self._weighted_progress[parent.id] / self._child_weight[parent.id]))
+            goal = parent
+    
+    def _update_status(self, goal: Goal):
+        """İlerlemeye göre durum ve aktif/tamamlanan kümeleri güncelle"""
+        if goal.progress >= 100.0 - 1e-9:
+            if goal.status != GoalStatus.COMPLETED:
+                self.complete_goal(goal.id)
+        elif goal.status == GoalStatus.COMPLETED:
+            # Yeni görev eklenince tamamlanan hedef yeniden açılır
+            goal.status = GoalStatus.IN_PROGRESS
+            self.completed_goals.pop(goal.id, None)
+            self.active_goals[goal.id] = goal
+            self.goals.touch(goal)
+        elif goal.progress > 0 and goal.status == GoalStatus.NOT_STARTED:
+            goal.status = GoalStatus.IN_PROGRESS
+            self.goals.touch(goal)
+    
+    def _leaf_progress(self, goal: Goal) -> float:
+        return 100.0 * goal.completed_tasks / goal.total_tasks if goal.total_tasks else goal.progress
+    
+    def link_task(self, goal_id: str, task: "Task"):
+        """Görevi yaprak hedefe bağla"""
+        goal = self.goals.get(goal_id)
+        if goal is None:
+            raise ValueError(f"Hedef bulunamadı: {goal_id}")
+        if goal.sub_goals:
+            raise ValueError(f"Görevler sadece yaprak hedeflere bağlanabilir: {goal.title}")
+        if task.id in self._linked_tasks:
+            return
+        
+        task.goal_id = goal_id
+        self._linked_tasks[task.id] = goal_id
+        goal.total_tasks += 1
+        self.goals.touch(goal)
+        self._set_progress(goal, self._leaf_progress(goal))
     
-    def __init__(self):
-        self.goals: Dict[str, Goal] = {}
-        self.active_goals: List[Goal] = []
-        self.completed_goals: List[Goal] = []
+    def on_task_created(self, task: "Task"):
+        """Görev yöneticisi dinleyicisi - hedefli görevleri bağla"""
+        if task.goal_id:
+            self.link_task(task.goal_id, task)
+    
+    def on_task_completed(self, task: "Task"):
+        """Görev yöneticisi dinleyicisi - ilerlemeyi ata yolunda güncelle"""
+        goal_id = self._linked_tasks.pop(task.id, None)
+        if goal_id is None or goal_id not in self.goals:
+            return
+        
+        goal = self.goals[goal_id]
+        goal.completed_tasks += 1
+        self.goals.touch(goal)
+        self._set_progress(goal, self._leaf_progress(goal))
     
     def set_company_goal(
         self,
@@ -59,21 +230,25 @@ class GoalManager:
         period: GoalPeriod,
         owner: str = "CEO",
         deadline: Optional[datetime] = None,
-        metrics: Dict = None
+        metrics: Dict = None,
+        parent_id: Optional[str] = None,
+        weight: float = 1.0,
+        priority: int = 5
     ) -> Goal:
         """Şirket hedefi belirle"""
         goal = Goal(
-            id=f"goal_{datetime.now().timestamp()}",
+            id=new_id("goal"),
             title=title,
             description=description,
             period=period,
             owner=owner,
             deadline=deadline,
-            metrics=metrics or {}
+            metrics=metrics or {},
+            weight=weight,
+            priority=priority
         )
         
-        self.goals[goal.id] = goal
-        self.active_goals.append(goal)
+        self._register(goal, parent_id)
         
         logger.info(f"\n🎯 YENİ HEDEF BELİRLENDİ")
         logger.info(f"   📌 {title}")
@@ -92,21 +267,27 @@ class GoalManager:
         description: str,
         period: GoalPeriod,
         owner: str,
-        deadline: Optional[datetime] = None
+        deadline: Optional[datetime] = None,
+        parent_id: Optional[str] = None,
+        weight: float = 1.0,
+        metrics: Dict = None,
+        priority: int = 5
     ) -> Goal:
         """Departman hedefi belirle"""
         goal = Goal(
-            id=f"goal_{department}_{datetime.now().timestamp()}",
+            id=new_id(f"goal_{department}"),
             title=title,
             description=description,
             period=period,
             owner=owner,
             department=department,
-            deadline=deadline
+            deadline=deadline,
+            weight=weight,
+            metrics=metrics or {},
+            priority=priority
         )
         
-        self.goals[goal.id] = goal
-        self.active_goals.append(goal)
+        self._register(goal, parent_id)
         
         logger.info(f"\n🎯 DEPARTMAN HEDEFİ: {department}")
         logger.info(f"   📌 {title}")
@@ -120,27 +301,24 @@ class GoalManager:
         if goal_id in self.goals:
             goal = self.goals[goal_id]
             old_progress = goal.progress
-            goal.progress = min(100.0, max(0.0, progress))
+            # Değişiklik üst hedeflere yayılır, tamamlanma kontrolü dahil
+            self._set_progress(goal, progress)
             
             logger.info(f"📊 Hedef İlerlemesi Güncellendi: {goal.title}")
             logger.info(f"   {old_progress:.1f}% -> {goal.progress:.1f}%")
             if notes:
                 logger.info(f"   💬 {notes}")
-            
-            # Tamamlanma kontrolü
-            if goal.progress >= 100.0 and goal.status != GoalStatus.COMPLETED:
-                self.complete_goal(goal_id)
     
     def complete_goal(self, goal_id: str):
         """Hedefi tamamla"""
         if goal_id in self.goals:
             goal = self.goals[goal_id]
             goal.status = GoalStatus.COMPLETED
-            goal.progress = 100.0
+            self._set_progress(goal, 100.0)
             
-            if goal in self.active_goals:
-                self.active_goals.remove(goal)
-            self.completed_goals.append(goal)
+            self.active_goals.pop(goal_id, None)
+            self.completed_goals[goal_id] = goal
+            self.goals.touch(goal)
             
             logger.info(f"\n✅ HEDEF TAMAMLANDI: {goal.title}")
             logger.info(f"   👏 Tebrikler! {goal.owner}")
@@ -149,18 +327,28 @@ class GoalManager:
     def get_active_goals(self, period: Optional[GoalPeriod] = None) -> List[Goal]:
         """Aktif hedefleri al"""
         if period:
-            return [g for g in self.active_goals if g.period == period]
-        return self.active_goals
+            # Dönem indeksi aktif kümeden küçükse onun üzerinden süz
+            return [g for g in self.goals.find(period=period) if g.id in self.active_goals]
+        return list(self.active_goals.values())
+    
+    def get_goal_path(self, goal_id: str) -> List[Goal]:
+        """Hedeften köke kadar ata yolu"""
+        path = []
+        goal = self.goals.get(goal_id)
+        while goal is not None:
+            path.append(goal)
+            goal = self.goals.get(goal.parent_id) if goal.parent_id else None
+        return path
     
     def get_department_goals(self, department: str) -> List[Goal]:
         """Departman hedeflerini al"""
-        return [g for g in self.goals.values() if g.department == department]
+        return self.goals.find(department=department)
     
     def get_goal_report(self) -> str:
         """Hedef raporu oluştur"""
         report = f"""
 {'='*60}
-🎯 HEDEF RAPORU - {datetime.now().strftime('%Y-%m-%d')}
+🎯 HEDEF RAPORU - {get_clock().now().strftime('%Y-%m-%d')}
 {'='*60}
 
 📊 Genel Durum:
@@ -173,7 +361,7 @@ class GoalManager:
         
         # Periyoda göre hedefler
         for period in GoalPeriod:
-            period_goals = [g for g in self.active_goals if g.period == period]
+            period_goals = self.get_active_goals(period)
             if period_goals:
                 report += f"\n📅 {period.value.upper()} Hedefleri:\n"
                 for goal in period_goals:
@@ -182,7 +370,7 @@ class GoalManager:
         # Tamamlanan son 5 hedef
         if self.completed_goals:
             report += f"\n✅ Son Tamamlanan Hedefler:\n"
-            for goal in self.completed_goals[-5:]:
+            for goal in list(self.completed_goals.values())[-5:]:
                 report += f"   • {goal.title} ({goal.owner})\n"
         
         report += f"\n{'='*60}\n"
@@ -192,8 +380,15 @@ class GoalManager:
         """Config'den hedefleri yükle"""
         goals_config = config.get('company', {}).get('goals', {})
         
+        # Katalogdan yüklenmiş hedefler tekrar oluşturulmaz
+        existing = {(g.title, g.period) for g in self.goals.values()}
+        def is_new(title: str, period: GoalPeriod) -> bool:
+            return (title, period) not in existing
+        
         # Quarterly goals
         for goal_title in goals_config.get('quarterly', []):
+            if not is_new(goal_title, GoalPeriod.QUARTERLY):
+                continue
             self.set_company_goal(
                 title=goal_title,
                 description=f"Q1 2026 hedefi: {goal_title}",
@@ -203,6 +398,8 @@ class GoalManager:
         
         # Monthly goals
         for goal_title in goals_config.get('monthly', []):
+            if not is_new(goal_title, GoalPeriod.MONTHLY):
+                continue
             self.set_company_goal(
                 title=goal_title,
                 description=f"Aylık hedef: {goal_title}",
@@ -212,6 +409,8 @@ class GoalManager:
         
         # Weekly goals
         for goal_title in goals_config.get('weekly', []):
+            if not is_new(goal_title, GoalPeriod.WEEKLY):
+                continue
             self.set_company_goal(
                 title=goal_title,
                 description=f"Haftalık hedef: {goal_title}",
@@ -0,0 +1,379 @@
+"""
+LLM Router - Eşdeğer modeller arasında yük dengeleme ve otomatik yedekleme
+
+Aynı tier'da birden fazla provider'ın anahtarı varsa çağrılar tek bir
+modele sabitlenmek yerine havuza dağıtılır. Her backend'in kendi dakikalık
+istek sınırı ve sağlık durumu tutulur:
+
+- Seçim politikası round-robin ya da en az bekleyen istek (least-outstanding).
+- Sınırı dolan backend atlanır; hepsi doluysa ilk boşalacak slot beklenir.
+  Böylece toplam verim tek provider'ın sınırıyla değil, sınırların
+  toplamıyla belirlenir.
+- Art arda hata veren backend bir süre devre dışı kalır (circuit breaker);
+  çağrı aynı istek içinde sıradaki sağlıklı backend'e aktarılır.
+- Her backend için gecikme yüzdelikleri, hata oranı ve kalite puanı çevrimiçi
+  tutulur. Bandit politikası bu istatistiklerle trafiği iyi giden modele
+  kaydırır; kalite eşiğin altına düşen model yeniden başlatma gerekmeden
+  rotasyondan çıkarılır. Kalite puanını üreten fonksiyon
+  quality_monitoring.scorer ile seçilir (bkz. load_quality_scorer).
+"""
+from typing import Callable, Dict, List, Optional
+from collections import deque
+import importlib
+import itertools
+import math
+
+from systems.cascade import validate_response
+from utils.clock import call_latency, get_clock
+import time
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class NoHealthyBackend(RuntimeError):
+    """Havuzda çağrı yapılabilecek backend kalmadı"""
+
+
+def score_response(response) -> float:
+    """
+    Varsayılan kalite puanı (0-1)
+
+    Yanıt kendi kalite bilgisini taşıyorsa (ör. değerlendirici modelin
+    puanı) o kullanılır; yoksa boş yanıtlar ve demo yanıtları düşük puan alır.
+    Boş olmayan her gerçek yanıt 1.0 aldığından bu puanla kalite düşüşü
+    ancak provider kalite bilgisi döndürüyorsa yakalanır; içeriğe bakan
+    puanlama için validation_score seçilmelidir.
+    """
+    metadata = getattr(response, "response_metadata", None) or {}
+    if "quality" in metadata:
+        return float(metadata["quality"])
+    content = str(getattr(response, "content", response) or "").strip()
+    if not content:
+        return 0.0
+    if content.startswith("[Demo Mode]"):
+        return 0.5
+    return 1.0
+
+
+def validation_score(response) -> float:
+    """
+    İçeriğe dayalı kalite puanı (0-1)
+
+    Kaskadın doğrulayıcıları kullanılır: boş, kısa ve reddeden yanıtlar 0
+    alır, çekingen ifadeler puanı düşürür. Yanıtın kendi kalite bilgisi
+    varsa o önceliklidir.
+    """
+    metadata = getattr(response, "response_metadata", None) or {}
+    if "quality" in metadata:
+        return float(metadata["quality"])
+    result = validate_response(response)
+    return result.confidence if result.ok else 0.0
+
+
+def load_quality_scorer(path: Optional[str] = None) -> Callable:
+    """'paket.modul.fonksiyon' yolundan kalite puanlayıcısını yükle (None: score_response)"""
+    if not path:
+        return score_response
+    module_name, _, attr = path.replace(":", ".").rpartition(".")
+    try:
+        scorer = getattr(importlib.import_module(module_name), attr)
+    except (ImportError, AttributeError, ValueError) as e:
+        raise ValueError(f"Kalite puanlayıcısı yüklenemedi: {path} ({e})") from e
+    if not callable(scorer):
+        raise ValueError(f"Kalite puanlayıcısı çağrılabilir değil: {path}")
+    return scorer
+
+
+class ModelStats:
+    """Bir modelin çevrimiçi gecikme, hata ve kalite istatistikleri"""
+
+    def __init__(self, window: int = 200, alpha: float = 0.1):
+        self.alpha = alpha
+        self.latencies: deque = deque(maxlen=window)
+        self.error_rate = 0.0
+        self.quality = 1.0
+        self.calls = 0
+        self.quality_samples = 0
+
+    def record(self, latency: float, ok: bool, quality: float):
+        self.calls += 1
+        self.error_rate += self.alpha * ((0.0 if ok else 1.0) - self.error_rate)
+        if ok:
+            self.latencies.append(latency)
+        # İlk örnek ortalamayı doğrudan belirler
+        weight = 1.0 if self.quality_samples == 0 else self.alpha
+        self.quality += weight * (quality - self.quality)
+        self.quality_samples += 1
+
+    def reset_quality(self):
+        self.quality = 1.0
+        self.quality_samples = 0
+
+    def percentile(self, p: float) -> float:
+        """Son penceredeki gecikme yüzdeliği (sn)"""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(int(p / 100 * len(ordered)), len(ordered) - 1)]
+
+    def to_dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "p50_latency": self.percentile(50),
+            "p95_latency": self.percentile(95),
+            "error_rate": round(self.error_rate, 4),
+            "quality_score": round(self.quality, 4)
+        }
+
+
+class Backend:
+    """Havuzdaki bir model ve sağlık/kapasite durumu"""
+
+    def __init__(self, path: str, client, requests_per_minute: Optional[float] = None):
+        self.path = path
+        self.client = client
+        self.requests_per_minute = requests_per_minute
+        self.outstanding = 0
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self.stats = ModelStats()
+        self._window: deque = deque()  # son 60 sn'deki istek zamanları
+
+    @property
+    def provider(self) -> str:
+        return self.path.split("/", 1)[0]
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.unhealthy_until
+
+    def _trim(self, now: float):
+        while self._window and self._window[0] <= now - 60:
+            self._window.popleft()
+
+    def has_capacity(self, now: float) -> bool:
+        if self.requests_per_minute is None:
+            return True
+        self._trim(now)
+        return len(self._window) < self.requests_per_minute
+
+    def next_slot(self, now: float) -> float:
+        """Sınır doluysa bir sonraki isteğin yapılabileceği an"""
+        self._trim(now)
+        if self.requests_per_minute is None or len(self._window) < self.requests_per_minute:
+            return now
+        return self._window[0] + 60
+
+    def acquire(self, now: float):
+        self._window.append(now)
+        self.outstanding += 1
+
+    def get_stats(self) -> Dict:
+        return {
+            "path": self.path,
+            "outstanding": self.outstanding,
+            "successes": self.successes,
+            "failures": self.failures,
+            "healthy": self.is_healthy(get_clock().timestamp()),
+            **self.stats.to_dict()
+        }
+
+
+class RoundRobinPolicy:
+    """Uygun backend'ler arasında sırayla"""
+
+    def __init__(self):
+        self._counter = itertools.count()
+
+    def choose(self, candidates: List[Backend]) -> Backend:
+        return candidates[next(self._counter) % len(candidates)]
+
+    def record(self, backend: Backend, latency: float, ok: bool, quality: float = 1.0):
+        pass
+
+
+class LeastOutstandingPolicy:
+    """En az bekleyen isteği olan backend"""
+
+    def choose(self, candidates: List[Backend]) -> Backend:
+        return min(candidates, key=lambda backend: backend.outstanding)
+
+    def record(self, backend: Backend, latency: float, ok: bool, quality: float = 1.0):
+        pass
+
+
+class BanditPolicy:
+    """
+    İndirgemeli UCB1 - kalite, hata ve gecikmeyi tek ödülde birleştirir
+
+    Eski gözlemler her kayıtta gamma ile sönümlenir; bozulan bir model
+    birkaç düzine çağrıda geride kalır ve trafik diğerlerine kayar. Keşif
+    terimi sayesinde geri toparlanan model de yeniden denenir.
+    """
+
+    def __init__(self, gamma: float = 0.98, exploration: float = 0.5,
+                 latency_weight: float = 0.2, latency_scale: float = 10.0):
+        self.gamma = gamma
+        self.exploration = exploration
+        self.latency_weight = latency_weight
+        self.latency_scale = latency_scale
+        self._counts: Dict[str, float] = {}
+        self._rewards: Dict[str, float] = {}
+
+    def reward(self, latency: float, ok: bool, quality: float) -> float:
+        if not ok:
+            return 0.0
+        return max(quality - self.latency_weight * min(latency / self.latency_scale, 1.0), 0.0)
+
+    def choose(self, candidates: List[Backend]) -> Backend:
+        untried = [b for b in candidates if self._counts.get(b.path, 0.0) < 1e-6]
+        if untried:
+            return untried[0]
+        total = sum(self._counts.get(b.path, 0.0) for b in candidates)
+        return max(
+            candidates,
+            key=lambda b: self._rewards[b.path] / self._counts[b.path]
+            + self.exploration * math.sqrt(math.log(max(total, 1.0)) / self._counts[b.path])
+        )
+
+    def record(self, backend: Backend, latency: float, ok: bool, quality: float = 1.0):
+        for path in self._counts:
+            self._counts[path] *= self.gamma
+            self._rewards[path] *= self.gamma
+        self._counts[backend.path] = self._counts.get(backend.path, 0.0) + 1.0
+        self._rewards[backend.path] = self._rewards.get(backend.path, 0.0) + self.reward(latency, ok, quality)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Model başına ortalama (indirgenmiş) ödül"""
+        return {path: self._rewards[path] / count for path, count in self._counts.items() if count}
+
+
+# Config'deki strateji adı -> politika
+POLICIES = {
+    "round-robin": RoundRobinPolicy,
+    "round-robin-with-fallback": RoundRobinPolicy,
+    "least-outstanding": LeastOutstandingPolicy,
+    "bandit": BanditPolicy
+}
+
+
+class LLMRouter:
+    """Eşdeğer backend havuzu üzerinde yük dengeleyen, hata durumunda yedeğe geçen router"""
+
+    def __init__(
+        self,
+        backends: List[Backend],
+        policy=None,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        quality_scorer: Callable = score_response,
+        min_quality_score: Optional[float] = None,
+        min_quality_samples: int = 10
+    ):
+        if not backends:
+            raise ValueError("Router en az bir backend gerektirir")
+        self.backends = backends
+        self.policy = policy or RoundRobinPolicy()
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.quality_scorer = quality_scorer
+        # None değilse kalitesi bu eşiğin altına düşen model rotasyondan çıkar
+        self.min_quality_score = min_quality_score
+        self.min_quality_samples = min_quality_samples
+
+    @classmethod
+    def from_strategy(cls, backends: List[Backend], strategy: str = "round-robin", **kwargs) -> "LLMRouter":
+        policy_class = POLICIES.get(strategy)
+        if policy_class is None:
+            raise ValueError(f"Bilinmeyen yük dengeleme stratejisi: {strategy}")
+        return cls(backends, policy=policy_class(), **kwargs)
+
+    def _candidates(self, now: float, exclude: set) -> List[Backend]:
+        healthy = [b for b in self.backends if b.path not in exclude and b.is_healthy(now)]
+        # Hepsi devre dışıysa denenmemiş olanlarla devam et (yarı açık)
+        return healthy or [b for b in self.backends if b.path not in exclude]
+
+    async def _acquire(self, exclude: set) -> Optional[Backend]:
+        clock = get_clock()
+        while True:
+            now = clock.timestamp()
+            candidates = self._candidates(now, exclude)
+            if not candidates:
+                return None
+            available = [b for b in candidates if b.has_capacity(now)]
+            if available:
+                backend = self.policy.choose(available)
+                backend.acquire(now)
+                return backend
+            # Tüm sınırlar dolu - ilk boşalan slotu bekle
+            await clock.sleep(max(min(b.next_slot(now) for b in candidates) - now, 0.001))
+
+    def _record(self, backend: Backend, started: float, ok: bool, response=None):
+        # Gecikme gerçek süreden (started: perf_counter), devre dışı kalma süresi saatten
+        now = get_clock().timestamp()
+        latency = call_latency(started, response)
+        quality = self.quality_scorer(response) if ok else 0.0
+        backend.stats.record(latency, ok, quality)
+        if ok:
+            backend.successes += 1
+            backend.consecutive_failures = 0
+        else:
+            backend.failures += 1
+            backend.consecutive_failures += 1
+            if backend.consecutive_failures >= self.failure_threshold:
+                backend.unhealthy_until = now + self.cooldown
+                logger.warning(f"⚠️ {backend.path} devre dışı ({self.cooldown:.0f} sn)")
+        
+        if (
+            self.min_quality_score is not None
+            and backend.stats.quality_samples >= self.min_quality_samples
+            and backend.stats.quality < self.min_quality_score
+        ):
+            backend.unhealthy_until = now + self.cooldown
+            # Geri döndüğünde yeni örneklerle değerlendirilir
+            backend.stats.reset_quality()
+            logger.warning(f"📉 {backend.path} kalite eşiğinin altında, trafik diğer modellere kaydırıldı")
+        
+        self.policy.record(backend, latency, ok, quality)
+
+    async def ainvoke(self, messages, **kwargs):
+        """Çağrıyı uygun backend'e yönlendir - hata olursa sıradakine geç"""
+        tried: set = set()
+        last_error: Optional[Exception] = None
+
+        while True:
+            backend = await self._acquire(tried)
+            if backend is None:
+                break
+            tried.add(backend.path)
+            started = time.perf_counter()
+            try:
+                response = await backend.client.ainvoke(messages, **kwargs)
+            except Exception as e:
+                self._record(backend, started, ok=False)
+                last_error = e
+                logger.warning(f"↪️ {backend.path} hata verdi, yedeğe geçiliyor: {e}")
+                continue
+            finally:
+                # İptal (CancelledError) dahil her çıkışta bekleyen istek sayısı düşer
+                backend.outstanding -= 1
+            self._record(backend, started, ok=True, response=response)
+            return response
+
+        raise NoHealthyBackend("Tüm backend'ler başarısız oldu") from last_error
+
+    def get_stats(self) -> List[Dict]:
+        return [backend.get_stats() for backend in self.backends]
+
+
+class RoutedLLM:
+    """Router'ı LLM client arayüzüyle (ainvoke) sunan sarmalayıcı"""
+
+    def __init__(self, router: LLMRouter):
+        self.router = router
+
+    async def ainvoke(self, messages, **kwargs):
+        return await self.router.ainvoke(messages, **kwargs)
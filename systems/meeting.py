@@ -2,9 +2,15 @@
 Meeting System - Toplantı yönetim sistemi
 """
 from typing import List, Dict, Optional, TYPE_CHECKING
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from pydantic import BaseModel
+from enum import Enum
 import asyncio
+from utils.ids import new_id
+from utils.clock import get_clock
+from systems.meeting_store import MeetingStore, MeetingDigest
+from systems.calendar_engine import CalendarEngine
+from utils.config_service import MeetingRuntimeConfig
 
 
 import logging
@@ -14,6 +20,17 @@ if TYPE_CHECKING:
     from agents.ai_agent import AIAgent
 
 
+class MeetingMode(str, Enum):
+    """Toplantı katkılarının üretilme şekli"""
+    INDIVIDUAL = "individual"    # Her katılımcı kendi LLM çağrısını yapar
+    SYNTHESIZED = "synthesized"  # Kolaylaştırıcı tüm katkıları tek çağrıda üretir
+
+
+# Katkıları LLM ile toplanan ve bu yüzden moda bağlı toplantı tipleri; standup
+# görev durumundan, aylık planlama yöneticilerin kararlarından üretilir
+MODE_MEETING_TYPES = ("weekly_review",)
+
+
 class MeetingAgenda(BaseModel):
     """Toplantı gündemi"""
     items: List[str]
@@ -25,6 +42,7 @@ class Meeting(BaseModel):
     id: str
     type: str  # daily_standup, weekly_review, monthly_planning, ad_hoc
     title: str
+    department: Optional[str] = None
     scheduled_time: datetime
     duration: int  # dakika
     participants: List[str]
@@ -39,9 +57,127 @@ class Meeting(BaseModel):
 class MeetingSystem:
     """Toplantı sistemi"""
     
-    def __init__(self):
-        self.meetings: List[Meeting] = []
-        self.meeting_history: List[Meeting] = []
+    def __init__(
+        self,
+        store: Optional[MeetingStore] = None,
+        calendar: Optional[CalendarEngine] = None,
+        modes: Optional[Dict[str, MeetingMode]] = None
+    ):
+        self.store = store if store is not None else MeetingStore()
+        self.calendar = calendar if calendar is not None else CalendarEngine()
+        # Toplantı tipi -> katkı modu (tanımsız tipler tek tek yürütülür)
+        self.modes: Dict[str, MeetingMode] = {}
+        for meeting_type, mode in (modes or {}).items():
+            self.set_mode(meeting_type, mode)
+        self.contribution_metrics: Dict[str, int] = {
+            "individual_calls": 0,
+            "synthesized_calls": 0,
+            "synthesis_fallbacks": 0
+        }
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> "MeetingSystem":
+        """runtime.meetings ayarlarından oluştur"""
+        # Varsayılanlar şemadan gelir
+        settings = MeetingRuntimeConfig.model_validate(config.get('runtime', {}).get('meetings') or {})
+        store = MeetingStore(
+            transcript_ttl=timedelta(days=settings.transcript_ttl_days),
+            retention=timedelta(days=settings.retention_days) if settings.retention_days is not None else None,
+            compaction_batch=settings.compaction_batch
+        )
+        return cls(store, modes=settings.modes)
+    
+    def get_mode(self, meeting_type: str) -> MeetingMode:
+        """Toplantı tipinin katkı modu"""
+        return self.modes.get(meeting_type, MeetingMode.INDIVIDUAL)
+    
+    def set_mode(self, meeting_type: str, mode: MeetingMode):
+        """Toplantı tipinin katkı modunu değiştir"""
+        if meeting_type not in MODE_MEETING_TYPES:
+            raise ValueError(
+                f"'{meeting_type}' için katkı modu desteklenmiyor "
+                f"(desteklenenler: {', '.join(MODE_MEETING_TYPES)})"
+            )
+        self.modes[meeting_type] = MeetingMode(mode)
+    
+    async def _collect_contributions(
+        self,
+        meeting: Meeting,
+        agents: List,
+        meeting_info: Dict
+    ) -> List[Dict]:
+        """Katılımcı katkılarını moda göre topla
+        
+        Sentez modunda kolaylaştırıcının modeli tüm katkıları tek çağrıda
+        üretir; cevapta eksik kalan katılımcılar tek tek sorulur. Çağrı hata
+        verirse ya da yanıt çözümlenemezse herkes tek tek sorulur.
+        """
+        synthesized: Dict[str, str] = {}
+        attempted = self.get_mode(meeting.type) == MeetingMode.SYNTHESIZED and len(agents) > 1
+        if attempted:
+            facilitator = next((a for a in agents if a.name == meeting.facilitator), agents[0])
+            try:
+                synthesized = await facilitator.synthesize_meeting_contributions(meeting_info, agents)
+                self.contribution_metrics["synthesized_calls"] += 1
+                if not synthesized:
+                    logger.warning("⚠️ Toplu katkı yanıtı çözümlenemedi, tek tek devam ediliyor")
+            except Exception as e:
+                logger.warning(f"⚠️ Toplu katkı üretilemedi, tek tek devam ediliyor: {e}")
+        
+        contributions = []
+        for agent in agents:
+            if agent.name in synthesized:
+                contributions.append({
+                    "agent": agent.name,
+                    "role": agent.role,
+                    "contribution": synthesized[agent.name],
+                    "synthesized": True
+                })
+                continue
+            
+            if attempted:
+                self.contribution_metrics["synthesis_fallbacks"] += 1
+            self.contribution_metrics["individual_calls"] += 1
+            contributions.append(await agent.generate_meeting_contribution(meeting_info))
+        
+        return contributions
+    
+    async def _wait_until_due(self, meeting: Meeting):
+        """Toplantı ileri bir saate ayrıldıysa sanal saatte o saate kadar bekle
+        
+        Duvar saatinde simülasyon günleri beklemeden arka arkaya çalışır;
+        gerçek saatlerce beklememek için toplantı hemen yürütülür.
+        """
+        clock = get_clock()
+        delay = (meeting.scheduled_time - clock.now()).total_seconds()
+        if delay <= 0:
+            return
+        if not clock.is_virtual:
+            logger.debug(f"⏩ {meeting.title} saati beklenmeden yürütülüyor: {meeting.scheduled_time}")
+            return
+        logger.info(f"⏳ {meeting.title} saatini bekliyor: {meeting.scheduled_time}")
+        await clock.sleep(delay)
+    
+    def _complete(self, meeting: Meeting):
+        """Toplantıyı tamamla ve katılımcıların geçmiş dolu aralıklarını at"""
+        meeting.status = "completed"
+        self.store.complete(meeting)
+        self.calendar.prune(get_clock().now(), meeting.participants)
+    
+    def _register(self, meeting: Meeting) -> Meeting:
+        """Katılımcıların ortak boş slotunu ayır ve toplantıyı depoya ekle"""
+        requested = meeting.scheduled_time
+        meeting.scheduled_time = self.calendar.book_earliest(
+            meeting.participants,
+            requested,
+            timedelta(minutes=meeting.duration),
+            label=meeting.id
+        )
+        if meeting.scheduled_time != requested:
+            logger.info(f"📆 {meeting.title} çakışma nedeniyle {meeting.scheduled_time} saatine kaydırıldı")
+        
+        self.store.add(meeting)
+        return meeting
     
     async def schedule_daily_standup(
         self, 
@@ -52,9 +188,10 @@ class MeetingSystem:
     ) -> Meeting:
         """Günlük standup toplantısı planla"""
         meeting = Meeting(
-            id=f"standup_{department}_{datetime.now().timestamp()}",
+            id=new_id(f"standup_{department}"),
             type="daily_standup",
             title=f"{department} Daily Standup",
+            department=department,
             scheduled_time=scheduled_time,
             duration=15,
             participants=[p.name for p in participants],
@@ -69,8 +206,8 @@ class MeetingSystem:
             facilitator=facilitator.name
         )
         
-        self.meetings.append(meeting)
-        logger.info(f"📅 Toplantı planlandı: {meeting.title} - {scheduled_time}")
+        self._register(meeting)
+        logger.info(f"📅 Toplantı planlandı: {meeting.title} - {meeting.scheduled_time}")
         return meeting
     
     async def conduct_daily_standup(
@@ -85,6 +222,7 @@ class MeetingSystem:
         logger.info(f"👥 Katılımcılar: {len(agents)} kişi")
         logger.info(f"{'='*60}\n")
         
+        await self._wait_until_due(meeting)
         meeting.status = "in_progress"
         updates = []
         
@@ -99,9 +237,8 @@ class MeetingSystem:
                 logger.info(f"   ⚠️  Engeller: {', '.join(update['blockers'])}")
             print()
         
-        meeting.status = "completed"
         meeting.notes = updates
-        self.meeting_history.append(meeting)
+        self._complete(meeting)
         
         logger.info(f"{'='*60}")
         logger.info(f"✅ TOPLANTI TAMAMLANDI")
@@ -123,9 +260,10 @@ class MeetingSystem:
     ) -> Meeting:
         """Haftalık değerlendirme toplantısı planla"""
         meeting = Meeting(
-            id=f"weekly_{department}_{datetime.now().timestamp()}",
+            id=new_id(f"weekly_{department}"),
             type="weekly_review",
             title=f"{department} Weekly Review",
+            department=department,
             scheduled_time=scheduled_time,
             duration=60,
             participants=[p.name for p in participants],
@@ -142,8 +280,7 @@ class MeetingSystem:
             facilitator=facilitator.name
         )
         
-        self.meetings.append(meeting)
-        return meeting
+        return self._register(meeting)
     
     async def conduct_weekly_review(
         self,
@@ -155,22 +292,19 @@ class MeetingSystem:
         logger.info(f"📊 HAFTALIK DEĞERLENDİRME: {meeting.title}")
         logger.info(f"{'='*60}\n")
         
+        await self._wait_until_due(meeting)
         meeting.status = "in_progress"
-        contributions = []
+        contributions = await self._collect_contributions(meeting, agents, {
+            "type": "weekly_review",
+            "agenda": meeting.agenda.items
+        })
         
-        for agent in agents:
-            contribution = await agent.generate_meeting_contribution({
-                "type": "weekly_review",
-                "agenda": meeting.agenda.items
-            })
-            contributions.append(contribution)
-            
+        for agent, contribution in zip(agents, contributions):
             logger.info(f"👤 {agent.name} ({agent.role}):")
             logger.info(f"   {contribution['contribution']}\n")
         
-        meeting.status = "completed"
         meeting.notes = contributions
-        self.meeting_history.append(meeting)
+        self._complete(meeting)
         
         logger.info(f"{'='*60}")
         logger.info(f"✅ HAFTALIK DEĞERLENDİRME TAMAMLANDI")
@@ -190,7 +324,7 @@ class MeetingSystem:
     ) -> Meeting:
         """Aylık planlama toplantısı planla"""
         meeting = Meeting(
-            id=f"monthly_{datetime.now().timestamp()}",
+            id=new_id("monthly"),
             type="monthly_planning",
             title="Monthly Planning Meeting",
             scheduled_time=scheduled_time,
@@ -210,8 +344,7 @@ class MeetingSystem:
             facilitator=facilitator.name
         )
         
-        self.meetings.append(meeting)
-        return meeting
+        return self._register(meeting)
     
     async def conduct_monthly_planning(
         self,
@@ -223,6 +356,7 @@ class MeetingSystem:
         logger.info(f"📈 AYLIK PLANLAMA TOPLANTISI")
         logger.info(f"{'='*60}\n")
         
+        await self._wait_until_due(meeting)
         meeting.status = "in_progress"
         
         # Executive contributions
@@ -236,9 +370,8 @@ class MeetingSystem:
                 logger.info(f"🎯 {agent.name} - Stratejik Plan:")
                 logger.info(f"   {plan['decision']}\n")
         
-        meeting.status = "completed"
         meeting.decisions = strategic_plans
-        self.meeting_history.append(meeting)
+        self._complete(meeting)
         
         logger.info(f"{'='*60}")
         logger.info(f"✅ AYLIK PLANLAMA TAMAMLANDI")
@@ -256,14 +389,15 @@ class MeetingSystem:
         participants: List,
         facilitator,
         agenda_items: List[str],
-        duration: int = 30
+        duration: int = 30,
+        earliest: Optional[datetime] = None
     ) -> Meeting:
-        """Özel toplantı planla"""
+        """Özel toplantı planla - katılımcıların ortak ilk boş slotuna"""
         meeting = Meeting(
-            id=f"adhoc_{datetime.now().timestamp()}",
+            id=new_id("adhoc"),
             type="ad_hoc",
             title=title,
-            scheduled_time=datetime.now(),
+            scheduled_time=earliest or get_clock().now(),
             duration=duration,
             participants=[p.name for p in participants],
             agenda=MeetingAgenda(
@@ -273,29 +407,42 @@ class MeetingSystem:
             facilitator=facilitator.name
         )
         
-        self.meetings.append(meeting)
-        return meeting
+        return self._register(meeting)
     
     async def get_meeting_summary(self, meeting_id: str) -> Optional[Dict]:
-        """Toplantı özetini al"""
-        for meeting in self.meeting_history:
-            if meeting.id == meeting_id:
-                return {
-                    "id": meeting.id,
-                    "type": meeting.type,
-                    "title": meeting.title,
-                    "date": meeting.scheduled_time,
-                    "participants": meeting.participants,
-                    "notes": meeting.notes,
-                    "decisions": meeting.decisions,
-                    "action_items": meeting.action_items
-                }
-        return None
+        """Toplantı özetini al - sıkıştırılmış kayıtlarda ham notlar yer almaz"""
+        meeting = self.store.get(meeting_id)
+        if meeting is None or meeting.status != "completed":
+            return None
+        
+        compacted = isinstance(meeting, MeetingDigest)
+        return {
+            "id": meeting.id,
+            "type": meeting.type,
+            "title": meeting.title,
+            "department": meeting.department,
+            "date": meeting.scheduled_time,
+            "participants": meeting.participants,
+            "notes": [] if compacted else meeting.notes,
+            "decisions": meeting.decisions,
+            "action_items": meeting.action_items,
+            "compacted": compacted
+        }
+    
+    def find_meetings(self, **filters) -> List:
+        """Tip, departman, katılımcı, zaman aralığı veya duruma göre toplantı bul"""
+        return self.store.find(**filters)
+    
+    def compact_transcripts(self, before: Optional[datetime] = None) -> int:
+        """Gün sonu bakımı - eski transcript'leri sıkıştır, geçmiş takvim aralıklarını at"""
+        if before is not None:
+            self.calendar.prune(before)
+        return self.store.compact(limit=len(self.store))
     
     def get_upcoming_meetings(self) -> List[Meeting]:
         """Yaklaşan toplantıları al"""
-        return [m for m in self.meetings if m.status == "scheduled"]
+        return self.store.upcoming()
     
-    def get_meeting_history(self, limit: int = 10) -> List[Meeting]:
+    def get_meeting_history(self, limit: int = 10) -> List:
         """Toplantı geçmişini al"""
-        return self.meeting_history[-limit:]
+        return self.store.history(limit)
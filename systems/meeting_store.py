@@ -0,0 +1,275 @@
+"""
+Meeting Store - İndeksli toplantı deposu ve transcript sıkıştırma katmanı
+
+Toplantılar kimlik, tip, departman, katılımcı ve zaman indeksleriyle tutulur;
+sorgular tüm geçmişi taramak yerine en küçük indeks kümesinden başlar.
+
+Tamamlanan toplantılar iki katmanda yaşar:
+- Tam katman: ham notlar dahil tüm toplantı (transcript_ttl süresince)
+- Özet katmanı: kararlar, aksiyon maddeleri ve meta veri; ham notlar atılır
+
+Sıkıştırma artımlıdır: her tamamlanan toplantıda ve gün sonu bakımında
+süresi dolan kayıtlardan sınırlı bir parti özet katmanına taşınır.
+retention tanımlıysa çok eski özetler de tamamen silinir; böylece aylarca
+süren simülasyonlarda bellek ve sorgu maliyeti sabit kalır.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from collections import deque
+from datetime import datetime, timedelta
+import bisect
+import itertools
+from pydantic import BaseModel
+
+from utils.clock import get_clock
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class MeetingDigest(BaseModel):
+    """Sıkıştırılmış toplantı kaydı - ham notlar olmadan"""
+    id: str
+    type: str
+    title: str
+    department: Optional[str] = None
+    scheduled_time: datetime
+    duration: int
+    participants: List[str]
+    facilitator: str
+    decisions: List[Dict] = []
+    action_items: List[Dict] = []
+    status: str = "completed"
+    note_count: int = 0
+    compacted: bool = True
+
+    @classmethod
+    def from_meeting(cls, meeting: Any) -> "MeetingDigest":
+        return cls(
+            id=meeting.id,
+            type=meeting.type,
+            title=meeting.title,
+            department=meeting.department,
+            scheduled_time=meeting.scheduled_time,
+            duration=meeting.duration,
+            participants=meeting.participants,
+            facilitator=meeting.facilitator,
+            decisions=meeting.decisions,
+            action_items=meeting.action_items,
+            status=meeting.status,
+            note_count=len(meeting.notes)
+        )
+
+
+# Meeting (tam katman) veya MeetingDigest (özet katmanı)
+MeetingRecord = Any
+
+
+class MeetingStore:
+    """Toplantıları indeksleyen ve eski transcript'leri sıkıştıran depo"""
+
+    def __init__(
+        self,
+        transcript_ttl: Optional[timedelta] = timedelta(days=7),
+        retention: Optional[timedelta] = None,
+        compaction_batch: int = 64
+    ):
+        self.transcript_ttl = transcript_ttl
+        self.retention = retention
+        self.compaction_batch = compaction_batch
+
+        self._records: Dict[str, MeetingRecord] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_department: Dict[str, Set[str]] = {}
+        self._by_participant: Dict[str, Set[str]] = {}
+        self._by_time: List[Tuple[datetime, str]] = []  # (scheduled_time, id) sıralı
+        self._upcoming: Set[str] = set()
+
+        # Tamamlanma sırasına göre kuyruklar - sıkıştırma ve silme baştan ilerler
+        self._full_queue: deque = deque()     # (tamamlanma zamanı, id)
+        self._history: deque = deque()        # (tamamlanma zamanı, id)
+
+        self.metrics: Dict[str, int] = {"compacted": 0, "expired": 0}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, meeting_id: str) -> bool:
+        return meeting_id in self._records
+
+    @property
+    def completed_count(self) -> int:
+        return len(self._history)
+
+    @property
+    def full_count(self) -> int:
+        """Ham notlarıyla tutulan tamamlanmış toplantı sayısı"""
+        return len(self._full_queue)
+
+    def add(self, meeting: MeetingRecord):
+        """Planlanan toplantıyı indekslere ekle"""
+        if meeting.id in self._records:
+            return
+
+        self._records[meeting.id] = meeting
+        self._by_type.setdefault(meeting.type, set()).add(meeting.id)
+        if meeting.department:
+            self._by_department.setdefault(meeting.department, set()).add(meeting.id)
+        for participant in meeting.participants:
+            self._by_participant.setdefault(participant, set()).add(meeting.id)
+        bisect.insort(self._by_time, (meeting.scheduled_time, meeting.id))
+
+        if meeting.status == "scheduled":
+            self._upcoming.add(meeting.id)
+
+    def complete(self, meeting: MeetingRecord):
+        """Toplantıyı tamamlandı olarak kaydet"""
+        self.add(meeting)
+        self._upcoming.discard(meeting.id)
+
+        completed_at = get_clock().now()
+        self._full_queue.append((completed_at, meeting.id))
+        self._history.append((completed_at, meeting.id))
+
+        # Artımlı bakım - parti sınırı sayesinde maliyet sabit
+        self.compact(completed_at)
+
+    def _unindex(self, record: MeetingRecord):
+        for index, key in (
+            (self._by_type, record.type),
+            (self._by_department, record.department)
+        ):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(record.id)
+                if not ids:
+                    del index[key]
+        for participant in record.participants:
+            ids = self._by_participant.get(participant)
+            if ids is not None:
+                ids.discard(record.id)
+                if not ids:
+                    del self._by_participant[participant]
+
+        position = bisect.bisect_left(self._by_time, (record.scheduled_time, record.id))
+        if position < len(self._by_time) and self._by_time[position][1] == record.id:
+            del self._by_time[position]
+
+    def compact(self, now: Optional[datetime] = None, limit: Optional[int] = None) -> int:
+        """Süresi dolan transcript'leri özet katmanına taşı, çok eski özetleri sil"""
+        now = now or get_clock().now()
+        limit = self.compaction_batch if limit is None else limit
+        processed = 0
+
+        if self.transcript_ttl is not None:
+            cutoff = now - self.transcript_ttl
+            while self._full_queue and self._full_queue[0][0] <= cutoff and processed < limit:
+                _, meeting_id = self._full_queue.popleft()
+                record = self._records.get(meeting_id)
+                if record is not None and not isinstance(record, MeetingDigest):
+                    self._records[meeting_id] = MeetingDigest.from_meeting(record)
+                    self.metrics["compacted"] += 1
+                processed += 1
+
+        if self.retention is not None:
+            cutoff = now - self.retention
+            while self._history and self._history[0][0] <= cutoff and processed < limit:
+                _, meeting_id = self._history.popleft()
+                record = self._records.pop(meeting_id, None)
+                if record is not None:
+                    self._unindex(record)
+                    self.metrics["expired"] += 1
+                processed += 1
+
+            # Silinen kayıtlar tam katman kuyruğunda kalmasın
+            while self._full_queue and self._full_queue[0][1] not in self._records:
+                self._full_queue.popleft()
+
+        if processed:
+            logger.debug(f"🗜️  Toplantı deposu bakımı: {processed} kayıt işlendi")
+        return processed
+
+    def get(self, meeting_id: str) -> Optional[MeetingRecord]:
+        """Kimlikle O(1) erişim"""
+        return self._records.get(meeting_id)
+
+    def _ids_in_range(self, start: Optional[datetime], end: Optional[datetime]) -> Iterable[str]:
+        low = 0 if start is None else bisect.bisect_left(self._by_time, (start, ""))
+        if end is None:
+            high = len(self._by_time)
+        else:
+            # Aynı zamanlı tüm kimlikleri kapsamak için zamandan sonraki ilk konum
+            high = bisect.bisect_left(self._by_time, (end + timedelta(microseconds=1), ""))
+        return (meeting_id for _, meeting_id in self._by_time[low:high])
+
+    def find(
+        self,
+        type: Optional[str] = None,
+        department: Optional[str] = None,
+        participant: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[MeetingRecord]:
+        """İndeksler üzerinden toplantı sorgula - sonuçlar zamana göre sıralı"""
+        candidates: Optional[Set[str]] = None
+        for index, key in (
+            (self._by_type, type),
+            (self._by_department, department),
+            (self._by_participant, participant)
+        ):
+            if key is None:
+                continue
+            ids = index.get(key, set())
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+
+        if status == "scheduled":
+            candidates = self._upcoming if candidates is None else candidates & self._upcoming
+
+        if candidates is None:
+            ordered_ids = list(self._ids_in_range(start, end))
+        else:
+            records = [self._records[meeting_id] for meeting_id in candidates]
+            ordered_ids = [
+                record.id for record in sorted(records, key=lambda r: (r.scheduled_time, r.id))
+                if (start is None or record.scheduled_time >= start)
+                and (end is None or record.scheduled_time <= end)
+            ]
+
+        results = []
+        for meeting_id in ordered_ids:
+            record = self._records[meeting_id]
+            if status is not None and record.status != status:
+                continue
+            results.append(record)
+        if limit is not None:
+            results = results[-limit:] if limit else []
+        return results
+
+    def upcoming(self) -> List[MeetingRecord]:
+        """Henüz yapılmamış toplantılar - sadece bekleyen küme taranır"""
+        records = [self._records[meeting_id] for meeting_id in self._upcoming]
+        return sorted(
+            (r for r in records if r.status == "scheduled"),
+            key=lambda r: r.scheduled_time
+        )
+
+    def history(self, limit: int = 10) -> List[MeetingRecord]:
+        """Son tamamlanan toplantılar (tamamlanma sırasıyla)"""
+        if limit <= 0:
+            return []
+        recent = list(itertools.islice(reversed(self._history), limit))
+        return [self._records[meeting_id] for _, meeting_id in reversed(recent)]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Depo istatistikleri"""
+        return {
+            "total": len(self._records),
+            "upcoming": len(self._upcoming),
+            "completed": len(self._history),
+            "full_transcripts": len(self._full_queue),
+            **self.metrics
+        }
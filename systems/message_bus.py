@@ -0,0 +1,370 @@
+"""
+Message Bus - Topic tabanlı pub/sub mesaj yolu
+
+Her mesaj bir topic log'una yalnızca bir kez yazılır. Aboneler mesajın
+kopyasını almaz; her abone topic başına bir okuma offset'i tutar. Böylece
+bir yayın, alıcı sayısından bağımsız olarak O(1) maliyetle yazılır ve
+sadece bekleyen aboneler uyandırılır.
+
+Topic log'ları sabit boyutlu segmentlerde tutulur. Sayı veya yaş bazlı
+saklama politikası eski segmentleri bellekten atar (isteğe bağlı olarak
+sıkıştırılmış dosyalara arşivler), böylece uzun çalışmalarda kanal başına
+bellek sabit kalır. Geride kalan bir abonenin okumadığı segmentler atılırsa
+cursor'ı ileri alınır; atlanan kayıtlar abone başına dropped_unread
+metriğinde sayılır ve loglanır.
+"""
+from typing import List, Dict, Optional, Set, FrozenSet, Tuple
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+import asyncio
+import gzip
+import json
+from agents.base_agent import Message
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+# (mesaj, hedef kitle) - hedef kitle None ise tüm abonelere açık
+LogEntry = Tuple[Message, Optional[FrozenSet[str]]]
+
+
+class _Segment:
+    """Sabit boyutlu log segmenti"""
+
+    __slots__ = ("base_offset", "entries")
+
+    def __init__(self, base_offset: int):
+        self.base_offset = base_offset
+        self.entries: List[LogEntry] = []
+
+    @property
+    def last_timestamp(self) -> Optional[datetime]:
+        return self.entries[-1][0].timestamp if self.entries else None
+
+
+class InvalidCursor(ValueError):
+    """Sayfalama cursor'ı bu topic için geçerli bir offset değil"""
+
+
+@dataclass
+class MessagePage:
+    """Cursor tabanlı sayfalama sonucu"""
+    messages: List[Message]
+    next_cursor: Optional[str]
+    # Cursor saklanan aralıktan eskiydi; aradaki mesajlar atlandı
+    truncated: bool = False
+    skipped: int = 0
+
+
+class TopicLog:
+    """Segmentli, saklama politikalı append-only topic log'u"""
+
+    def __init__(
+        self,
+        name: str,
+        segment_size: int = 256,
+        max_segments: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+        archive_dir: Optional[Path] = None
+    ):
+        self.name = name
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self.max_age = max_age
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self._segments: deque = deque([_Segment(0)])
+        self._archived_segments: List[int] = []  # arşivlenen segmentlerin base offset'leri
+
+    @property
+    def start_offset(self) -> int:
+        """Bellekte tutulan en eski kaydın offset'i"""
+        return self._segments[0].base_offset
+
+    @property
+    def end_offset(self) -> int:
+        """Bir sonraki yazılacak kaydın offset'i"""
+        last = self._segments[-1]
+        return last.base_offset + len(last.entries)
+
+    def append(self, message: Message, audience: Optional[FrozenSet[str]] = None) -> int:
+        """Mesajı log'a ekle ve offset'ini döndür"""
+        last = self._segments[-1]
+        if len(last.entries) >= self.segment_size:
+            last = _Segment(self.end_offset)
+            self._segments.append(last)
+            self._apply_retention(message.timestamp)
+
+        last.entries.append((message, audience))
+        return last.base_offset + len(last.entries) - 1
+
+    def _apply_retention(self, now: datetime):
+        """Saklama politikasına göre eski segmentleri at (aktif segment hariç)"""
+        while len(self._segments) > 1:
+            oldest = self._segments[0]
+            too_many = self.max_segments is not None and len(self._segments) > self.max_segments
+            too_old = (
+                self.max_age is not None
+                and oldest.last_timestamp is not None
+                and now - oldest.last_timestamp > self.max_age
+            )
+            if not (too_many or too_old):
+                break
+
+            self._segments.popleft()
+            if self.archive_dir:
+                self._archive_segment(oldest)
+
+    def _archive_path(self, base_offset: int) -> Path:
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in self.name)
+        return self.archive_dir / f"{safe_name}-{base_offset:012d}.jsonl.gz"
+
+    def _archive_segment(self, segment: _Segment):
+        """Segmenti sıkıştırılmış JSON lines dosyasına yaz"""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self._archive_path(segment.base_offset), "wt", encoding="utf-8") as f:
+            for message, audience in segment.entries:
+                f.write(json.dumps({
+                    "message": message.model_dump(mode="json"),
+                    "audience": sorted(audience) if audience is not None else None
+                }) + "\n")
+        self._archived_segments.append(segment.base_offset)
+
+    def _load_archived(self, base_offset: int) -> List[LogEntry]:
+        """Arşivlenmiş segmenti diskten oku"""
+        entries = []
+        with gzip.open(self._archive_path(base_offset), "rt", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                audience = record["audience"]
+                entries.append((
+                    Message(**record["message"]),
+                    frozenset(audience) if audience is not None else None
+                ))
+        return entries
+
+    def read_from(self, offset: int, limit: Optional[int] = None) -> List[LogEntry]:
+        """Offset'ten itibaren bellekteki kayıtları oku (atılmış kayıtlar atlanır)"""
+        offset = max(offset, self.start_offset)
+        end = self.end_offset if limit is None else min(self.end_offset, offset + limit)
+        if offset >= end:
+            return []
+
+        # Aktif segment hariç tüm segmentler dolu - segment indeksi O(1) hesaplanır
+        index = (offset - self.start_offset) // self.segment_size
+        entries: List[LogEntry] = []
+        while offset < end:
+            segment = self._segments[index]
+            local_start = offset - segment.base_offset
+            local_end = min(len(segment.entries), end - segment.base_offset)
+            entries.extend(segment.entries[local_start:local_end])
+            offset = segment.base_offset + local_end
+            index += 1
+        return entries
+
+    def read_page(self, cursor: Optional[str] = None, limit: int = 50) -> MessagePage:
+        """Cursor'dan itibaren bir sayfa mesaj oku - cursor yoksa en eski kayıttan başlar"""
+        # Okunabilen en eski kayıt: arşiv varsa onun başı, yoksa bellekteki ilk kayıt
+        earliest = self._archived_segments[0] if self._archived_segments else self.start_offset
+        offset, skipped = earliest, 0
+        if cursor is not None:
+            offset = self._parse_cursor(cursor)
+            if offset < earliest:
+                skipped, offset = earliest - offset, earliest
+                logger.debug(f"{self.name}: cursor {cursor} saklanan aralıktan eski, {skipped} mesaj atlandı")
+
+        entries: List[LogEntry] = []
+        if offset < self.start_offset and self.archive_dir:
+            # Disk arşivinden oku - arşivlenen segmentler her zaman dolu ve ardışıktır
+            for base_offset in self._archived_segments:
+                if base_offset + self.segment_size <= offset:
+                    continue
+                archived = self._load_archived(base_offset)
+                start = max(0, offset - base_offset)
+                chunk = archived[start:start + limit - len(entries)]
+                entries.extend(chunk)
+                offset = base_offset + start + len(chunk)
+                if len(entries) >= limit:
+                    break
+
+        if len(entries) < limit:
+            offset = max(offset, self.start_offset)
+            memory_entries = self.read_from(offset, limit - len(entries))
+            entries.extend(memory_entries)
+            offset += len(memory_entries)
+
+        next_cursor = str(offset) if offset < self.end_offset else None
+        return MessagePage(
+            messages=[message for message, _ in entries],
+            next_cursor=next_cursor,
+            truncated=skipped > 0,
+            skipped=skipped
+        )
+
+    def _parse_cursor(self, cursor: str) -> int:
+        """Cursor'ı offset'e çevir - tam sayı olmayan ya da aralık dışı değerleri reddet"""
+        try:
+            offset = int(cursor)
+        except (TypeError, ValueError):
+            raise InvalidCursor(f"Geçersiz cursor: {cursor!r} (tam sayı offset bekleniyor)") from None
+        if offset < 0 or offset > self.end_offset:
+            raise InvalidCursor(f"Geçersiz cursor: {cursor!r} ({self.name} için 0-{self.end_offset} aralığında olmalı)")
+        return offset
+
+    def tail(self, limit: int) -> List[Message]:
+        """Bellekteki en son mesajlar"""
+        return [message for message, _ in self.read_from(self.end_offset - limit)]
+
+    def __len__(self) -> int:
+        """Bellekte tutulan kayıt sayısı"""
+        return self.end_offset - self.start_offset
+
+
+class MessageBus:
+    """Topic log'ları ve abone offset'lerini yöneten pub/sub yolu"""
+
+    def __init__(
+        self,
+        segment_size: int = 256,
+        max_segments: Optional[int] = 8,
+        max_age: Optional[timedelta] = None,
+        archive_dir: Optional[Path] = None
+    ):
+        # Yeni topic'ler için varsayılan saklama politikası
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self.max_age = max_age
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+
+        self.topics: Dict[str, TopicLog] = {}
+        self._offsets: Dict[str, Dict[str, int]] = {}  # abone -> topic -> offset
+        # abone -> saklama politikası yüzünden okunmadan atılan kayıt sayısı
+        self.dropped_unread: Dict[str, int] = {}
+        self._topic_waiters: Dict[str, Set[asyncio.Event]] = {}  # topic -> bekleyenler
+
+    def create_topic(self, name: str) -> TopicLog:
+        """Topic oluştur (varsa mevcut olanı döndür)"""
+        if name not in self.topics:
+            self.topics[name] = TopicLog(
+                name,
+                segment_size=self.segment_size,
+                max_segments=self.max_segments,
+                max_age=self.max_age,
+                archive_dir=self.archive_dir
+            )
+        return self.topics[name]
+
+    def subscribe(self, subscriber: str, topic: str, from_beginning: bool = False):
+        """Aboneyi topic'e bağla - varsayılan olarak sadece yeni mesajları görür"""
+        log = self.create_topic(topic)
+        offsets = self._offsets.setdefault(subscriber, {})
+        if topic not in offsets:
+            offsets[topic] = 0 if from_beginning else log.end_offset
+
+    def unsubscribe(self, subscriber: str, topic: str):
+        """Aboneliği kaldır"""
+        self._offsets.get(subscriber, {}).pop(topic, None)
+
+    def get_subscriptions(self, subscriber: str) -> List[str]:
+        """Abonenin bağlı olduğu topic'ler"""
+        return list(self._offsets.get(subscriber, {}).keys())
+
+    def publish(
+        self,
+        topic: str,
+        message: Message,
+        audience: Optional[List[str]] = None
+    ) -> int:
+        """Mesajı topic'e bir kez yaz ve bekleyen aboneleri uyandır"""
+        log = self.create_topic(topic)
+        offset = log.append(message, frozenset(audience) if audience is not None else None)
+
+        waiters = self._topic_waiters.pop(topic, None)
+        if waiters:
+            for event in waiters:
+                event.set()
+
+        return offset
+
+    def _collect(self, subscriber: str, topic: str, advance: bool) -> List[Message]:
+        """Abonenin okunmamış mesajlarını topla"""
+        offsets = self._offsets.get(subscriber, {})
+        if topic not in offsets or topic not in self.topics:
+            return []
+
+        log = self.topics[topic]
+        if offsets[topic] < log.start_offset:
+            # Okunmamış segmentler saklama politikasıyla atılmış - cursor ileri alınır
+            skipped = log.start_offset - offsets[topic]
+            self.dropped_unread[subscriber] = self.dropped_unread.get(subscriber, 0) + skipped
+            offsets[topic] = log.start_offset
+            logger.warning(f"⚠️ {subscriber}: {topic} üzerinde {skipped} okunmamış mesaj saklama politikasıyla atıldı")
+        entries = log.read_from(offsets[topic])
+        if advance:
+            offsets[topic] = log.end_offset
+
+        return [
+            message for message, audience in entries
+            if message.from_agent != subscriber
+            and (audience is None or subscriber in audience)
+        ]
+
+    def poll(self, subscriber: str, topic: Optional[str] = None) -> List[Message]:
+        """Okunmamış mesajları al ve offset'leri ilerlet"""
+        topics = [topic] if topic else self.get_subscriptions(subscriber)
+        messages = []
+        for name in topics:
+            messages.extend(self._collect(subscriber, name, advance=True))
+        return messages
+
+    def peek(self, subscriber: str, topic: Optional[str] = None) -> List[Message]:
+        """Okunmamış mesajları offset'leri ilerletmeden al"""
+        topics = [topic] if topic else self.get_subscriptions(subscriber)
+        messages = []
+        for name in topics:
+            messages.extend(self._collect(subscriber, name, advance=False))
+        return messages
+
+    def lag(self, subscriber: str) -> int:
+        """Abonenin henüz okumadığı kayıt sayısı (hedef kitle filtresi öncesi)"""
+        return sum(
+            self.topics[topic].end_offset - max(offset, self.topics[topic].start_offset)
+            for topic, offset in self._offsets.get(subscriber, {}).items()
+            if topic in self.topics
+        )
+
+    async def wait(self, subscriber: str, timeout: Optional[float] = None) -> bool:
+        """Abonenin görebileceği yeni bir mesaj gelene kadar bekle"""
+        topics = self.get_subscriptions(subscriber)
+        if not topics:
+            return False
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while True:
+            if self.lag(subscriber) > 0:
+                if self.peek(subscriber):
+                    return True
+                # Sadece aboneye görünmeyen kayıtlar var, offset'leri atla
+                self.poll(subscriber)
+
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+
+            event = asyncio.Event()
+            for topic in topics:
+                self._topic_waiters.setdefault(topic, set()).add(event)
+
+            try:
+                await asyncio.wait_for(event.wait(), remaining)
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                for topic in topics:
+                    waiters = self._topic_waiters.get(topic)
+                    if waiters:
+                        waiters.discard(event)
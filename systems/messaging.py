@@ -1,38 +1,63 @@
 """
 Messaging System - Departmanlar arası mesajlaşma sistemi
 """
-from typing import List, Dict, Optional
-from datetime import datetime
-from pydantic import BaseModel
+from typing import List, Dict, Optional, Set, Tuple
+from datetime import datetime, timedelta
+from pathlib import Path
+from enum import Enum
+from pydantic import BaseModel, Field
 import asyncio
+import heapq
 from agents.base_agent import Message
 from agents.ai_agent import AIAgent
+from systems.message_bus import MessageBus, MessagePage
+from utils.ids import new_id
+from utils.clock import get_clock
 
 
 
 import logging
 logger = logging.getLogger(__name__)
 class Channel(BaseModel):
-    """Mesajlaşma kanalı"""
+    """Mesajlaşma kanalı - mesajlar bus üzerindeki segmentli topic log'unda tutulur"""
     id: str
     name: str
     type: str  # department, project, direct, general
     members: List[str]
-    messages: List[Message] = []
-    created_at: datetime = datetime.now()
+    created_at: datetime = Field(default_factory=lambda: get_clock().now())
 
 
 class MessagingSystem:
     """İletişim ve mesajlaşma sistemi"""
     
-    def __init__(self):
+    BROADCAST_TOPIC = "broadcast"
+    
+    def __init__(
+        self,
+        segment_size: int = 256,
+        max_segments: Optional[int] = 8,
+        max_age: Optional[timedelta] = None,
+        archive_dir: Optional[Path] = None
+    ):
         self.channels: Dict[str, Channel] = {}
         self.direct_messages: List[Message] = []
         self.agents: Dict[str, AIAgent] = {}
+        self.bus = MessageBus(
+            segment_size=segment_size,
+            max_segments=max_segments,
+            max_age=max_age,
+            archive_dir=archive_dir
+        )
+        self.bus.create_topic(self.BROADCAST_TOPIC)
     
     def register_agent(self, agent: AIAgent):
         """Agentı sisteme kaydet"""
         self.agents[agent.name] = agent
+        self.bus.subscribe(agent.name, self.BROADCAST_TOPIC)
+        agent.attach_message_feed(
+            lambda: self.fetch_bus_messages(agent.name),
+            lambda: len(self.bus.peek(agent.name))
+        )
     
     def create_channel(
         self,
@@ -42,13 +67,19 @@ class MessagingSystem:
     ) -> Channel:
         """Yeni kanal oluştur"""
         channel = Channel(
-            id=f"channel_{len(self.channels)}",
+            id=new_id("channel"),
             name=name,
             type=channel_type,
             members=members
         )
         
         self.channels[channel.id] = channel
+        
+        # Kanal bir topic log'u ile desteklenir, üyeler offset tutar
+        self.bus.create_topic(channel.id)
+        for member_name in members:
+            self.bus.subscribe(member_name, channel.id)
+        
         logger.info(f"📢 Yeni kanal oluşturuldu: {name}")
         return channel
     
@@ -83,19 +114,15 @@ class MessagingSystem:
         channel = self.channels[channel_id]
         
         message = Message(
-            id=f"msg_{datetime.now().timestamp()}",
+            id=new_id("msg"),
             from_agent=from_agent.name,
             to_agent=channel.name,
             subject=f"Message in {channel.name}",
             content=content
         )
         
-        channel.messages.append(message)
-        
-        # Kanal üyelerine bildir
-        for member_name in channel.members:
-            if member_name in self.agents and member_name != from_agent.name:
-                await self.agents[member_name].receive_message(message)
+        # Kanal üyeleri mesajı kendi offset'lerinden okur
+        self.bus.publish(channel.id, message)
         
         return message
     
@@ -106,29 +133,75 @@ class MessagingSystem:
         content: str,
         recipients: List[str] = None
     ):
-        """Toplu mesaj gönder"""
-        if recipients is None:
-            recipients = list(self.agents.keys())
-        
-        for recipient_name in recipients:
-            if recipient_name != from_agent.name:
-                await self.send_message(from_agent, recipient_name, subject, content)
+        """Toplu mesaj gönder - mesaj bir kez yazılır, alıcılar offset ile okur"""
+        message = await from_agent.send_message(self.BROADCAST_TOPIC, subject, content)
+        self.bus.publish(self.BROADCAST_TOPIC, message, audience=recipients)
         
         logger.info(f"📣 {from_agent.name} toplu mesaj gönderdi: {subject}")
+        return message
     
-    def get_channel_messages(self, channel_id: str) -> List[Message]:
-        """Kanal mesajlarını al"""
+    def get_channel_messages(self, channel_id: str, limit: Optional[int] = None) -> List[Message]:
+        """Kanalın bellekte tutulan (en son) mesajlarını al"""
         if channel_id in self.channels:
-            return self.channels[channel_id].messages
+            log = self.bus.topics[channel_id]
+            return log.tail(limit if limit is not None else len(log))
         return []
     
+    def get_channel_page(
+        self,
+        channel_id: str,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> MessagePage:
+        """Kanal mesajlarını cursor ile sayfa sayfa oku"""
+        if channel_id not in self.channels:
+            return MessagePage(messages=[], next_cursor=None)
+        return self.bus.topics[channel_id].read_page(cursor, limit)
+    
     def get_unread_messages(self, agent_name: str) -> List[Message]:
-        """Okunmamış mesajları al"""
+        """Okunmamış mesajları al (direkt + kanal/toplu mesajlar)"""
         if agent_name in self.agents:
             agent = self.agents[agent_name]
-            return [m for m in agent.memory.messages_received if not m.read]
+            return agent.inbox.peek() + self.bus.peek(agent_name)
         return []
     
+    def fetch_bus_messages(self, agent_name: str) -> List[Message]:
+        """Kanal/toplu mesajları al ve okuma offset'lerini ilerlet"""
+        return self.bus.poll(agent_name)
+    
+    async def wait_for_messages(self, agent_name: str, timeout: Optional[float] = None) -> bool:
+        """Agent'ın topic'lerine yeni mesaj gelene kadar bekle"""
+        return await self.bus.wait(agent_name, timeout)
+    
+    def get_mailbox_metrics(self) -> Dict:
+        """Agent ve departman bazında kutu derinliği ve atılma metrikleri"""
+        agents = {}
+        departments: Dict[str, Dict] = {}
+        
+        for name, agent in self.agents.items():
+            metrics = agent.get_mailbox_metrics()
+            agents[name] = metrics
+            
+            dept = departments.setdefault(agent.department, {
+                "agents": 0, "depth": 0, "max_depth": 0,
+                "dropped": 0, "coalesced": 0, "blocked": 0, "dropped_unread": 0
+            })
+            dept["agents"] += 1
+            for box in metrics.values():
+                dept["depth"] += box["depth"]
+                dept["max_depth"] = max(dept["max_depth"], box["max_depth"])
+                dept["dropped"] += box["dropped"]
+                dept["coalesced"] += box["coalesced"]
+                dept["blocked"] += box["blocked"]
+            # Mesaj yolunda okunmadan atılanlar (kutu dışında, abone cursor'ı üzerinden)
+            dept["dropped_unread"] += self.bus.dropped_unread.get(name, 0)
+        
+        return {
+            "agents": agents,
+            "departments": departments,
+            "bus_dropped_unread": dict(self.bus.dropped_unread)
+        }
+    
     def create_department_channels(self, departments: Dict[str, List[AIAgent]]):
         """Departman kanallarını oluştur"""
         for dept_name, agents in departments.items():
@@ -147,19 +220,114 @@ class MessagingSystem:
         )
 
 
+class CollaborationStatus(str, Enum):
+    """İş birliği yaşam döngüsü"""
+    ACTIVE = "active"
+    CLOSED = "closed"
+    EXPIRED = "expired"
+
+
+class Collaboration(BaseModel):
+    """İş birliği kaydı"""
+    id: str
+    initiator: str
+    collaborator: str
+    topic: str
+    started_at: datetime
+    expires_at: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
+    status: CollaborationStatus = CollaborationStatus.ACTIVE
+    plan: Optional[str] = None
+
+
 class CollaborationSystem:
     """İş birliği ve koordinasyon sistemi"""
     
-    def __init__(self, messaging: MessagingSystem):
+    def __init__(self, messaging: MessagingSystem, default_ttl: Optional[timedelta] = timedelta(hours=8)):
         self.messaging = messaging
-        self.active_collaborations: List[Dict] = []
+        self.default_ttl = default_ttl
+        
+        # id, katılımcı ve konu indeksleri
+        self.collaborations: Dict[str, Collaboration] = {}
+        self._by_participant: Dict[str, Set[str]] = {}
+        self._by_topic: Dict[str, Set[str]] = {}
+        self._active_ids: Set[str] = set()
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+    
+    @property
+    def active_collaborations(self) -> List[Dict]:
+        """Aktif iş birlikleri"""
+        self.expire_stale()
+        return [self.collaborations[cid].model_dump() for cid in self._active_ids]
+    
+    def _index(self, collaboration: Collaboration):
+        self.collaborations[collaboration.id] = collaboration
+        for participant in (collaboration.initiator, collaboration.collaborator):
+            self._by_participant.setdefault(participant, set()).add(collaboration.id)
+        self._by_topic.setdefault(collaboration.topic.lower(), set()).add(collaboration.id)
+        self._active_ids.add(collaboration.id)
+        if collaboration.expires_at:
+            heapq.heappush(self._expiry_heap, (collaboration.expires_at, collaboration.id))
+    
+    def expire_stale(self, now: Optional[datetime] = None) -> List[str]:
+        """Süresi dolan aktif iş birliklerini EXPIRED olarak işaretle"""
+        now = now or get_clock().now()
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, collab_id = heapq.heappop(self._expiry_heap)
+            collaboration = self.collaborations[collab_id]
+            if collaboration.status == CollaborationStatus.ACTIVE:
+                collaboration.status = CollaborationStatus.EXPIRED
+                collaboration.closed_at = now
+                self._active_ids.discard(collab_id)
+                expired.append(collab_id)
+        return expired
+    
+    def close_collaboration(self, collab_id: str) -> bool:
+        """İş birliğini kapat"""
+        collaboration = self.collaborations.get(collab_id)
+        if not collaboration or collaboration.status != CollaborationStatus.ACTIVE:
+            return False
+        collaboration.status = CollaborationStatus.CLOSED
+        collaboration.closed_at = get_clock().now()
+        self._active_ids.discard(collab_id)
+        return True
+    
+    def get_collaboration(self, collab_id: str) -> Optional[Collaboration]:
+        """Id ile iş birliği al"""
+        self.expire_stale()
+        return self.collaborations.get(collab_id)
+    
+    def find_collaborations(
+        self,
+        participant: Optional[str] = None,
+        topic: Optional[str] = None,
+        status: Optional[CollaborationStatus] = None
+    ) -> List[Collaboration]:
+        """Katılımcı, konu ve duruma göre iş birliklerini bul"""
+        self.expire_stale()
+        
+        candidates: Optional[Set[str]] = None
+        if participant is not None:
+            candidates = set(self._by_participant.get(participant, set()))
+        if topic is not None:
+            topic_ids = self._by_topic.get(topic.lower(), set())
+            candidates = topic_ids if candidates is None else candidates & topic_ids
+        if candidates is None:
+            candidates = self._active_ids if status == CollaborationStatus.ACTIVE else self.collaborations.keys()
+        
+        results = [self.collaborations[cid] for cid in candidates]
+        if status is not None:
+            results = [c for c in results if c.status == status]
+        return sorted(results, key=lambda c: c.id)
     
     async def initiate_collaboration(
         self,
         initiator: AIAgent,
         collaborator_name: str,
         topic: str,
-        context: str
+        context: str,
+        ttl: Optional[timedelta] = None
     ) -> Dict:
         """İş birliği başlat"""
         logger.info(f"\n🤝 İş birliği başlatılıyor:")
@@ -178,17 +346,45 @@ class CollaborationSystem:
             f"{context}\n\n{initiator_plan}"
         )
         
-        collaboration = {
-            "id": f"collab_{datetime.now().timestamp()}",
-            "initiator": initiator.name,
-            "collaborator": collaborator_name,
-            "topic": topic,
-            "started_at": datetime.now(),
-            "status": "active"
-        }
+        started_at = get_clock().now()
+        ttl = ttl if ttl is not None else self.default_ttl
+        collaboration = Collaboration(
+            id=new_id("collab"),
+            initiator=initiator.name,
+            collaborator=collaborator_name,
+            topic=topic,
+            started_at=started_at,
+            expires_at=started_at + ttl if ttl else None,
+            plan=initiator_plan
+        )
+        
+        self.expire_stale(started_at)
+        self._index(collaboration)
+        return collaboration.model_dump()
+    
+    async def initiate_collaborations(self, requests: List[Dict]) -> List[Dict]:
+        """Birden çok iş birliğini eşzamanlı başlat
+        
+        Her istek initiate_collaboration argümanlarını içerir
+        (initiator, collaborator_name, topic, context, isteğe bağlı ttl).
+        LLM çağrıları paylaşılan eşzamanlılık sınırı altında çalışır.
+        """
+        results = await asyncio.gather(
+            *(self.initiate_collaboration(**request) for request in requests),
+            return_exceptions=True
+        )
+        
+        collaborations = []
+        for request, result in zip(requests, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"❌ İş birliği başlatılamadı: {request.get('topic')} - {result}"
+                )
+                continue
+            collaborations.append(result)
         
-        self.active_collaborations.append(collaboration)
-        return collaboration
+        logger.info(f"🤝 {len(collaborations)}/{len(requests)} iş birliği başlatıldı")
+        return collaborations
     
     async def cross_department_meeting(
         self,
@@ -220,5 +416,5 @@ class CollaborationSystem:
             "topic": topic,
             "departments": departments,
             "contributions": contributions,
-            "timestamp": datetime.now()
+            "timestamp": get_clock().now()
         }
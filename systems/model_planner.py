@@ -0,0 +1,235 @@
+"""
+Model Planner - Bütçe ve kapasite kısıtlı global model ataması
+
+Her rol için aday modeller arasından tam olarak biri seçilir (çoklu seçimli
+sırt çantası problemi). Değer, rolün günlük çağrı sayısı ile modelin rolün
+zorluğunu ne kadar karşıladığının çarpımıdır: min(yetenek, zorluk) x çağrı.
+Maliyet, çağrı başına token maliyetinin günlük toplamıdır.
+
+Çözüm açgözlü ilerler: her rol en ucuz seçenekle (demo/ücretsiz taban)
+başlar, ardından birim maliyet başına en çok değer kazandıran yükseltme
+heap'ten çekilir ve günlük bütçe ile provider hız sınırları izin verdiği
+sürece uygulanır. Baskın olmayan seçenekler (daha pahalı ama daha değerli)
+önceden ayıklandığı için binlerce rol milisaniyeler içinde planlanır.
+"""
+from typing import Dict, Iterable, List, Optional
+from dataclasses import dataclass, field
+import heapq
+import time
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Tier başına model yeteneği (rol zorluğu ile aynı 1-10 ölçeğinde)
+TIER_CAPABILITY = {"enterprise": 10, "pro": 8, "basic": 5, "demo": 1}
+
+# Tier başına tipik yanıt süresi (sn) - katalogda gecikme bilgisi yoksa
+TIER_LATENCY = {"enterprise": 4.0, "pro": 2.5, "basic": 1.0, "demo": 0.0}
+
+
+@dataclass
+class ModelOption:
+    """Planlamaya aday bir model"""
+    path: str                   # provider/model
+    tier: str
+    cost_per_1k: float          # 1k token başına maliyet
+    capability: int
+    latency: float = 0.0        # ortalama yanıt süresi (sn)
+
+    @property
+    def provider(self) -> str:
+        return self.path.split("/", 1)[0]
+
+
+@dataclass
+class RoleDemand:
+    """Bir rolün beklenen günlük LLM yükü"""
+    role: str
+    difficulty: int
+    agents: int = 1
+    calls_per_agent: float = 40.0
+    tokens_per_call: int = 1500
+    max_latency: Optional[float] = None
+
+    @property
+    def calls(self) -> float:
+        return self.agents * self.calls_per_agent
+
+
+@dataclass
+class PlannedModel:
+    """Bir rol için planlanan model"""
+    role: str
+    primary: str
+    fallback: str
+    tier: str
+    difficulty: int
+    daily_cost: float
+    value: float
+
+
+@dataclass
+class ModelPlan:
+    """Planlama sonucu"""
+    assignments: Dict[str, PlannedModel] = field(default_factory=dict)
+    daily_budget: Optional[float] = None
+    total_cost: float = 0.0
+    total_value: float = 0.0
+    max_value: float = 0.0
+    provider_calls: Dict[str, float] = field(default_factory=dict)
+    solve_ms: float = 0.0
+
+    @property
+    def quality(self) -> float:
+        """Ulaşılan değerin, her rolün en iyi modeli almasıyla oranı"""
+        return self.total_value / self.max_value if self.max_value else 1.0
+
+    def get(self, role: str) -> Optional[PlannedModel]:
+        return self.assignments.get(role)
+
+
+class ModelPlanner:
+    """Günlük bütçe ve provider hız sınırları altında kaliteyi en çoklayan atama"""
+
+    def __init__(
+        self,
+        models: Iterable[ModelOption],
+        daily_budget: Optional[float] = None,
+        rate_limits: Optional[Dict[str, float]] = None
+    ):
+        self.models = list(models)
+        self.daily_budget = daily_budget
+        # provider -> günlük en fazla çağrı (yoksa sınırsız)
+        self.rate_limits = rate_limits or {}
+
+    @staticmethod
+    def _value(demand: RoleDemand, model: ModelOption) -> float:
+        return demand.calls * min(model.capability, demand.difficulty)
+
+    @staticmethod
+    def _cost(demand: RoleDemand, model: ModelOption) -> float:
+        return demand.calls * demand.tokens_per_call / 1000 * model.cost_per_1k
+
+    def _options(self, demand: RoleDemand) -> List[tuple]:
+        """Rolün baskın olmayan seçenekleri - maliyete göre artan (maliyet, değer, model)"""
+        candidates = sorted(
+            (
+                (self._cost(demand, model), self._value(demand, model), model)
+                for model in self.models
+                if demand.max_latency is None or model.latency <= demand.max_latency
+            ),
+            key=lambda option: (option[0], -option[1])
+        )
+        options = []
+        for option in candidates:
+            if not options or option[1] > options[-1][1]:
+                options.append(option)
+        return options
+
+    def _fits(self, provider_calls: Dict[str, float], model: ModelOption, calls: float) -> bool:
+        limit = self.rate_limits.get(model.provider)
+        return limit is None or provider_calls.get(model.provider, 0.0) + calls <= limit
+
+    def plan(self, demands: Iterable[RoleDemand]) -> ModelPlan:
+        """Tüm roller için atamayı çöz"""
+        started = time.perf_counter()
+        demands = list(demands)
+        plan = ModelPlan(daily_budget=self.daily_budget)
+        provider_calls: Dict[str, float] = {}
+
+        options: Dict[str, List[tuple]] = {}
+        current: Dict[str, int] = {}
+        history: Dict[str, List[int]] = {}
+        by_role: Dict[str, RoleDemand] = {}
+
+        # Taban: kapasitesi yeten en ucuz seçenek
+        for demand in demands:
+            role_options = self._options(demand)
+            if not role_options:
+                logger.warning(f"⚠️ {demand.role} için uygun model yok")
+                continue
+            index = next(
+                (i for i, (_, _, model) in enumerate(role_options)
+                 if self._fits(provider_calls, model, demand.calls)),
+                0
+            )
+            cost, value, model = role_options[index]
+            provider_calls[model.provider] = provider_calls.get(model.provider, 0.0) + demand.calls
+            plan.total_cost += cost
+            plan.total_value += value
+            plan.max_value += role_options[-1][1]
+            options[demand.role] = role_options
+            current[demand.role] = index
+            history[demand.role] = [index]
+            by_role[demand.role] = demand
+
+        heap: List[tuple] = []
+        blocked: Dict[str, set] = {role: set() for role in options}
+
+        def push_best_upgrade(role: str):
+            role_options, at = options[role], current[role]
+            cost, value, _ = role_options[at]
+            best = None
+            for j in range(at + 1, len(role_options)):
+                if j in blocked[role]:
+                    continue
+                extra_cost = role_options[j][0] - cost
+                gain = role_options[j][1] - value
+                ratio = gain / extra_cost if extra_cost > 0 else float("inf")
+                if best is None or ratio > best[0]:
+                    best = (ratio, j)
+            if best:
+                heapq.heappush(heap, (-best[0], role, at, best[1]))
+
+        for role in options:
+            push_best_upgrade(role)
+
+        while heap:
+            _, role, at, target = heapq.heappop(heap)
+            if current[role] != at:
+                continue  # eskimiş aday
+            demand = by_role[role]
+            old_cost, old_value, old_model = options[role][at]
+            new_cost, new_value, new_model = options[role][target]
+
+            within_budget = (
+                self.daily_budget is None
+                or plan.total_cost + new_cost - old_cost <= self.daily_budget + 1e-9
+            )
+            same_provider = new_model.provider == old_model.provider
+            has_capacity = same_provider or self._fits(provider_calls, new_model, demand.calls)
+            if not (within_budget and has_capacity):
+                blocked[role].add(target)
+                push_best_upgrade(role)
+                continue
+
+            provider_calls[old_model.provider] -= demand.calls
+            provider_calls[new_model.provider] = provider_calls.get(new_model.provider, 0.0) + demand.calls
+            plan.total_cost += new_cost - old_cost
+            plan.total_value += new_value - old_value
+            current[role] = target
+            history[role].append(target)
+            push_best_upgrade(role)
+
+        for role, at in current.items():
+            cost, value, model = options[role][at]
+            # Yedek: yükseltme zincirinde bir önceki (daha ucuz) seçenek
+            previous = history[role][-2] if len(history[role]) > 1 else at
+            plan.assignments[role] = PlannedModel(
+                role=role,
+                primary=model.path,
+                fallback=options[role][previous][2].path,
+                tier=model.tier,
+                difficulty=by_role[role].difficulty,
+                daily_cost=cost,
+                value=value
+            )
+
+        plan.provider_calls = {p: calls for p, calls in provider_calls.items() if calls}
+        plan.solve_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"🧮 Model planı: {len(plan.assignments)} rol, günlük ${plan.total_cost:.2f}"
+            f" / kalite %{plan.quality * 100:.0f} ({plan.solve_ms:.1f} ms)"
+        )
+        return plan
@@ -0,0 +1,111 @@
+"""
+Output Policy - Çağrı tipine göre çıktı uzunluğu ve max_tokens politikası
+
+Gecikmenin en büyük kısmı yanıt üretimidir. Standup katkısı, iş birliği
+notu ya da karar gibi çağrılar uzun yanıt gerektirmez; yine de promptlar
+"detaylı" yanıt istediği ve max_tokens verilmediği için uzun çıktı üretir.
+
+Politika tablosu çağrı tipine göre bir token sınırı ve kısalık talimatı
+verir; rolün tier'ı ve görev önceliği bu sınırı çarpanlarla ölçekler.
+Her politika için kesilme (max_tokens'a takılma) oranı ve gecikme
+tutulur, böylece çıktı boyu gecikme ve maliyet ayarı olarak kullanılabilir.
+"""
+from typing import Dict, List, Optional
+from collections import deque
+from dataclasses import dataclass
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class OutputPolicy:
+    """Bir çağrıya uygulanacak çıktı sınırı"""
+    name: str
+    max_tokens: int
+    brevity: str
+
+    def apply(self, messages: List) -> List:
+        """Kısalık talimatını son mesaja ekle (mesaj tipi korunur)"""
+        if not messages or not self.brevity:
+            return messages
+        last = messages[-1]
+        content = f"{getattr(last, 'content', '')}\n\nUzunluk: {self.brevity}"
+        return list(messages[:-1]) + [type(last)(content=content)]
+
+
+# Çağrı tipi -> (taban max_tokens, kısalık talimatı)
+POLICY_TABLE = {
+    "general": (500, "En fazla 250 kelime."),
+    "task": (800, "Sonucu ve kritik adımları ver; en fazla 400 kelime."),
+    "meeting_contribution": (200, "3-5 kısa madde, en fazla 100 kelime."),
+    "meeting_synthesis": (900, "Her katılımcı için 1-2 cümle."),
+    "decision": (400, "Yalnızca istenen JSON; her alan kısa olsun."),
+    "collaboration": (300, "3 kısa madde, en fazla 150 kelime."),
+    "team_review": (600, "Başlık başına 2-3 madde."),
+    "sprint_planning": (900, "Başlık başına en fazla 5 madde."),
+    "strategic_decision": (900, "Başlık başına 2-4 madde, en fazla 450 kelime."),
+    "quarterly_review": (1000, "Başlık başına 2-4 madde, en fazla 500 kelime.")
+}
+
+TIER_MULTIPLIER = {"enterprise": 1.25, "pro": 1.0, "basic": 0.75, "demo": 1.0}
+PRIORITY_MULTIPLIER = {"low": 0.75, "medium": 1.0, "high": 1.25, "critical": 1.5}
+
+
+def is_truncated(response) -> bool:
+    """Yanıt token sınırına takılarak mı bitti? (OpenAI, Anthropic ve Google alanları)"""
+    metadata = getattr(response, "response_metadata", None) or {}
+    reason = metadata.get("finish_reason") or metadata.get("stop_reason") or ""
+    return str(reason).lower() in ("length", "max_tokens")
+
+
+class PolicyStats:
+    """Bir politikanın kesilme oranı ve gecikmesi"""
+
+    def __init__(self, window: int = 200):
+        self.calls = 0
+        self.truncated = 0
+        self.latencies: deque = deque(maxlen=window)
+
+    def to_dict(self) -> Dict:
+        ordered = sorted(self.latencies)
+        return {
+            "calls": self.calls,
+            "truncated": self.truncated,
+            "truncation_rate": self.truncated / self.calls if self.calls else 0.0,
+            "avg_latency": sum(ordered) / len(ordered) if ordered else 0.0,
+            "p50_latency": ordered[len(ordered) // 2] if ordered else 0.0
+        }
+
+
+class OutputPolicyEngine:
+    """Çağrı tipi, tier ve öncelikten çıktı politikasını seçer ve sonuçlarını izler"""
+
+    def __init__(self, overrides: Optional[Dict[str, int]] = None, min_tokens: int = 64):
+        # Çağrı tipi -> taban max_tokens (config ile ayarlanabilir)
+        self.overrides = overrides or {}
+        self.min_tokens = min_tokens
+        self.stats: Dict[str, PolicyStats] = {}
+
+    def resolve(self, kind: str, tier: Optional[str] = None, priority: Optional[str] = None) -> OutputPolicy:
+        base, brevity = POLICY_TABLE.get(kind, POLICY_TABLE["general"])
+        base = self.overrides.get(kind, base)
+        tier = tier or "pro"
+        priority = priority or "medium"
+        max_tokens = int(base * TIER_MULTIPLIER.get(tier, 1.0) * PRIORITY_MULTIPLIER.get(priority, 1.0))
+        return OutputPolicy(
+            name=f"{kind}/{tier}/{priority}",
+            max_tokens=max(max_tokens, self.min_tokens),
+            brevity=brevity
+        )
+
+    def record(self, policy: OutputPolicy, latency: float, response):
+        stats = self.stats.setdefault(policy.name, PolicyStats())
+        stats.calls += 1
+        stats.latencies.append(latency)
+        if is_truncated(response):
+            stats.truncated += 1
+
+    def get_stats(self) -> Dict[str, Dict]:
+        return {name: stats.to_dict() for name, stats in sorted(self.stats.items())}
@@ -0,0 +1,83 @@
+"""
+Simulated Provider - Gecikmesi, hata oranı ve kalitesi ayarlanabilir sahte LLM
+
+Router politikalarını ve kalite izlemeyi API anahtarı olmadan, sanal saatle
+saniyeler içinde denemek için kullanılır. Gecikme saat üzerinden beklenir;
+hata oranı ve kalite çalışma anında değiştirilebilir (degrade), böylece bir
+modelin bozulması ve trafiğin ondan uzaklaşması simüle edilebilir.
+
+output_tokens verilirse üretim süresi token sayısıyla büyür ve max_tokens
+sınırını aşan yanıtlar kesilir (finish_reason='length').
+"""
+from typing import Dict, Optional
+from dataclasses import dataclass, field
+import random
+
+from utils.clock import get_clock
+
+
+@dataclass
+class SimulatedMessage:
+    """LangChain AIMessage ile aynı alanları taşıyan hafif yanıt"""
+    content: str
+    response_metadata: Dict = field(default_factory=dict)
+
+
+class SimulatedError(RuntimeError):
+    """Simüle edilmiş provider hatası"""
+
+
+class SimulatedLLM:
+    """Ayarlanabilir gecikme, hata oranı ve kaliteyle yanıt veren LLM"""
+
+    def __init__(
+        self,
+        name: str = "simulated",
+        latency: float = 1.0,
+        jitter: float = 0.2,
+        error_rate: float = 0.0,
+        quality: float = 0.9,
+        seed: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+        seconds_per_token: float = 0.0
+    ):
+        self.name = name
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.quality = quality
+        self.output_tokens = output_tokens
+        self.seconds_per_token = seconds_per_token
+        self.calls = 0
+        self._rng = random.Random(seed)
+
+    def degrade(self, latency: Optional[float] = None, error_rate: Optional[float] = None,
+                quality: Optional[float] = None):
+        """Çalışma anında model davranışını değiştir"""
+        if latency is not None:
+            self.latency = latency
+        if error_rate is not None:
+            self.error_rate = error_rate
+        if quality is not None:
+            self.quality = quality
+
+    async def ainvoke(self, messages, max_tokens: Optional[int] = None, **kwargs) -> SimulatedMessage:
+        self.calls += 1
+        metadata = {"model": self.name, "quality": self.quality}
+        tokens = self.output_tokens
+        if tokens is not None:
+            metadata["finish_reason"] = "stop"
+            if max_tokens is not None and tokens > max_tokens:
+                tokens = max_tokens
+                metadata["finish_reason"] = "length"
+        
+        delay = max(self.latency * (1 + self._rng.uniform(-self.jitter, self.jitter)), 0.0)
+        delay += (tokens or 0) * self.seconds_per_token
+        metadata["simulated_latency"] = delay
+        await get_clock().sleep(delay)
+        if self._rng.random() < self.error_rate:
+            raise SimulatedError(f"{self.name}: simüle edilmiş hata")
+        return SimulatedMessage(
+            content=f"[{self.name}] simüle edilmiş yanıt",
+            response_metadata=metadata
+        )
@@ -1,11 +1,12 @@
 """
 Task Management System - Görev yönetim sistemi
 """
-from typing import List, Dict, Optional, TYPE_CHECKING
+from typing import Callable, List, Dict, Optional, TYPE_CHECKING
 from datetime import datetime, timedelta
 from pydantic import BaseModel
-import uuid
 from agents.base_agent import Task
+from utils.ids import new_id
+from utils.clock import get_clock
 
 
 import logging
@@ -36,6 +37,19 @@ class TaskManager:
         self.tasks: Dict[str, Task] = {}
         self.task_queue: List[Task] = []
         self.completed_tasks: List[Task] = []
+        self._completed_ids = set()
+        # Olay -> dinleyiciler (created, completed)
+        self._listeners: Dict[str, List[Callable[[Task], None]]] = {"created": [], "completed": []}
+    
+    def subscribe(self, event: str, callback: Callable[[Task], None]):
+        """Görev olayına dinleyici ekle"""
+        if event not in self._listeners:
+            raise ValueError(f"Bilinmeyen görev olayı: {event}")
+        self._listeners[event].append(callback)
+    
+    def _emit(self, event: str, task: Task):
+        for callback in self._listeners[event]:
+            callback(task)
     
     def create_task(
         self,
@@ -46,23 +60,26 @@ class TaskManager:
         department: str,
         priority: str = TaskPriority.MEDIUM,
         deadline: Optional[datetime] = None,
-        dependencies: List[str] = None
+        dependencies: List[str] = None,
+        goal_id: Optional[str] = None
     ) -> Task:
         """Yeni görev oluştur"""
         task = Task(
-            id=str(uuid.uuid4()),
+            id=new_id("task"),
             title=title,
             description=description,
             assigned_to=assigned_to,
             assigned_by=assigned_by,
             department=department,
             priority=priority,
-            deadline=deadline or datetime.now() + timedelta(days=7),
-            dependencies=dependencies or []
+            deadline=deadline or get_clock().now() + timedelta(days=7),
+            dependencies=dependencies or [],
+            goal_id=goal_id
         )
         
         self.tasks[task.id] = task
         self.task_queue.append(task)
+        self._emit("created", task)
         
         logger.info(f"📋 Yeni görev oluşturuldu: {title}")
         logger.info(f"   👤 Atanan: {assigned_to}")
@@ -86,10 +103,13 @@ class TaskManager:
             old_status = task.status
             task.status = status
             
-            if status == TaskStatus.COMPLETED:
+            # Agent görevi kendi tarafında tamamlamış olabilir - kimlikle tekilleştir
+            if status == TaskStatus.COMPLETED and task_id not in self._completed_ids:
+                self._completed_ids.add(task_id)
                 self.completed_tasks.append(task)
                 if task in self.task_queue:
                     self.task_queue.remove(task)
+                self._emit("completed", task)
             
             logger.info(f"🔄 Görev durumu güncellendi: {task.title}")
             logger.info(f"   {old_status} -> {status}")
@@ -114,7 +134,7 @@ class TaskManager:
     
     def get_overdue_tasks(self) -> List[Task]:
         """Gecikmiş görevleri al"""
-        now = datetime.now()
+        now = get_clock().now()
         return [
             t for t in self.tasks.values() 
             if t.deadline < now and t.status != TaskStatus.COMPLETED
@@ -0,0 +1,106 @@
+"""
+Task Router - Çağrı başına zorluk tahmini ve tier seçimi
+
+Model seçimi rol başına sabit olduğunda bir Lead Developer'ın "mesajı
+onayla" istemi de mimari kararla aynı enterprise modele gider. Bu modül
+her LLM çağrısı için görev metni, öncelik ve çağrı tipinden ucuz, yerel bir
+zorluk puanı (1-10) hesaplar. Router bu puana göre rutin çağrıları daha
+düşük tier'a indirir; zor çağrılar rolün atanmış modelinde kalır, yani
+model hiçbir zaman rolün tier'ının üstüne çıkarılmaz.
+"""
+from typing import Dict, Optional
+from collections import Counter
+import re
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Çağrı tipi -> taban zorluk
+CALL_KIND_DIFFICULTY = {
+    "general": 5,
+    "task": 5,
+    "meeting_contribution": 3,
+    "meeting_synthesis": 4,
+    "decision": 7,
+    "collaboration": 4,
+    "team_review": 5,
+    "sprint_planning": 6,
+    "strategic_decision": 9,
+    "quarterly_review": 8
+}
+
+PRIORITY_ADJUSTMENT = {"low": -1, "medium": 0, "high": 1, "critical": 2}
+
+# Türkçe ve İngilizce kök eşleşmeleri
+_HARD = re.compile(
+    r"architect|mimari|strate|security|güvenlik|optimi|algorit|migrat|scal|ölçekl|"
+    r"risk|budget|bütçe|legal|hukuk|complian|uyumluluk|design|tasarım|analy|analiz|"
+    r"research|araştırma|debug|performance|performans",
+    re.IGNORECASE
+)
+_EASY = re.compile(
+    r"acknowledg|onayla|thank|teşekkür|status|durum|remind|hatırlat|summar|özetle|"
+    r"standup|typo|rename|greeting|selam|update|güncelle|confirm",
+    re.IGNORECASE
+)
+
+TIER_RANK = {"demo": 0, "basic": 1, "pro": 2, "enterprise": 3}
+
+
+def estimate_call_difficulty(text: str, kind: str = "general", priority: Optional[str] = None) -> int:
+    """Görev metni, çağrı tipi ve öncelikten 1-10 arası zorluk"""
+    score = CALL_KIND_DIFFICULTY.get(kind, CALL_KIND_DIFFICULTY["general"])
+    score += PRIORITY_ADJUSTMENT.get(priority or "medium", 0)
+
+    text = text or ""
+    score += min(len(_HARD.findall(text)), 2)
+    score -= min(len(_EASY.findall(text)), 2)
+
+    words = len(text.split())
+    if words > 400:
+        score += 1
+    elif words < 40:
+        score -= 1
+    return max(1, min(10, score))
+
+
+def tier_for_difficulty(difficulty: int) -> str:
+    """Zorluğa yeten en düşük tier (AutoConfigurator eşikleriyle aynı)"""
+    if difficulty >= 8:
+        return "enterprise"
+    if difficulty >= 5:
+        return "pro"
+    return "basic"
+
+
+class TaskRouter:
+    """Çağrıları zorluklarına göre rolün tier'ı veya daha ucuz bir tier'a yönlendirir"""
+
+    def __init__(self, tier_models: Dict[str, str]):
+        # tier -> o tier için kullanılacak model
+        self.tier_models = tier_models
+        self.stats: Counter = Counter()
+
+    def route(self, assigned_ai: str, assigned_tier: str, difficulty: int) -> str:
+        """Çağrının gideceği model - rolün modelinden pahalı olamaz"""
+        call_tier = tier_for_difficulty(difficulty)
+        if TIER_RANK.get(call_tier, 0) >= TIER_RANK.get(assigned_tier, 0):
+            self.stats["assigned"] += 1
+            return assigned_ai
+        model = self.tier_models.get(call_tier)
+        if not model:
+            self.stats["assigned"] += 1
+            return assigned_ai
+        self.stats[f"downgraded:{call_tier}"] += 1
+        return model
+
+    def get_stats(self) -> Dict:
+        total = sum(self.stats.values())
+        downgraded = total - self.stats["assigned"]
+        return {
+            "calls": total,
+            "downgraded": downgraded,
+            "downgrade_rate": downgraded / total if total else 0.0,
+            "by_route": dict(self.stats)
+        }
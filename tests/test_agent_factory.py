@@ -0,0 +1,89 @@
+"""
+Unit Tests - Agent Factory Startup Tests
+"""
+import unittest
+import asyncio
+import os
+import tempfile
+import yaml
+from agents.factory import AgentFactory
+from agents.ai_agent import AIAgent
+from systems.ai_provider import AIProvider
+from utils.config_service import ConfigService
+
+
+def _write_config(directory: str, members: int) -> str:
+    """members kişilik tek departmanlı bir organizasyon config'i yaz"""
+    config = {
+        "company": {"name": "Load Test Corp"},
+        "departments": {
+            "customer_service": {
+                "name": "Customer Service",
+                "manager": "Customer Service Director",
+                "team": [
+                    {"role": "Support Agent", "name": f"Agent {i}", "skills": ["support"]}
+                    for i in range(members)
+                ]
+            }
+        }
+    }
+    path = os.path.join(directory, "company_config.yaml")
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(config, f)
+    return path
+
+
+class TestLazyMaterialization(unittest.TestCase):
+    """Lazy agent materialization test suite"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.provider = AIProvider(auto_mode=False)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_large_org_starts_lazily(self):
+        """5,000 agents are created without any LLM client or system prompt"""
+        path = _write_config(self.tmp.name, 5000)
+        config = ConfigService(cache_dir=None).load_company(path)
+        factory = AgentFactory(path, self.provider, config=config)
+        
+        agents = factory.create_all_agents()
+        
+        self.assertEqual(len(agents), 5000)
+        self.assertEqual(factory.startup_metrics["agents"], 5000)
+        self.assertEqual(factory.get_materialization_stats()["materialized"], 0)
+        self.assertEqual(self.provider._clients, {})
+        self.assertFalse(any(agent.is_materialized for agent in agents.values()))
+        self.assertTrue(all(agent._system_prompt is None for agent in agents.values()))
+    
+    def test_llm_created_on_first_use(self):
+        """The LLM client is built on first access and shared per model"""
+        first = AIAgent("A", "Support Agent", "ops", ["support"], ai_provider_manager=self.provider)
+        second = AIAgent("B", "Support Agent", "ops", ["support"], ai_provider_manager=self.provider)
+        self.assertFalse(first.is_materialized)
+        
+        self.assertEqual(first.assigned_ai, "demo/simulated")
+        self.assertEqual(first.difficulty_level, 3)
+        self.assertFalse(first.is_materialized)
+        
+        response = asyncio.run(first.llm.ainvoke([]))
+        self.assertIn("Demo Mode", response.content)
+        self.assertTrue(first.is_materialized)
+        self.assertIs(first.llm, second.llm)
+    
+    def test_role_assignment_cached(self):
+        """Role assignments are computed once per role and department"""
+        first = self.provider.get_ai_for_role("CTO", "technology")
+        self.assertIs(first, self.provider.get_ai_for_role("CTO", "technology"))
+        self.assertEqual(first.difficulty_level, 9)
+    
+    def test_bare_model_name_resolved(self):
+        """Model names without a provider prefix resolve to their provider"""
+        self.assertEqual(self.provider._resolve_model_path("openai/gpt-4"), "openai/gpt-4")
+        self.assertEqual(self.provider._resolve_model_path("unknown-model"), "demo/unknown-model")
+
+
+if __name__ == "__main__":
+    unittest.main()
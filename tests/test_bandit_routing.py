@@ -0,0 +1,137 @@
+"""
+Unit Tests - Adaptive Routing Tests
+"""
+import unittest
+import asyncio
+from datetime import datetime
+from agents.ai_agent import AIAgent
+from systems.ai_provider import AIProvider
+from systems.llm_router import (
+    Backend, BanditPolicy, LLMRouter, ModelStats, load_quality_scorer, score_response, validation_score
+)
+from systems.simulated_provider import SimulatedLLM
+from utils.clock import VirtualClock, set_clock
+
+
+class VirtualClockTestCase(unittest.TestCase):
+    
+    def setUp(self):
+        self.previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+    
+    def tearDown(self):
+        set_clock(self.previous)
+
+
+def _run(router, calls):
+    async def scenario():
+        for _ in range(calls):
+            await router.ainvoke([])
+    asyncio.run(scenario())
+
+
+class TestModelStats(unittest.TestCase):
+    """Online statistics test suite"""
+    
+    def test_percentiles_and_rates(self):
+        """Latency percentiles, error rate and quality are tracked online"""
+        stats = ModelStats()
+        for i in range(100):
+            stats.record(latency=float(i), ok=True, quality=0.9)
+        stats.record(latency=0.0, ok=False, quality=0.0)
+        
+        self.assertEqual(stats.percentile(50), 50.0)
+        self.assertEqual(stats.percentile(95), 95.0)
+        self.assertAlmostEqual(stats.error_rate, 0.1)
+        self.assertLess(stats.quality, 0.9)
+
+
+class TestBanditRouting(VirtualClockTestCase):
+    """Bandit policy test suite"""
+    
+    def test_prefers_better_model(self):
+        """Traffic concentrates on the higher-quality, faster model"""
+        good = SimulatedLLM("good", latency=1.0, quality=0.95, seed=1)
+        poor = SimulatedLLM("poor", latency=6.0, quality=0.6, seed=2)
+        router = LLMRouter([Backend("a/good", good), Backend("b/poor", poor)], policy=BanditPolicy())
+        
+        _run(router, 300)
+        self.assertGreater(good.calls, 240)
+    
+    def test_moves_traffic_away_from_degrading_model(self):
+        """A model that degrades mid-run loses its traffic without a restart"""
+        first = SimulatedLLM("first", latency=1.0, quality=0.95, seed=1)
+        second = SimulatedLLM("second", latency=1.2, quality=0.9, seed=2)
+        router = LLMRouter([Backend("a/first", first), Backend("b/second", second)], policy=BanditPolicy())
+        
+        _run(router, 200)
+        self.assertGreater(first.calls, second.calls)
+        
+        first.degrade(error_rate=0.5, quality=0.3)
+        before = first.calls
+        _run(router, 200)
+        self.assertLess(first.calls - before, 50)
+    
+    def test_auto_switch_below_min_quality(self):
+        """Models under min_quality_score are taken out of rotation"""
+        weak = SimulatedLLM("weak", quality=0.5, seed=1)
+        strong = SimulatedLLM("strong", quality=0.95, seed=2)
+        weak_backend = Backend("a/weak", weak)
+        router = LLMRouter([weak_backend, Backend("b/strong", strong)],
+                           min_quality_score=0.8, min_quality_samples=5, cooldown=3600)
+        
+        _run(router, 40)
+        self.assertEqual(weak.calls, 5)
+        self.assertFalse(router.get_stats()[0]["healthy"])
+
+    
+    def test_validation_scorer_demotes_refusing_model(self):
+        """With the content-based scorer a model that keeps refusing leaves rotation"""
+        class RefusingLLM(SimulatedLLM):
+            async def ainvoke(self, messages, **kwargs):
+                response = await super().ainvoke(messages, **kwargs)
+                response.content = "I can't help with that."
+                response.response_metadata.pop("quality")
+                return response
+        
+        refusing = RefusingLLM("refusing", seed=1)
+        router = LLMRouter([Backend("a/refusing", refusing), Backend("b/ok", SimulatedLLM("ok", seed=2))],
+                           quality_scorer=load_quality_scorer("systems.llm_router.validation_score"),
+                           min_quality_score=0.8, min_quality_samples=5, cooldown=3600)
+        
+        _run(router, 40)
+        self.assertEqual(refusing.calls, 5)
+        self.assertFalse(router.get_stats()[0]["healthy"])
+
+
+class TestQualityScorer(unittest.TestCase):
+    """Configurable quality scorer test suite"""
+    
+    def test_load_quality_scorer(self):
+        """Scorers are resolved from dotted paths; unknown paths are rejected"""
+        self.assertIs(load_quality_scorer(None), score_response)
+        self.assertIs(load_quality_scorer("systems.llm_router:validation_score"), validation_score)
+        with self.assertRaises(ValueError):
+            load_quality_scorer("systems.llm_router.missing")
+    
+    def test_bandit_is_opt_in(self):
+        """The shipped config keeps round-robin load balancing"""
+        strategy = AIProvider(auto_mode=False).strategy["load_balancing"]["strategy"]
+        self.assertEqual(strategy, "round-robin-with-fallback")
+
+
+class TestAgentQualityMetrics(VirtualClockTestCase):
+    """Agent performance metrics test suite"""
+    
+    def test_invoke_records_quality_and_latency(self):
+        """Each LLM call updates quality_score and response_time_avg"""
+        agent = AIAgent("A", "Support Agent", "ops", ["support"],
+                        ai_provider_manager=AIProvider(auto_mode=False))
+        agent.llm = SimulatedLLM("sim", latency=2.0, jitter=0.0, quality=0.85)
+        
+        asyncio.run(agent._invoke([]))
+        self.assertAlmostEqual(agent.performance_metrics["quality_score"], 0.85)
+        self.assertAlmostEqual(agent.performance_metrics["response_time_avg"], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
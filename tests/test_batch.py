@@ -0,0 +1,134 @@
+"""
+Unit Tests - Batch Job Mode Tests
+"""
+import unittest
+import asyncio
+import tempfile
+from datetime import datetime
+from agents.ai_agent import AIAgent, ManagerAgent
+from systems.ai_provider import AIProvider, get_llm_limiter
+from systems.batch import BatchError, BatchExecutor, LocalFileBatchBackend
+from systems.simulated_provider import SimulatedLLM, SimulatedMessage
+from utils.clock import VirtualClock, get_clock, set_clock
+
+
+async def echo(model, messages):
+    if "patla" in messages[-1][1]:
+        raise RuntimeError("model hatası")
+    return SimulatedMessage(content=f"{model}: {messages[-1][1]}")
+
+
+class TestBatchExecutor(unittest.TestCase):
+    """Batch executor test suite"""
+    
+    def setUp(self):
+        self.previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.backend = LocalFileBatchBackend(self.tmp.name, echo, completion_delay=120)
+    
+    def tearDown(self):
+        set_clock(self.previous)
+    
+    def test_requests_share_one_job(self):
+        """Queued calls are submitted together and resolved to their callers"""
+        executor = BatchExecutor(self.backend, flush_interval=10, poll_interval=30)
+        
+        async def scenario():
+            return await asyncio.gather(*(
+                executor.submit("demo/model", [("human", f"istek {i}")]) for i in range(5)
+            ))
+        
+        started = get_clock().timestamp()
+        responses = asyncio.run(scenario())
+        self.assertEqual([r.content for r in responses], [f"demo/model: istek {i}" for i in range(5)])
+        self.assertGreaterEqual(get_clock().timestamp() - started, 130)
+        
+        stats = executor.get_stats()
+        self.assertEqual((stats["jobs"], stats["completed"], stats["queued"]), (1, 5, 0))
+        job_id = responses[0].response_metadata["batch_id"]
+        self.assertTrue((self.backend.directory / f"{job_id}.output.jsonl").exists())
+    
+    def test_full_queue_flushes_and_errors_propagate(self):
+        """A full queue is sent immediately; failed requests raise for their caller only"""
+        executor = BatchExecutor(self.backend, max_batch_size=2, flush_interval=600)
+        
+        async def scenario():
+            return await asyncio.gather(
+                executor.submit("m", [("human", "a")]),
+                executor.submit("m", [("human", "patla")]),
+                executor.submit("m", [("human", "b")]),
+                return_exceptions=True
+            )
+        
+        ok, failed, late = asyncio.run(scenario())
+        self.assertEqual(ok.content, "m: a")
+        self.assertIsInstance(failed, BatchError)
+        self.assertEqual(late.content, "m: b")
+        self.assertEqual(executor.get_stats()["jobs"], 2)
+
+
+class TestAgentBatchMode(unittest.TestCase):
+    """Agent batch routing test suite"""
+    
+    def setUp(self):
+        self.previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        
+        self.provider = AIProvider(auto_mode=False)
+        self.provider.strategy = {
+            **self.provider.strategy,
+            "batch": {"enabled": True, "directory": self.tmp.name, "flush_interval_seconds": 5,
+                      "poll_interval_seconds": 10, "completion_delay_seconds": 60}
+        }
+        self.realtime = SimulatedLLM("realtime", latency=1.0, jitter=0.0)
+        self.provider.create_client = lambda path: self.realtime
+    
+    def tearDown(self):
+        set_clock(self.previous)
+    
+    def test_sprint_planning_goes_through_batch(self):
+        """Eligible calls skip the realtime client and limiter; interactive calls do not"""
+        managers = [
+            ManagerAgent(f"M{i}", "Engineering Manager", "technology", ["planning"],
+                         ai_provider_manager=self.provider)
+            for i in range(3)
+        ]
+        worker = AIAgent("W", "Developer", "technology", ["python"], ai_provider_manager=self.provider)
+        limiter_calls = get_llm_limiter().total_calls
+        
+        async def scenario():
+            plans = await asyncio.gather(*(manager.plan_sprint() for manager in managers))
+            answer = await worker.collaborate("M0", "API tasarımı")
+            return plans, answer
+        
+        plans, answer = asyncio.run(scenario())
+        self.assertTrue(all(plan["plan"] for plan in plans))
+        self.assertEqual(self.provider.batch_executor.get_stats()["jobs"], 1)
+        # Yalnızca iş tamamlanırken ve etkileşimli çağrıda gerçek client kullanılır
+        self.assertEqual(self.realtime.calls, 4)
+        self.assertEqual(get_llm_limiter().total_calls - limiter_calls, 1)
+        self.assertIn("simüle", answer)
+    
+    def test_batch_uses_client_stack_and_separate_metrics(self):
+        """Batch requests go through create_llm_client; queue time stays out of response_time_avg"""
+        routed = []
+        create_llm_client = self.provider.create_llm_client
+        self.provider.create_llm_client = lambda path: routed.append(path) or create_llm_client(path)
+        manager = ManagerAgent("M", "Engineering Manager", "technology", ["planning"],
+                               ai_provider_manager=self.provider)
+        
+        asyncio.run(manager.plan_sprint())
+        self.assertEqual(routed, [manager.assigned_ai])
+        asyncio.run(manager.collaborate("W", "API tasarımı"))
+        
+        metrics = manager.performance_metrics
+        self.assertEqual(metrics["batch_calls"], 1)
+        self.assertGreaterEqual(metrics["batch_turnaround_avg"], 60)
+        self.assertAlmostEqual(metrics["response_time_avg"], 1.0)
+        self.assertEqual(metrics["llm_calls"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
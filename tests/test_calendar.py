@@ -0,0 +1,125 @@
+"""
+Unit Tests - Calendar Engine Tests
+"""
+import unittest
+import asyncio
+import logging
+from datetime import datetime, time, timedelta
+from agents.base_agent import BaseAgent, Task
+from systems.calendar_engine import (
+    BusyIndex, CalendarEngine, RecurrenceRule, SchedulingConflict
+)
+from systems.meeting import MeetingSystem
+
+logger = logging.getLogger(__name__)
+
+MONDAY = datetime(2026, 1, 5, 9, 0)
+MINUTES_15 = timedelta(minutes=15)
+
+
+class MockAgent(BaseAgent):
+    """Mock agent for testing"""
+    
+    async def execute_task(self, task: Task) -> str:
+        return f"Executed: {task.title}"
+    
+    async def generate_meeting_contribution(self, meeting_info: dict) -> dict:
+        return {"agent": self.name, "role": self.role, "contribution": "ok"}
+
+
+class TestBusyIndex(unittest.TestCase):
+    """Per-participant interval index test suite"""
+    
+    def test_next_free_skips_adjacent_intervals(self):
+        """next_free jumps over back-to-back bookings"""
+        index = BusyIndex()
+        index.add(MONDAY, MONDAY + MINUTES_15)
+        index.add(MONDAY + MINUTES_15, MONDAY + 2 * MINUTES_15)
+        index.add(MONDAY + timedelta(hours=1), MONDAY + timedelta(hours=2))
+        
+        self.assertEqual(index.next_free(MONDAY, MINUTES_15), MONDAY + 2 * MINUTES_15)
+        self.assertEqual(
+            index.next_free(MONDAY, timedelta(minutes=45)),
+            MONDAY + timedelta(hours=2)
+        )
+        self.assertTrue(index.is_free(MONDAY + timedelta(minutes=30), MONDAY + timedelta(hours=1)))
+    
+    def test_overlap_rejected_and_prune(self):
+        """Overlapping bookings are rejected; old intervals can be pruned"""
+        index = BusyIndex()
+        index.add(MONDAY, MONDAY + MINUTES_15)
+        with self.assertRaises(SchedulingConflict):
+            index.add(MONDAY + timedelta(minutes=10), MONDAY + timedelta(minutes=20))
+        
+        self.assertEqual(index.prune(MONDAY + timedelta(hours=1)), 1)
+        self.assertEqual(len(index), 0)
+
+
+class TestCalendarEngine(unittest.TestCase):
+    """Calendar engine test suite"""
+    
+    def test_find_slot_for_several_participants(self):
+        """The earliest common free slot is found across participants"""
+        calendar = CalendarEngine()
+        calendar.book(["alice"], MONDAY, timedelta(minutes=30))
+        calendar.book(["bob"], MONDAY + timedelta(minutes=30), timedelta(minutes=30))
+        
+        slot = calendar.find_slot(["alice", "bob", "carol"], MONDAY, timedelta(minutes=30))
+        self.assertEqual(slot, MONDAY + timedelta(hours=1))
+        self.assertIsNone(calendar.find_slot(
+            ["alice", "bob"], MONDAY, timedelta(minutes=30), latest=MONDAY + timedelta(minutes=45)
+        ))
+    
+    def test_failed_booking_is_atomic(self):
+        """A conflict for one participant books nobody"""
+        calendar = CalendarEngine()
+        calendar.book(["alice"], MONDAY, MINUTES_15)
+        with self.assertRaises(SchedulingConflict):
+            calendar.book(["bob", "alice"], MONDAY, MINUTES_15)
+        self.assertTrue(calendar.is_free(["bob"], MONDAY, MINUTES_15))
+    
+    def test_recurring_meetings_from_config(self):
+        """Daily, weekly and monthly rules produce due occurrences in order"""
+        calendar = CalendarEngine()
+        calendar.load_recurring({
+            "daily_standup": {"time": "09:00", "duration": 15},
+            "weekly_review": {"day": "Friday", "time": "16:00", "duration": 60},
+            "monthly_planning": {"day": 1, "time": "10:00", "duration": 120}
+        }, datetime(2026, 1, 1))
+        
+        due = calendar.pop_due(datetime(2026, 2, 2))
+        kinds = [o.kind for o in due]
+        self.assertEqual(kinds.count("daily_standup"), 32)
+        self.assertEqual(kinds.count("weekly_review"), 5)
+        self.assertEqual(kinds.count("monthly_planning"), 2)
+        self.assertEqual(due, sorted(due))
+        self.assertEqual(calendar.pop_due(datetime(2026, 2, 2)), [])
+    
+    def test_monthly_rule_clamps_short_months(self):
+        """Day 31 falls back to the last day of shorter months"""
+        rule = RecurrenceRule("monthly", at=time(10, 0), day_of_month=31)
+        first = rule.first_on_or_after(datetime(2026, 1, 31, 11, 0))
+        self.assertEqual(first, datetime(2026, 2, 28, 10, 0))
+        self.assertEqual(rule.following(first), datetime(2026, 3, 31, 10, 0))
+
+
+class TestMeetingConflicts(unittest.TestCase):
+    """Meeting scheduling through the calendar"""
+    
+    def test_double_booking_moves_meeting(self):
+        """A participant already in a meeting pushes the next one back"""
+        system = MeetingSystem()
+        team = [MockAgent(f"Dev {i}", "Developer", "technology", {}) for i in range(3)]
+        
+        async def scenario():
+            standup = await system.schedule_daily_standup("technology", team, team[0], MONDAY)
+            review = await system.schedule_weekly_review("technology", team[:2], team[0], MONDAY)
+            return standup, review
+        
+        standup, review = asyncio.run(scenario())
+        self.assertEqual(standup.scheduled_time, MONDAY)
+        self.assertEqual(review.scheduled_time, MONDAY + MINUTES_15)
+
+
+if __name__ == '__main__':
+    unittest.main()
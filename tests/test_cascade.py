@@ -0,0 +1,106 @@
+"""
+Unit Tests - Cascade Execution Tests
+"""
+import unittest
+import asyncio
+import json
+import os
+from datetime import datetime
+from unittest import mock
+from agents.ai_agent import AIAgent
+from systems.ai_provider import AIProvider
+from systems.cascade import validate_response
+from systems.simulated_provider import SimulatedMessage
+from utils.clock import VirtualClock, set_clock
+
+GOOD_DECISION = json.dumps({
+    "decision": "Seçenek A",
+    "reasoning": "Maliyeti düşük ve ekibin deneyimi var",
+    "risks": ["Takvim kayması"],
+    "action_plan": ["Prototip", "Pilot"]
+})
+
+
+class ScriptedLLM:
+    """Sıradaki yanıtı listeden döndüren LLM"""
+    
+    def __init__(self, name, replies):
+        self.name = name
+        self.replies = list(replies)
+        self.calls = 0
+    
+    async def ainvoke(self, messages, **kwargs):
+        reply = self.replies[self.calls % len(self.replies)]
+        self.calls += 1
+        return SimulatedMessage(content=reply, response_metadata={"model": self.name})
+
+
+class TestValidators(unittest.TestCase):
+    """Response validator test suite"""
+    
+    def test_decision_schema(self):
+        """Decisions need every field of the JSON schema"""
+        self.assertTrue(validate_response(GOOD_DECISION, "decision").ok)
+        partial = validate_response('{"decision": "A", "reasoning": "kısa ama yeterli gerekçe"}', "decision")
+        self.assertEqual(partial.reason, "schema")
+        self.assertEqual(validate_response("Seçenek A en iyisi bence, çünkü ucuz.", "decision").reason, "invalid_json")
+    
+    def test_refusal_and_confidence(self):
+        """Refusals fail; hedged answers pass with low confidence"""
+        self.assertEqual(validate_response("Üzgünüm, bu konuda yardımcı olamam.").reason, "refusal")
+        hedged = validate_response("Emin değilim, belki ikinci seçenek olabilir, sanırım.")
+        self.assertTrue(hedged.ok)
+        self.assertLess(hedged.confidence, 0.6)
+
+
+class TestAgentCascade(unittest.TestCase):
+    """Agent cascade test suite"""
+    
+    def setUp(self):
+        self.previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+        patcher = mock.patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test", "ANTHROPIC_API_KEY": "", "GOOGLE_API_KEY": ""})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cascade = mock.patch.object(AIProvider, "cascade_enabled", True)
+        cascade.start()
+        self.addCleanup(cascade.stop)
+        
+        self.provider = AIProvider(auto_mode=True)
+        self.provider.reload()
+        self.addCleanup(self.provider.auto_config.reload)
+        # Ucuz model her dört kararın birinde şemaya uymayan yanıt verir
+        self.clients = {
+            "openai/gpt-3.5-turbo": ScriptedLLM("cheap", [GOOD_DECISION] * 3 + ["Seçenek A iyi görünüyor."]),
+            "openai/gpt-4-turbo": ScriptedLLM("strong", [GOOD_DECISION])
+        }
+        self.provider.create_client = lambda path: self.clients[path]
+        self.agent = AIAgent("Alex", "Lead Developer", "technology", ["architecture"],
+                             ai_provider_manager=self.provider)
+    
+    def tearDown(self):
+        set_clock(self.previous)
+    
+    def test_most_decisions_finish_on_cheap_model(self):
+        """Only invalid answers escalate, and the savings are reported"""
+        async def scenario():
+            return [await self.agent.make_decision("Yeni CI sistemi", ["A", "B"]) for _ in range(8)]
+        
+        decisions = asyncio.run(scenario())
+        self.assertTrue(all(json.loads(d["decision_output"])["decision"] for d in decisions))
+        self.assertEqual(self.clients["openai/gpt-4-turbo"].calls, 2)
+        
+        stats = self.provider.cascade.get_stats()
+        self.assertEqual(stats["calls"], 8)
+        self.assertAlmostEqual(stats["escalation_rate"], 0.25)
+        self.assertEqual(stats["escalation_reasons"], {"invalid_json": 2})
+        self.assertGreater(stats["savings"], 0)
+        self.assertEqual(self.agent.performance_metrics["cascade_escalations"], 2)
+    
+    def test_basic_roles_skip_cascade(self):
+        """Roles already on the basic tier call their model directly"""
+        agent = AIAgent("Sam", "Support Agent", "ops", ["support"], ai_provider_manager=self.provider)
+        self.assertIsNone(agent._cascade_model())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Unit Tests - Cassette Record/Replay Tests
+"""
+import unittest
+import asyncio
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from agents.ai_agent import AIAgent
+from agents.base_agent import Task
+from systems.ai_provider import AIProvider
+from systems.cassette import Cassette, CassetteMiss
+from systems.simulated_provider import SimulatedLLM
+from utils.clock import VirtualClock, get_clock, set_clock
+
+
+class TestCassette(unittest.TestCase):
+    """Record/replay test suite"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "day.jsonl.gz"
+        self.previous = set_clock(VirtualClock(datetime(2026, 1, 1, 9)))
+    
+    def tearDown(self):
+        set_clock(self.previous)
+        self.tmp.cleanup()
+    
+    def _agents(self, provider):
+        return [
+            AIAgent(f"Agent {i}", role, "ops", ["ops"], ai_provider_manager=provider)
+            for i, role in enumerate(["CTO", "Support Agent", "Backend Developer"])
+        ]
+    
+    def _work(self, provider):
+        """Her ajan iki görev yürütür - yanıtları ve geçen simülasyon süresini döndürür"""
+        agents = self._agents(provider)
+        tasks = [Task(id=f"t{i}", title=f"Task {i}", description="Do it", assigned_to="x", assigned_by="y", department="ops") for i in range(2)]
+        start = get_clock().timestamp()
+        
+        async def scenario():
+            return [await agent.execute_task(task) for agent in agents for task in tasks]
+        
+        results = asyncio.run(scenario())
+        return results, get_clock().timestamp() - start
+    
+    def test_record_then_replay(self):
+        """Replay returns recorded responses and reproduces recorded latency"""
+        recorder = AIProvider(auto_mode=False)
+        recorder.create_client = lambda path: SimulatedLLM(path, latency=3.0, seed=4)
+        recorder.use_cassette(self.path, "record")
+        recorded, recorded_time = self._work(recorder)
+        recorder.close_cassette()
+        
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f]
+        self.assertEqual(len(entries), 6)
+        self.assertGreater(entries[0]["input_tokens"], 0)
+        self.assertAlmostEqual(sum(e["latency"] for e in entries), recorded_time)
+        
+        replayer = AIProvider(auto_mode=False)
+        replayer.create_client = lambda path: self.fail("replay must not build real clients")
+        replayer.use_cassette(self.path, "replay", reproduce_latency=True)
+        replayed, replayed_time = self._work(replayer)
+        
+        self.assertEqual(replayed, recorded)
+        self.assertAlmostEqual(replayed_time, recorded_time)
+    
+    def test_replay_without_latency_is_instant(self):
+        """Without latency reproduction replay takes no simulated time"""
+        recorder = AIProvider(auto_mode=False)
+        recorder.create_client = lambda path: SimulatedLLM(path, latency=3.0)
+        recorder.use_cassette(self.path, "record")
+        self._work(recorder)
+        recorder.close_cassette()
+        
+        replayer = AIProvider(auto_mode=False)
+        replayer.use_cassette(self.path, "replay")
+        _, elapsed = self._work(replayer)
+        self.assertEqual(elapsed, 0)
+    
+    def test_missing_call_raises_in_strict_mode(self):
+        """Unrecorded prompts fail loudly unless strict is off"""
+        Cassette(self.path).flush()
+        provider = AIProvider(auto_mode=False)
+        provider.use_cassette(self.path, "replay")
+        client = provider.create_llm_client("demo/simulated")
+        with self.assertRaises(CassetteMiss):
+            asyncio.run(client.ainvoke([]))
+        
+        provider.use_cassette(self.path, "replay", strict=False)
+        response = asyncio.run(provider.create_llm_client("demo/simulated").ainvoke([]))
+        self.assertEqual(response.content, "")
+    
+    def test_repeated_prompt_cycles_recordings(self):
+        """The same prompt replays its recordings in order"""
+        recorder = AIProvider(auto_mode=False)
+        recorder.create_client = lambda path: SimulatedLLM("first", latency=0)
+        recorder.use_cassette(self.path, "record")
+        client = recorder.create_llm_client("demo/simulated")
+        asyncio.run(client.ainvoke(["hi"]))
+        client.client.name = "second"
+        asyncio.run(client.ainvoke(["hi"]))
+        recorder.close_cassette()
+        
+        cassette = Cassette(self.path)
+        self.assertEqual(len(cassette), 2)
+        replay = [cassette.lookup(next(iter(cassette._entries))).response for _ in range(3)]
+        self.assertEqual([r.split("]")[0] for r in replay], ["[first", "[second", "[first"])
+
+
+if __name__ == "__main__":
+    unittest.main()
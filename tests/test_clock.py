@@ -0,0 +1,176 @@
+"""
+Unit Tests - Simulation Clock & Engine Tests
+"""
+import unittest
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from agents.base_agent import Task
+from core.company import AutonomousCompany
+from core.pacing import PacingPolicy
+from core.simulation import SimulationEngine
+from utils.clock import VirtualClock, WallClock, get_clock, set_clock
+from utils.ids import IDGenerator, id_to_datetime
+
+logger = logging.getLogger(__name__)
+
+START = datetime(2026, 1, 1, 9, 0)
+
+
+class VirtualClockTestCase(unittest.TestCase):
+    """Installs a virtual clock for the duration of each test"""
+    
+    def setUp(self):
+        self.clock = VirtualClock(START)
+        self.previous = set_clock(self.clock)
+    
+    def tearDown(self):
+        set_clock(self.previous)
+
+
+class TestVirtualClock(VirtualClockTestCase):
+    """Virtual clock test suite"""
+    
+    def test_sleep_jumps_instantly(self):
+        """Sleeping 30 simulated days takes no real time"""
+        started = time.perf_counter()
+        asyncio.run(get_clock().sleep(30 * 24 * 3600))
+        
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(get_clock().now(), START + timedelta(days=30))
+    
+    def test_concurrent_sleepers_wake_in_order(self):
+        """Concurrent sleepers wake in simulated-time order"""
+        woke = []
+        
+        async def sleeper(name, seconds):
+            await get_clock().sleep(seconds)
+            woke.append((name, get_clock().now()))
+        
+        async def scenario():
+            await asyncio.gather(sleeper("late", 300), sleeper("early", 60), sleeper("mid", 120))
+        
+        asyncio.run(scenario())
+        self.assertEqual([name for name, _ in woke], ["early", "mid", "late"])
+        self.assertEqual(woke[0][1], START + timedelta(seconds=60))
+    
+    def test_models_and_ids_use_clock(self):
+        """Timestamps and IDs follow the simulated time"""
+        self.clock.advance(timedelta(days=3))
+        task = Task(id="t", title="T", description="", assigned_to="a",
+                    assigned_by="b", department="qa")
+        
+        self.assertEqual(task.created_at, START + timedelta(days=3))
+        # Global üretici monoton kalır; taze üretici saatin zamanını kullanır
+        self.assertEqual(id_to_datetime(IDGenerator().new_ulid()), START + timedelta(days=3))
+
+
+class TestSimulationEngine(VirtualClockTestCase):
+    """Discrete-event engine test suite"""
+    
+    def test_events_run_in_time_order(self):
+        """Events run in time order and advance the clock"""
+        engine = SimulationEngine()
+        seen = []
+        for hours in (5, 1, 3):
+            engine.schedule_at(START + timedelta(hours=hours),
+                               lambda h=hours: seen.append((h, get_clock().now())))
+        
+        processed = asyncio.run(engine.run())
+        self.assertEqual(processed, 3)
+        self.assertEqual([h for h, _ in seen], [1, 3, 5])
+        self.assertEqual(seen[-1][1], START + timedelta(hours=5))
+    
+    def test_run_until(self):
+        """run(until) stops at the horizon and leaves later events queued"""
+        engine = SimulationEngine()
+        engine.schedule_in(timedelta(days=1), lambda: None)
+        engine.schedule_in(timedelta(days=10), lambda: None)
+        
+        asyncio.run(engine.run(until=START + timedelta(days=5)))
+        self.assertEqual(len(engine), 1)
+        self.assertEqual(get_clock().now(), START + timedelta(days=5))
+    
+    def test_wall_clock_runs_back_to_back(self):
+        """On the wall clock events do not wait for their timestamp"""
+        engine = SimulationEngine(clock=WallClock())
+        engine.schedule_in(timedelta(days=1), lambda: None)
+        
+        started = time.perf_counter()
+        asyncio.run(engine.run())
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+
+class TestContinuousRun(VirtualClockTestCase):
+    """Virtual-time continuous run test suite"""
+    
+    def test_thirty_days_in_milliseconds(self):
+        """A 30-day run completes quickly with stubbed work"""
+        company = AutonomousCompany(pacing=PacingPolicy(work_execution=8 * 3600, between_days=3600))
+        calls = {"days": [], "weekly": 0, "monthly": 0}
+        
+        async def initialize():
+            pass
+        
+        async def simulate_work_day(standup=True, standup_time=None):
+            calls["days"].append(get_clock().now())
+            await company.pacing.pause("work_execution")
+        
+        async def weekly_review(scheduled_time=None):
+            calls["weekly"] += 1
+        
+        async def monthly_planning(scheduled_time=None):
+            calls["monthly"] += 1
+        
+        company.initialize = initialize
+        company.simulate_work_day = simulate_work_day
+        company.weekly_review = weekly_review
+        company.monthly_planning = monthly_planning
+        
+        started = time.perf_counter()
+        asyncio.run(company.run_continuous(days=30))
+        
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(len(calls["days"]), 30)
+        self.assertEqual(calls["days"][-1], START + timedelta(days=29))
+        # 2026-01-01 Perşembe - Ocak'ta 5 Cuma, ayın 1'inde bir planlama
+        self.assertEqual(calls["weekly"], 5)
+        self.assertEqual(calls["monthly"], 1)
+
+
+
+class NetworkLLM:
+    """Gerçek G/Ç gibi sanal saati kullanmadan bekleyen LLM"""
+    
+    async def ainvoke(self, messages, **kwargs):
+        await asyncio.sleep(0.02)
+        return type("Reply", (), {"content": "ok", "response_metadata": {}})()
+
+
+class TestLatencyMeasurement(VirtualClockTestCase):
+    """Provider latency under the virtual clock test suite"""
+    
+    def test_real_provider_latency_uses_wall_time(self):
+        """Clock jumps during a network call do not leak into the latency metric"""
+        from agents.ai_agent import AIAgent
+        from systems.ai_provider import AIProvider
+        
+        agent = AIAgent("Net", "Developer", "technology", ["python"],
+                        ai_provider_manager=AIProvider(auto_mode=False))
+        agent.llm = NetworkLLM()
+        
+        async def scenario():
+            # Çağrı sürerken bekleyen bir uyuyan saati bir saat ileri atlatır
+            sleeper = asyncio.create_task(self.clock.sleep(3600))
+            await agent._invoke([])
+            await sleeper
+        
+        asyncio.run(scenario())
+        latency = agent.performance_metrics["response_time_avg"]
+        self.assertGreaterEqual(latency, 0.02)
+        self.assertLess(latency, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Unit Tests - Company Orchestration Tests
+"""
+import unittest
+import asyncio
+import logging
+from agents.base_agent import BaseAgent, Task
+from core.company import AutonomousCompany
+from core.pacing import PacingPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class SlowStandupAgent(BaseAgent):
+    """Agent whose standup update takes a fixed amount of time"""
+    
+    async def execute_task(self, task: Task) -> str:
+        return f"Executed: {task.title}"
+    
+    async def generate_meeting_contribution(self, meeting_info: dict) -> dict:
+        return {"agent": self.name, "role": self.role, "contribution": "ok"}
+    
+    async def daily_standup_update(self) -> dict:
+        await asyncio.sleep(0.05)
+        return await super().daily_standup_update()
+
+
+class TestPacingPolicy(unittest.TestCase):
+    """Pacing policy test suite"""
+    
+    def test_production_default_is_zero(self):
+        """Default pacing never sleeps"""
+        policy = PacingPolicy()
+        self.assertEqual(policy.between_days, 0.0)
+        self.assertEqual(policy.demo_step, 0.0)
+    
+    def test_from_config(self):
+        """Pacing is read from runtime.pacing and ignores unknown keys"""
+        policy = PacingPolicy.from_config({
+            "runtime": {"pacing": {"between_days": 1.5, "unknown": 3}}
+        })
+        self.assertEqual(policy.between_days, 1.5)
+        self.assertEqual(policy.work_execution, 0.0)
+
+
+class TestMorningStandup(unittest.TestCase):
+    """Concurrent standup test suite"""
+    
+    def test_standups_run_concurrently(self):
+        """A day's standups take about as long as the slowest department"""
+        company = AutonomousCompany(pacing=PacingPolicy())
+        company.departments = {
+            f"dept_{d}": [
+                SlowStandupAgent(name=f"Agent {d}-{i}", role="tester",
+                                 department=f"dept_{d}", skills=["testing"])
+                for i in range(2)
+            ]
+            for d in range(6)
+        }
+        
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await company.morning_standup()
+            return loop.time() - start
+        
+        elapsed = asyncio.run(scenario())
+        # Sıralı çalışma 6 departman x 2 ajan x 0.05 sn = 0.6 sn sürerdi
+        self.assertLess(elapsed, 0.3)
+        self.assertEqual(company.meeting_system.store.completed_count, 6)
+
+
+
+class TestRunContinuous(unittest.TestCase):
+    """Continuous run test suite"""
+    
+    def test_wall_clock_run_does_not_wait_for_bookings(self):
+        """On the wall clock future bookings are conducted without real waits"""
+        company = AutonomousCompany(pacing=PacingPolicy())
+        
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.wait_for(company.run_continuous(days=2), timeout=60)
+            return loop.time() - start
+        
+        elapsed = asyncio.run(scenario())
+        self.assertLess(elapsed, 30)
+        self.assertGreaterEqual(company.meeting_system.store.completed_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Unit Tests - Config Service Tests
+"""
+import unittest
+import os
+import tempfile
+from pathlib import Path
+import yaml
+from utils.config_service import ConfigService, ConfigError
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestConfigService(unittest.TestCase):
+    """Config service test suite"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.path = self.dir / "company_config.yaml"
+        self._write({"company": {"name": "Test Corp"}, "departments": {}})
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def _write(self, config: dict):
+        self.path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    
+    def test_repository_configs_are_valid(self):
+        """The shipped company and provider configs pass validation"""
+        service = ConfigService(cache_dir=None)
+        company = service.load_company(ROOT / "config" / "company_config.yaml")
+        providers = service.load_providers(ROOT / "config" / "ai_providers_config.yaml")
+        self.assertIn("technology", company["departments"])
+        self.assertIn("openai", providers["ai_providers"])
+    
+    def test_parsed_once_per_process(self):
+        """Repeated loads share one dictionary"""
+        service = ConfigService(cache_dir=self.dir / "cache")
+        first = service.load_company(self.path)
+        self.assertIs(service.load_company(self.path), first)
+        self.assertEqual(service.stats["parsed"], 1)
+        self.assertEqual(service.stats["memory_hits"], 1)
+    
+    def test_disk_cache_skips_parsing(self):
+        """A new process reuses the compiled cache keyed on mtime and hash"""
+        ConfigService(cache_dir=self.dir / "cache").load_company(self.path)
+        
+        service = ConfigService(cache_dir=self.dir / "cache")
+        self.assertEqual(service.load_company(self.path)["company"]["name"], "Test Corp")
+        self.assertEqual(service.stats, {"parsed": 0, "disk_hits": 1, "memory_hits": 0})
+        
+        # Aynı içerik, farklı mtime: hash eşleşir
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        service = ConfigService(cache_dir=self.dir / "cache")
+        service.load_company(self.path)
+        self.assertEqual(service.stats["parsed"], 0)
+    
+    def test_changed_file_is_reparsed(self):
+        """Editing the file invalidates both caches"""
+        service = ConfigService(cache_dir=self.dir / "cache")
+        service.load_company(self.path)
+        
+        self._write({"company": {"name": "Renamed Corp"}})
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(service.load_company(self.path)["company"]["name"], "Renamed Corp")
+        self.assertEqual(service.stats["parsed"], 2)
+    
+    def test_schema_defaults_are_returned(self):
+        """The loaded dictionary is the validated model with schema defaults filled in"""
+        self._write({
+            "company": {"name": "Test Corp"},
+            "runtime": {"mailbox": {"capacity": 10}},
+            "meetings": {"daily_standup": {"time": "09:30"}}
+        })
+        config = ConfigService(cache_dir=self.dir / "cache").load_company(self.path)
+        self.assertEqual(config["runtime"]["mailbox"], {"capacity": 10, "policy": "drop_oldest", "block_timeout": 5.0})
+        self.assertEqual(config["meetings"]["daily_standup"]["duration"], 30)
+        self.assertNotIn("goals", config["runtime"])
+        
+        # Disk önbelleği de doğrulanmış sözlüğü döndürür
+        cached = ConfigService(cache_dir=self.dir / "cache").load_company(self.path)
+        self.assertEqual(cached, config)
+    
+    def test_goal_catalog_anchored_to_project(self):
+        """A relative goal catalog path does not depend on the working directory"""
+        self._write({"company": {"name": "Test Corp"}, "runtime": {"goals": {"catalog_path": "data/goals.db"}}})
+        cwd = os.getcwd()
+        os.chdir(self.dir)
+        try:
+            config = ConfigService(cache_dir=None).load_company(self.path)
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(config["runtime"]["goals"]["catalog_path"], str(ROOT / "data" / "goals.db"))
+    
+    def test_invalid_config_rejected(self):
+        """Schema violations raise ConfigError"""
+        service = ConfigService(cache_dir=None)
+        
+        self._write({"departments": {}})
+        with self.assertRaises(ConfigError):
+            service.load_company(self.path)
+        
+        self._write({"company": {"name": "X"}, "runtime": {"mailbox": {"policy": "drop_all"}}})
+        service.invalidate()
+        with self.assertRaises(ConfigError):
+            service.load_company(self.path)
+        
+        self._write({"company": {"name": "X"}, "meetings": {"daily_standup": {"time": "9am"}}})
+        service.invalidate()
+        with self.assertRaises(ConfigError):
+            service.load_company(self.path)
+        
+        # Standup katkıları LLM'siz üretilir; mod ayarı kabul edilmez
+        self._write({"company": {"name": "X"}, "runtime": {"meetings": {"modes": {"daily_standup": "synthesized"}}}})
+        service.invalidate()
+        with self.assertRaises(ConfigError):
+            service.load_company(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Unit Tests - Goal Hierarchy Tests
+"""
+import unittest
+import asyncio
+import logging
+import tempfile
+from pathlib import Path
+from agents.base_agent import BaseAgent, Task
+from systems.goals import GoalManager, GoalPeriod, GoalStatus
+from systems.task import TaskManager
+from core.company import AutonomousCompany
+from core.pacing import PacingPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class MockAgent(BaseAgent):
+    """Mock agent for testing"""
+    
+    async def execute_task(self, task: Task) -> str:
+        return f"Executed: {task.title}"
+    
+    async def generate_meeting_contribution(self, meeting_info: dict) -> dict:
+        return {"agent": self.name, "contribution": "ok"}
+
+
+class TestGoalTree(unittest.TestCase):
+    """Goal tree roll-up test suite"""
+    
+    def setUp(self):
+        self.goals = GoalManager()
+        self.tasks = TaskManager()
+        self.tasks.subscribe("created", self.goals.on_task_created)
+        self.tasks.subscribe("completed", self.goals.on_task_completed)
+        
+        self.root = self.goals.set_company_goal("Büyüme", "", GoalPeriod.QUARTERLY)
+        self.product = self.goals.set_department_goal(
+            "technology", "Ürün", "", GoalPeriod.MONTHLY, "CTO",
+            parent_id=self.root.id, weight=3.0
+        )
+        self.sales = self.goals.set_department_goal(
+            "sales", "Satış", "", GoalPeriod.MONTHLY, "CSO",
+            parent_id=self.root.id, weight=1.0
+        )
+    
+    def _task(self, goal):
+        return self.tasks.create_task("T", "", "dev", "lead", "technology", goal_id=goal.id)
+    
+    def test_task_completion_rolls_up(self):
+        """Completing tasks updates the leaf and weighted ancestors"""
+        first, second = self._task(self.product), self._task(self.product)
+        
+        self.tasks.update_task_status(first.id, "completed")
+        self.assertAlmostEqual(self.product.progress, 50.0)
+        self.assertAlmostEqual(self.root.progress, 37.5)
+        self.assertEqual(self.root.status, GoalStatus.IN_PROGRESS)
+        
+        # Aynı görevin tekrar bildirilmesi sayılmaz
+        self.tasks.update_task_status(first.id, "completed")
+        self.assertAlmostEqual(self.product.progress, 50.0)
+        
+        self.tasks.update_task_status(second.id, "completed")
+        self.assertEqual(self.product.status, GoalStatus.COMPLETED)
+        self.assertAlmostEqual(self.root.progress, 75.0)
+        self.assertIn(self.product.id, self.goals.completed_goals)
+        self.assertNotIn(self.product.id, self.goals.active_goals)
+    
+    def test_completion_completes_ancestors_and_new_task_reopens(self):
+        """A full tree completes the root; a new task reopens the leaf path"""
+        self.tasks.update_task_status(self._task(self.product).id, "completed")
+        self.goals.update_goal_progress(self.sales.id, 100.0)
+        self.assertEqual(self.root.status, GoalStatus.COMPLETED)
+        
+        self._task(self.sales)
+        self.assertEqual(self.sales.status, GoalStatus.IN_PROGRESS)
+        self.assertEqual(self.root.status, GoalStatus.IN_PROGRESS)
+        self.assertAlmostEqual(self.root.progress, 75.0)
+        self.assertIn(self.root.id, self.goals.active_goals)
+    
+    def test_tasks_only_link_to_leaves(self):
+        """Tasks cannot be linked to goals with sub-goals; cycles are rejected"""
+        with self.assertRaises(ValueError):
+            self._task(self.root)
+        with self.assertRaises(ValueError):
+            self.goals.add_sub_goal(self.product.id, self.root.id)
+        self.assertEqual(
+            [g.id for g in self.goals.get_goal_path(self.sales.id)],
+            [self.sales.id, self.root.id]
+        )
+    
+    def test_agent_completion_reaches_goal(self):
+        """Agent-side completion is forwarded through the callback"""
+        agent = MockAgent("dev", "Developer", "technology", [])
+        agent.completion_callbacks.append(
+            lambda task: self.tasks.update_task_status(task.id, "completed")
+        )
+        task = self._task(self.sales)
+        
+        async def scenario():
+            await agent.receive_task(task)
+            await agent.complete_task(task.id, "done")
+        asyncio.run(scenario())
+        
+        self.assertEqual(self.sales.status, GoalStatus.COMPLETED)
+        self.assertAlmostEqual(self.root.progress, 25.0)
+
+
+class TestGoalCatalog(unittest.TestCase):
+    """Indexed, persisted goal catalog test suite"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "goals.db"
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_indexed_queries(self):
+        """Goals are filtered by period, department, owner and status"""
+        manager = GoalManager()
+        monthly = manager.set_department_goal("sales", "Satış", "", GoalPeriod.MONTHLY, "CSO")
+        manager.set_department_goal("technology", "API", "", GoalPeriod.WEEKLY, "CTO")
+        manager.set_company_goal("Büyüme", "", GoalPeriod.MONTHLY)
+        
+        self.assertEqual(len(manager.find_goals(period=GoalPeriod.MONTHLY)), 2)
+        self.assertEqual(manager.find_goals(department="sales", period="monthly"), [monthly])
+        self.assertEqual(manager.get_department_goals("technology")[0].owner, "CTO")
+        
+        manager.complete_goal(monthly.id)
+        self.assertEqual(manager.find_goals(status=GoalStatus.COMPLETED), [monthly])
+        self.assertEqual(len(manager.get_active_goals(GoalPeriod.MONTHLY)), 1)
+        self.assertEqual(manager.get_summary()["by_period"]["monthly"], 2)
+    
+    def test_persistence_round_trip(self):
+        """Saved goals, their tree and status reload from SQLite"""
+        manager = GoalManager(catalog_path=self.path)
+        root = manager.set_company_goal("Büyüme", "", GoalPeriod.QUARTERLY)
+        leaf = manager.set_department_goal(
+            "sales", "Satış", "", GoalPeriod.MONTHLY, "CSO", parent_id=root.id
+        )
+        manager.set_department_goal("sales", "Diğer", "", GoalPeriod.MONTHLY, "CSO", parent_id=root.id)
+        manager.complete_goal(leaf.id)
+        self.assertEqual(manager.save_goals(), 3)
+        self.assertEqual(manager.save_goals(), 0)
+        
+        reloaded = GoalManager(catalog_path=self.path)
+        self.assertEqual(len(reloaded.goals), 3)
+        self.assertAlmostEqual(reloaded.goals[root.id].progress, 50.0)
+        self.assertIn(leaf.id, reloaded.completed_goals)
+        self.assertEqual(reloaded.find_goals(owner="CSO", status="in_progress"), [])
+        
+        # Ağaç toplamları yeniden kurulur - kalan yaprak tamamlanınca kök biter
+        other = reloaded.find_goals(status=GoalStatus.NOT_STARTED, department="sales")[0]
+        reloaded.complete_goal(other.id)
+        self.assertEqual(reloaded.goals[root.id].status, GoalStatus.COMPLETED)
+    
+    def test_config_goals_not_duplicated(self):
+        """Reloading config goals over a persisted catalog keeps one copy"""
+        config = {"company": {"goals": {"weekly": ["Demo"]}}}
+        manager = GoalManager(catalog_path=self.path)
+        manager.load_goals_from_config(config)
+        manager.save_goals()
+        
+        reloaded = GoalManager(catalog_path=self.path)
+        reloaded.load_goals_from_config(config)
+        self.assertEqual(len(reloaded.goals), 1)
+    
+    def test_shutdown_saves_goals(self):
+        """Goal changes made during a run are written to the catalog on shutdown"""
+        company = AutonomousCompany(pacing=PacingPolicy())
+        company.goal_manager = GoalManager(catalog_path=self.path)
+        company.goal_manager.set_company_goal("Büyüme", "", GoalPeriod.QUARTERLY)
+        
+        asyncio.run(company.shutdown())
+        self.assertEqual(len(GoalManager(catalog_path=self.path).goals), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Unit Tests - Provider Hot Reload Tests
+"""
+import unittest
+import asyncio
+import os
+from datetime import datetime
+from unittest import mock
+from agents.ai_agent import AIAgent
+from systems.ai_provider import AIProvider
+from systems.simulated_provider import SimulatedLLM
+from utils.clock import VirtualClock, get_clock, set_clock
+
+NO_KEYS = {"OPENAI_API_KEY": "", "ANTHROPIC_API_KEY": "", "GOOGLE_API_KEY": ""}
+
+
+class TestHotReload(unittest.TestCase):
+    """Provider reload test suite"""
+    
+    def setUp(self):
+        self.previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+        patcher = mock.patch.dict(os.environ, NO_KEYS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.provider = AIProvider(auto_mode=True)
+        self.provider.auto_config.reload()
+        # Her client, oluşturulduğu model ve nesille adlandırılır
+        self.provider.create_client = lambda path: SimulatedLLM(
+            f"{path}@{self.provider.generation}", latency=5.0, jitter=0.0
+        )
+    
+    def tearDown(self):
+        set_clock(self.previous)
+        self.provider.auto_config.reload()
+    
+    def test_reload_picks_up_new_keys(self):
+        """New keys change assignments without recreating the provider"""
+        self.assertEqual(self.provider.get_ai_for_role("CTO").primary_ai, "demo/simulated")
+        
+        os.environ["OPENAI_API_KEY"] = "sk-test"
+        self.assertTrue(self.provider.reload())
+        self.assertEqual(self.provider.generation, 1)
+        self.assertEqual(self.provider.get_ai_for_role("CTO").primary_ai, "gpt-4-turbo")
+        self.assertFalse(self.provider.reload())
+    
+    def test_in_flight_call_finishes_on_old_client(self):
+        """A call started before reload completes on the old client; the next uses the new one"""
+        agent = AIAgent("A", "CTO", "technology", ["leadership"], ai_provider_manager=self.provider)
+        
+        async def scenario():
+            in_flight = asyncio.create_task(agent._invoke([]))
+            await get_clock().sleep(1)
+            os.environ["OPENAI_API_KEY"] = "sk-test"
+            self.provider.reload()
+            first = await in_flight
+            second = await agent._invoke([])
+            return first, second
+        
+        first, second = asyncio.run(scenario())
+        self.assertEqual(first.response_metadata["model"], "demo/simulated@0")
+        self.assertEqual(second.response_metadata["model"], "openai/gpt-4-turbo@1")
+        self.assertEqual(agent.assigned_ai, "gpt-4-turbo")
+    
+    def test_agents_resolve_incrementally(self):
+        """Only agents that make a call after reload rebuild their client"""
+        agents = [
+            AIAgent(f"A{i}", "Support Agent", "ops", ["support"], ai_provider_manager=self.provider)
+            for i in range(3)
+        ]
+        for agent in agents:
+            agent.llm
+        
+        self.provider.reload()
+        agents[0].llm
+        self.assertEqual(agents[0]._generation, 1)
+        self.assertEqual([a._generation for a in agents[1:]], [0, 0])
+    
+    def test_pinned_client_survives_reload(self):
+        """Clients assigned explicitly are kept across reloads"""
+        agent = AIAgent("A", "CTO", "technology", ["leadership"], ai_provider_manager=self.provider)
+        pinned = SimulatedLLM("pinned")
+        agent.llm = pinned
+        self.provider.reload()
+        self.assertIs(agent.llm, pinned)
+
+
+if __name__ == "__main__":
+    unittest.main()
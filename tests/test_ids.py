@@ -0,0 +1,58 @@
+"""
+Unit Tests - ID Service Tests
+"""
+import unittest
+import logging
+import threading
+from datetime import datetime, timedelta
+from utils.ids import new_id, id_to_datetime, id_bounds, id_in_range
+
+logger = logging.getLogger(__name__)
+
+
+class TestIDService(unittest.TestCase):
+    """ID generator test suite"""
+    
+    def test_prefix_and_length(self):
+        """IDs keep their entity prefix"""
+        entity_id = new_id("msg")
+        self.assertTrue(entity_id.startswith("msg_"))
+        self.assertEqual(len(entity_id), len("msg_") + 26)
+    
+    def test_monotonic(self):
+        """IDs generated in a tight loop are unique and sorted"""
+        ids = [new_id() for _ in range(10000)]
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(ids, sorted(ids))
+    
+    def test_threads_no_collision(self):
+        """Concurrent generation does not collide"""
+        results = []
+        
+        def worker():
+            results.extend(new_id("goal") for _ in range(2000))
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        self.assertEqual(len(set(results)), 8000)
+    
+    def test_time_queries(self):
+        """Timestamps and time ranges can be derived from IDs"""
+        before = datetime.now() - timedelta(seconds=1)
+        entity_id = new_id("meeting")
+        after = datetime.now() + timedelta(seconds=1)
+        
+        self.assertTrue(before <= id_to_datetime(entity_id) <= after)
+        self.assertTrue(id_in_range(entity_id, before, after))
+        self.assertFalse(id_in_range(entity_id, after))
+        
+        low, high = id_bounds(before, after, prefix="meeting")
+        self.assertTrue(low <= entity_id <= high)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Unit Tests - Import-Time Budget Tests
+"""
+import unittest
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Soğuk import için üst sınır (sn) - LangChain yüklenirse tek başına bunu aşar
+IMPORT_BUDGET = 1.0
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+heavy = sorted(m for m in sys.modules if m.split('.')[0] in ('langchain', 'langchain_core', 'langchain_openai', 'langchain_anthropic', 'openai'))
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def _cold_import(module: str) -> dict:
+    """Modülü temiz bir yorumlayıcıda import et"""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestImportBudget(unittest.TestCase):
+    """Cold import test suite"""
+    
+    def test_company_import_skips_langchain(self):
+        """Importing the company does not load LangChain or provider SDKs"""
+        result = _cold_import("core.company")
+        self.assertEqual(result["heavy"], [])
+        self.assertLess(result["elapsed"], IMPORT_BUDGET)
+    
+    def test_core_package_is_lazy(self):
+        """Importing the core package does not import its subsystems"""
+        output = subprocess.run(
+            [sys.executable, "-c", "import sys, core; print('agents.factory' in sys.modules)"],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+    
+    def test_goal_tools_import_within_budget(self):
+        """Goal tooling imports stay within budget"""
+        result = _cold_import("systems.goals")
+        self.assertEqual(result["heavy"], [])
+        self.assertLess(result["elapsed"], IMPORT_BUDGET)
+
+    
+    def test_systems_star_import_resolves(self):
+        """Every name in systems.__all__ resolves on star import"""
+        output = subprocess.run(
+            [sys.executable, "-c", "import systems; from systems import *; print(sorted(set(systems.__all__) - set(dir())))"],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "[]")
+
+    
+    def test_agents_star_import_resolves(self):
+        """Every name in agents.__all__ resolves on star import"""
+        output = subprocess.run(
+            [sys.executable, "-c", "import agents; from agents import *; print(sorted(set(agents.__all__) - set(dir())))"],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Unit Tests - LLM Router Tests
+"""
+import unittest
+import asyncio
+import os
+from collections import Counter
+from datetime import datetime
+from unittest import mock
+from systems.ai_provider import AIProvider
+from systems.llm_router import Backend, LLMRouter, NoHealthyBackend, RoutedLLM
+from utils.clock import VirtualClock, get_clock, set_clock
+
+
+class FakeLLM:
+    """Records calls, optionally failing or taking simulated time"""
+    
+    def __init__(self, name, fail=False, latency=0.0):
+        self.name = name
+        self.fail = fail
+        self.latency = latency
+        self.calls = 0
+    
+    async def ainvoke(self, messages):
+        self.calls += 1
+        if self.latency:
+            await get_clock().sleep(self.latency)
+        if self.fail:
+            raise RuntimeError(f"{self.name} down")
+        return self.name
+
+
+class TestLLMRouter(unittest.TestCase):
+    """Load balancing and failover test suite"""
+    
+    def setUp(self):
+        self.previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+    
+    def tearDown(self):
+        set_clock(self.previous)
+    
+    def test_round_robin_spreads_calls(self):
+        """Calls alternate between equivalent backends"""
+        a, b = FakeLLM("a"), FakeLLM("b")
+        router = LLMRouter.from_strategy([Backend("x/a", a), Backend("y/b", b)], "round-robin-with-fallback")
+        
+        async def scenario():
+            return [await router.ainvoke([]) for _ in range(10)]
+        
+        self.assertEqual(Counter(asyncio.run(scenario())), {"a": 5, "b": 5})
+    
+    def test_least_outstanding_prefers_idle_backend(self):
+        """Concurrent calls go to the backend with fewer requests in flight"""
+        slow, fast = FakeLLM("slow", latency=10), FakeLLM("fast", latency=1)
+        router = LLMRouter.from_strategy([Backend("x/slow", slow), Backend("y/fast", fast)], "least-outstanding")
+        
+        async def scenario():
+            async def caller(delay):
+                await get_clock().sleep(delay)
+                return await router.ainvoke([])
+            return await asyncio.gather(*(caller(i * 2) for i in range(5)))
+        
+        asyncio.run(scenario())
+        self.assertEqual(slow.calls, 1)
+        self.assertEqual(fast.calls, 4)
+    
+    def test_cancelled_call_releases_slot(self):
+        """A cancelled call does not leak an outstanding request"""
+        slow = FakeLLM("slow", latency=10)
+        backend = Backend("x/slow", slow)
+        router = LLMRouter.from_strategy([backend], "least-outstanding")
+        
+        async def scenario():
+            call = asyncio.ensure_future(router.ainvoke([]))
+            await get_clock().sleep(1)
+            call.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await call
+        
+        asyncio.run(scenario())
+        self.assertEqual(backend.outstanding, 0)
+    
+    def test_failover_and_circuit_breaker(self):
+        """Failing backends are skipped and then taken out of rotation"""
+        broken, healthy = FakeLLM("broken", fail=True), FakeLLM("healthy")
+        router = LLMRouter([Backend("x/broken", broken), Backend("y/healthy", healthy)],
+                           failure_threshold=2, cooldown=60)
+        
+        async def scenario():
+            return [await router.ainvoke([]) for _ in range(6)]
+        
+        self.assertEqual(asyncio.run(scenario()), ["healthy"] * 6)
+        self.assertEqual(broken.calls, 2)
+        self.assertFalse(router.get_stats()[0]["healthy"])
+    
+    def test_all_backends_failing_raises(self):
+        """When every backend fails the caller sees NoHealthyBackend"""
+        router = LLMRouter([Backend("x/a", FakeLLM("a", fail=True)), Backend("y/b", FakeLLM("b", fail=True))])
+        with self.assertRaises(NoHealthyBackend):
+            asyncio.run(router.ainvoke([]))
+    
+    def test_throughput_is_sum_of_rate_limits(self):
+        """Two providers at 60 rpm serve 240 calls in two simulated minutes"""
+        router = LLMRouter([Backend("x/a", FakeLLM("a"), 60), Backend("y/b", FakeLLM("b"), 60)])
+        start = get_clock().timestamp()
+        
+        async def scenario():
+            await asyncio.gather(*(router.ainvoke([]) for _ in range(240)))
+        
+        asyncio.run(scenario())
+        self.assertLessEqual(get_clock().timestamp() - start, 61)
+
+
+class TestProviderPools(unittest.TestCase):
+    """AIProvider load balancing test suite"""
+    
+    @mock.patch.dict(os.environ, {"OPENAI_API_KEY": "sk-a", "ANTHROPIC_API_KEY": "sk-b", "GOOGLE_API_KEY": ""})
+    def test_equivalent_tier_shares_router(self):
+        """Models of the same tier across keyed providers share one pool"""
+        provider = AIProvider(auto_mode=False)
+        provider.create_client = lambda path: FakeLLM(path)
+        
+        gpt4 = provider.create_llm_client("openai/gpt-4")
+        sonnet = provider.create_llm_client("anthropic/claude-3-sonnet-20240229")
+        self.assertIsInstance(gpt4, RoutedLLM)
+        self.assertIs(gpt4, sonnet)
+        self.assertEqual(
+            sorted(b.path for b in gpt4.router.backends),
+            ["anthropic/claude-3-sonnet-20240229", "openai/gpt-4"]
+        )
+    
+    @mock.patch.dict(os.environ, {"OPENAI_API_KEY": "sk-a", "ANTHROPIC_API_KEY": "", "GOOGLE_API_KEY": ""})
+    def test_single_provider_uses_plain_client(self):
+        """With one keyed provider the client is not wrapped"""
+        provider = AIProvider(auto_mode=False)
+        provider.create_client = lambda path: FakeLLM(path)
+        self.assertNotIsInstance(provider.create_llm_client("openai/gpt-4"), RoutedLLM)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+"""
+Unit Tests - Mailbox Backpressure Tests
+"""
+import unittest
+import asyncio
+import logging
+from agents.base_agent import BaseAgent, Task, Message
+from agents.mailbox import Mailbox, OverflowPolicy
+from datetime import datetime
+from utils.clock import VirtualClock, get_clock, set_clock
+
+logger = logging.getLogger(__name__)
+
+
+class MockAgent(BaseAgent):
+    """Concrete implementation of BaseAgent for testing"""
+    
+    async def execute_task(self, task: Task) -> str:
+        return f"Executed: {task.title}"
+    
+    async def generate_meeting_contribution(self, meeting_info: dict) -> dict:
+        return {"agent": self.name, "contribution": "ok"}
+
+
+def make_message(i: int, subject: str = "Update") -> Message:
+    return Message(id=f"msg-{i}", from_agent="Sender", to_agent="Receiver",
+                   subject=subject, content=str(i))
+
+
+def make_task(i: int, title: str = None) -> Task:
+    return Task(id=f"task-{i}", title=title or f"Task {i}", description="",
+                assigned_to="Receiver", assigned_by="Manager", department="qa")
+
+
+class TestMailbox(unittest.TestCase):
+    """Mailbox policy test suite"""
+    
+    def test_drop_oldest(self):
+        """Drop-oldest keeps the newest items within capacity"""
+        box = Mailbox(capacity=3, policy=OverflowPolicy.DROP_OLDEST)
+        for i in range(10):
+            asyncio.run(box.put(i))
+        
+        self.assertEqual(box.peek(), [7, 8, 9])
+        self.assertEqual(box.get_metrics()["dropped"], 7)
+    
+    def test_coalesce(self):
+        """Coalesce replaces queued items with the same key"""
+        box = Mailbox(capacity=10, policy=OverflowPolicy.COALESCE,
+                      coalesce_key=lambda m: m.subject)
+        for i in range(5):
+            asyncio.run(box.put(make_message(i, subject="Status")))
+        asyncio.run(box.put(make_message(99, subject="Other")))
+        
+        self.assertEqual([m.content for m in box.peek()], ["4", "99"])
+        self.assertEqual(box.get_metrics()["coalesced"], 4)
+    
+    def test_block_waits_for_space(self):
+        """Block policy suspends the sender until the consumer drains"""
+        async def scenario():
+            box = Mailbox(capacity=1, policy=OverflowPolicy.BLOCK, block_timeout=1)
+            await box.put("first")
+            sender = asyncio.create_task(box.put("second"))
+            await asyncio.sleep(0.01)
+            self.assertFalse(sender.done())
+            box.get_nowait()
+            return await sender, box
+        
+        accepted, box = asyncio.run(scenario())
+        self.assertTrue(accepted)
+        self.assertEqual(box.peek(), ["second"])
+        self.assertEqual(box.get_metrics()["blocked"], 1)
+    
+    def test_block_timeout_rejects(self):
+        """Block policy gives up after its timeout"""
+        async def scenario():
+            box = Mailbox(capacity=1, policy=OverflowPolicy.BLOCK, block_timeout=0.01)
+            await box.put("first")
+            return await box.put("second"), box
+        
+        accepted, box = asyncio.run(scenario())
+        self.assertFalse(accepted)
+        self.assertEqual(box.get_metrics()["dropped"], 1)
+
+    def test_block_timeout_uses_clock(self):
+        """Block timeouts are measured on the simulation clock"""
+        previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+        try:
+            async def scenario():
+                box = Mailbox(capacity=1, policy=OverflowPolicy.BLOCK, block_timeout=300)
+                await box.put("first")
+                started = get_clock().timestamp()
+                accepted = await box.put("second")
+                return accepted, get_clock().timestamp() - started
+            
+            accepted, waited = asyncio.run(scenario())
+        finally:
+            set_clock(previous)
+        self.assertFalse(accepted)
+        self.assertEqual(waited, 300)
+
+
+class TestAgentMailbox(unittest.TestCase):
+    """Agent mailbox integration test suite"""
+    
+    def setUp(self):
+        self.agent = MockAgent(name="Receiver", role="tester", department="qa",
+                               skills=["testing"], mailbox_capacity=5)
+    
+    def test_message_storm_is_bounded(self):
+        """A message storm cannot grow the inbox past its capacity"""
+        for i in range(1000):
+            asyncio.run(self.agent.receive_message(make_message(i, subject=f"S{i}")))
+        
+        metrics = self.agent.get_mailbox_metrics()["messages"]
+        self.assertEqual(metrics["depth"], 5)
+        self.assertEqual(metrics["dropped"], 995)
+        self.assertLessEqual(len(self.agent.memory.messages_received), 10)
+    
+    def test_task_overflow_cancels_oldest(self):
+        """Dropped tasks leave the active list"""
+        tasks = [make_task(i) for i in range(7)]
+        for task in tasks:
+            asyncio.run(self.agent.receive_task(task))
+        
+        self.assertEqual(len(self.agent.memory.tasks_active), 5)
+        self.assertEqual(tasks[0].status, "cancelled")
+        
+        asyncio.run(self.agent.complete_task("task-6", "done"))
+        self.assertEqual(self.agent.task_inbox.depth, 4)
+
+    
+    def test_running_task_is_not_evicted(self):
+        """Overflow skips the in-progress task and drops the oldest pending one"""
+        tasks = [make_task(i) for i in range(6)]
+        tasks[0].status = "in_progress"
+        for task in tasks:
+            asyncio.run(self.agent.receive_task(task))
+        
+        self.assertEqual(tasks[0].status, "in_progress")
+        self.assertEqual(tasks[1].status, "cancelled")
+        self.assertIn(tasks[0], self.agent.memory.tasks_active)
+    
+    def test_coalesce_by_task_id(self):
+        """Tasks sharing a title are distinct; resending an id replaces the pending task"""
+        self.agent.configure_mailbox(5, OverflowPolicy.COALESCE)
+        first, second = make_task(1, title="Rapor"), make_task(2, title="Rapor")
+        update = make_task(1, title="Rapor v2")
+        for task in (first, second, update):
+            asyncio.run(self.agent.receive_task(task))
+        
+        self.assertEqual([t.title for t in self.agent.task_inbox.peek()], ["Rapor v2", "Rapor"])
+        self.assertEqual(first.status, "cancelled")
+        self.assertEqual(second.status, "pending")
+    
+    def test_work_cycle_consumes_task_inbox(self):
+        """The work cycle executes queued tasks and empties the task inbox"""
+        for i in range(3):
+            asyncio.run(self.agent.receive_task(make_task(i)))
+        self.agent.completion_callbacks.append(
+            lambda task: setattr(self.agent, "is_active", bool(self.agent.task_inbox.depth))
+        )
+        
+        previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+        try:
+            asyncio.run(self.agent.work_cycle())
+        finally:
+            set_clock(previous)
+        self.assertEqual(self.agent.task_inbox.depth, 0)
+        self.assertEqual(self.agent.performance_metrics["tasks_completed"], 3)
+    
+    def test_failed_task_leaves_inbox(self):
+        """A task whose execution raises is blocked and frees its inbox slot"""
+        class FailingAgent(MockAgent):
+            async def execute_task(self, task: Task) -> str:
+                if task.id == "task-0":
+                    raise RuntimeError("LLM hatası")
+                return await super().execute_task(task)
+        
+        agent = FailingAgent(name="Receiver", role="tester", department="qa", skills=["testing"],
+                             mailbox_capacity=5, mailbox_policy=OverflowPolicy.BLOCK)
+        tasks = [make_task(i) for i in range(2)]
+        for task in tasks:
+            asyncio.run(agent.receive_task(task))
+        agent.completion_callbacks.append(lambda task: setattr(agent, "is_active", False))
+        
+        previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+        try:
+            asyncio.run(agent.work_cycle())
+        finally:
+            set_clock(previous)
+        self.assertEqual(tasks[0].status, "blocked")
+        self.assertEqual(agent.task_inbox.depth, 0)
+        self.assertIsNone(agent.current_task)
+        self.assertEqual(agent.performance_metrics["tasks_failed"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
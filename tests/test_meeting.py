@@ -0,0 +1,238 @@
+"""
+Unit Tests - Meeting System & Store Tests
+"""
+import unittest
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from agents.base_agent import BaseAgent, Task
+from agents.ai_agent import _parse_contributions
+from systems.meeting import MeetingSystem, MeetingMode
+from systems.meeting_store import MeetingStore, MeetingDigest
+from utils.clock import VirtualClock, set_clock
+
+logger = logging.getLogger(__name__)
+
+START = datetime(2026, 1, 1, 9, 0)
+
+
+class MockAgent(BaseAgent):
+    """Mock agent for testing"""
+    
+    async def execute_task(self, task: Task) -> str:
+        return f"Executed: {task.title}"
+    
+    async def generate_meeting_contribution(self, meeting_info: dict) -> dict:
+        return {"agent": self.name, "role": self.role, "contribution": "ok"}
+
+
+class FacilitatorAgent(MockAgent):
+    """Mock facilitator that synthesizes all but one contribution in one call"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.synthesis_calls = 0
+        self.individual_calls = 0
+    
+    async def synthesize_meeting_contributions(self, meeting_info, participants):
+        self.synthesis_calls += 1
+        return {agent.name: f"{agent.role} özeti" for agent in participants[:-1]}
+
+
+class GarbledFacilitatorAgent(FacilitatorAgent):
+    """Mock facilitator whose synthesis response cannot be parsed"""
+    
+    async def synthesize_meeting_contributions(self, meeting_info, participants):
+        self.synthesis_calls += 1
+        return _parse_contributions("Katkılar: herkes iyi durumda.")
+
+
+class CountingAgent(MockAgent):
+    """Mock agent counting individual contribution calls"""
+    
+    calls = 0
+    
+    async def generate_meeting_contribution(self, meeting_info: dict) -> dict:
+        CountingAgent.calls += 1
+        return await super().generate_meeting_contribution(meeting_info)
+
+
+class TestMeetingModes(unittest.TestCase):
+    """Synthesized meeting mode test suite"""
+    
+    def setUp(self):
+        CountingAgent.calls = 0
+        self.facilitator = FacilitatorAgent("Lead", "Manager", "technology", {})
+        self.agents = [self.facilitator] + [
+            CountingAgent(f"Dev {i}", "Developer", "technology", {}) for i in range(4)
+        ]
+    
+    def _review(self, system):
+        async def scenario():
+            meeting = await system.schedule_weekly_review(
+                "technology", self.agents, self.facilitator, START
+            )
+            return await system.conduct_weekly_review(meeting, self.agents)
+        return asyncio.run(scenario())
+    
+    def test_individual_mode_is_default(self):
+        """Without configuration each participant contributes separately"""
+        result = self._review(MeetingSystem())
+        
+        self.assertEqual(self.facilitator.synthesis_calls, 0)
+        self.assertEqual(CountingAgent.calls, 4)
+        self.assertEqual(len(result["contributions"]), 5)
+    
+    def test_synthesized_mode_falls_back_per_agent(self):
+        """One synthesis call covers most agents; missing ones are asked directly"""
+        system = MeetingSystem(modes={"weekly_review": "synthesized"})
+        result = self._review(system)
+        
+        self.assertEqual(self.facilitator.synthesis_calls, 1)
+        self.assertEqual(CountingAgent.calls, 1)
+        self.assertEqual([c["agent"] for c in result["contributions"]], [a.name for a in self.agents])
+        self.assertTrue(result["contributions"][1]["synthesized"])
+        self.assertEqual(system.contribution_metrics["synthesis_fallbacks"], 1)
+        self.assertEqual(system.get_mode("weekly_review"), MeetingMode.SYNTHESIZED)
+    
+    def test_unparseable_synthesis_asks_everyone(self):
+        """A synthesis response that cannot be parsed falls back for every agent"""
+        self.facilitator = GarbledFacilitatorAgent("Lead", "Manager", "technology", {})
+        self.agents[0] = self.facilitator
+        system = MeetingSystem(modes={"weekly_review": "synthesized"})
+        result = self._review(system)
+        
+        self.assertEqual(self.facilitator.synthesis_calls, 1)
+        self.assertEqual(CountingAgent.calls, 4)
+        self.assertEqual(len(result["contributions"]), 5)
+        self.assertFalse(any(c.get("synthesized") for c in result["contributions"]))
+        self.assertEqual(system.contribution_metrics["synthesis_fallbacks"], 5)
+    
+    def test_unsupported_meeting_type_rejected(self):
+        """Modes only apply to meeting types whose contributions use the LLM"""
+        with self.assertRaises(ValueError):
+            MeetingSystem(modes={"daily_standup": "synthesized"})
+        with self.assertRaises(ValueError):
+            MeetingSystem().set_mode("monthly_planning", MeetingMode.SYNTHESIZED)
+    
+    def test_parse_contributions(self):
+        """Structured output is split back into per-agent contributions"""
+        text = 'Tabii:\n```json\n{"contributions": [{"agent": "A", "contribution": "x"}, {"agent": "B"}]}\n```'
+        self.assertEqual(_parse_contributions(text), {"A": "x"})
+        self.assertEqual(_parse_contributions("geçersiz"), {})
+
+
+class TestMeetingStore(unittest.TestCase):
+    """Indexed meeting store test suite"""
+    
+    def setUp(self):
+        self.clock = VirtualClock(START)
+        self.previous = set_clock(self.clock)
+        self.system = MeetingSystem(MeetingStore(
+            transcript_ttl=timedelta(days=7),
+            retention=timedelta(days=30)
+        ))
+        self.tech = [MockAgent(f"Dev {i}", "Developer", "technology", {}) for i in range(3)]
+        self.sales = [MockAgent(f"Rep {i}", "Sales Rep", "sales", {}) for i in range(2)]
+    
+    def tearDown(self):
+        set_clock(self.previous)
+    
+    def _run_standup(self, department, agents):
+        async def scenario():
+            meeting = await self.system.schedule_daily_standup(
+                department, agents, agents[0], self.clock.now()
+            )
+            await self.system.conduct_daily_standup(meeting, agents)
+            return meeting
+        return asyncio.run(scenario())
+    
+    def test_indexed_lookups(self):
+        """Meetings are found by id, type, department, participant and time"""
+        first = self._run_standup("technology", self.tech)
+        self.clock.advance(timedelta(days=1))
+        second = self._run_standup("sales", self.sales)
+        
+        store = self.system.store
+        self.assertIs(store.get(first.id), first)
+        self.assertEqual(self.system.find_meetings(department="sales"), [second])
+        self.assertEqual(self.system.find_meetings(participant="Dev 1"), [first])
+        self.assertEqual(len(self.system.find_meetings(type="daily_standup")), 2)
+        self.assertEqual(
+            self.system.find_meetings(start=START + timedelta(hours=12)),
+            [second]
+        )
+        self.assertEqual(self.system.find_meetings(type="weekly_review"), [])
+    
+    def test_upcoming_only_scans_pending(self):
+        """Completed meetings leave the upcoming set"""
+        async def schedule():
+            return await self.system.schedule_daily_standup(
+                "technology", self.tech, self.tech[0], START + timedelta(days=1)
+            )
+        pending = asyncio.run(schedule())
+        self._run_standup("sales", self.sales)
+        
+        self.assertEqual(self.system.get_upcoming_meetings(), [pending])
+        self.assertEqual(self.system.store.get_stats()["upcoming"], 1)
+    
+    def test_old_transcripts_are_compacted(self):
+        """Notes are dropped after the TTL while decisions survive"""
+        meeting = self._run_standup("technology", self.tech)
+        meeting.decisions = [{"decision": "ship"}]
+        
+        self.clock.advance(timedelta(days=8))
+        self.system.compact_transcripts()
+        
+        record = self.system.store.get(meeting.id)
+        self.assertIsInstance(record, MeetingDigest)
+        self.assertEqual(record.decisions, [{"decision": "ship"}])
+        self.assertEqual(record.note_count, 3)
+        
+        summary = asyncio.run(self.system.get_meeting_summary(meeting.id))
+        self.assertTrue(summary["compacted"])
+        self.assertEqual(summary["notes"], [])
+    
+    def test_moved_meeting_is_conducted_at_booked_time(self):
+        """A booking pushed later by a conflict waits for its slot"""
+        async def scenario():
+            first = await self.system.schedule_daily_standup(
+                "technology", self.tech, self.tech[0], self.clock.now()
+            )
+            second = await self.system.schedule_daily_standup(
+                "technology", self.tech, self.tech[0], self.clock.now()
+            )
+            await self.system.conduct_daily_standup(first, self.tech)
+            await self.system.conduct_daily_standup(second, self.tech)
+            return first, second
+        
+        first, second = asyncio.run(scenario())
+        self.assertGreater(second.scheduled_time, first.scheduled_time)
+        self.assertGreaterEqual(self.clock.now(), second.scheduled_time)
+        self.assertEqual(second.status, "completed")
+    
+    def test_calendar_is_pruned_without_compaction(self):
+        """Conducting meetings drops past busy slots on the non-continuous path"""
+        for _ in range(30):
+            self._run_standup("technology", self.tech)
+            self.clock.advance(timedelta(days=1))
+        
+        busy = self.system.calendar.busy["Dev 0"]
+        self.assertLessEqual(len(busy.starts), 1)
+    
+    def test_memory_stays_flat(self):
+        """Over months only the retention window stays in memory"""
+        for _ in range(120):
+            self._run_standup("technology", self.tech)
+            self.clock.advance(timedelta(days=1))
+            self.system.compact_transcripts()
+        
+        stats = self.system.store.get_stats()
+        self.assertLessEqual(stats["total"], 31)
+        self.assertLessEqual(stats["full_transcripts"], 8)
+        self.assertLessEqual(len(self.system.find_meetings(participant="Dev 0")), 31)
+        self.assertEqual(len(self.system.get_meeting_history(limit=5)), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
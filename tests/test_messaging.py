@@ -0,0 +1,327 @@
+"""
+Unit Tests - Messaging & Message Bus Tests
+"""
+import unittest
+import asyncio
+import logging
+import tempfile
+from datetime import datetime, timedelta
+from agents.base_agent import BaseAgent, Task, Message
+from systems.message_bus import InvalidCursor, TopicLog
+from systems.messaging import MessagingSystem, CollaborationSystem, CollaborationStatus
+from systems.ai_provider import LLMConcurrencyLimiter
+from utils.clock import VirtualClock, set_clock
+
+logger = logging.getLogger(__name__)
+
+
+class MockAgent(BaseAgent):
+    """Concrete implementation of BaseAgent for testing"""
+    
+    async def execute_task(self, task: Task) -> str:
+        return f"Executed: {task.title}"
+    
+    async def generate_meeting_contribution(self, meeting_info: dict) -> dict:
+        return {"agent": self.name, "contribution": "ok"}
+    
+    async def collaborate(self, other_agent: str, topic: str) -> str:
+        await asyncio.sleep(0.05)
+        return f"Plan for {topic}"
+
+
+def make_agents(count: int):
+    return [
+        MockAgent(name=f"Agent {i}", role="tester", department="qa", skills=["testing"])
+        for i in range(count)
+    ]
+
+
+class TestMessageBus(unittest.TestCase):
+    """Pub/sub message bus test suite"""
+    
+    def setUp(self):
+        self.messaging = MessagingSystem()
+        self.agents = make_agents(5)
+        for agent in self.agents:
+            self.messaging.register_agent(agent)
+    
+    def test_broadcast_writes_once(self):
+        """Broadcast creates a single shared message"""
+        sender = self.agents[0]
+        message = asyncio.run(self.messaging.broadcast_message(sender, "Hello", "Everyone"))
+        
+        self.assertEqual(len(sender.memory.messages_sent), 1)
+        self.assertEqual(len(self.messaging.bus.topics["broadcast"]), 1)
+        self.assertEqual(self.messaging.direct_messages, [])
+        
+        for agent in self.agents[1:]:
+            received = self.messaging.fetch_bus_messages(agent.name)
+            self.assertEqual(len(received), 1)
+            self.assertIs(received[0], message)
+    
+    def test_sender_and_offsets(self):
+        """Sender does not read its own broadcast and offsets advance"""
+        sender = self.agents[0]
+        asyncio.run(self.messaging.broadcast_message(sender, "Hello", "Everyone"))
+        
+        self.assertEqual(self.messaging.fetch_bus_messages(sender.name), [])
+        self.assertEqual(len(self.messaging.get_unread_messages("Agent 1")), 1)
+        self.assertEqual(len(self.messaging.fetch_bus_messages("Agent 1")), 1)
+        self.assertEqual(self.messaging.fetch_bus_messages("Agent 1"), [])
+    
+    def test_broadcast_audience(self):
+        """Explicit recipients restrict who reads the broadcast"""
+        sender = self.agents[0]
+        asyncio.run(self.messaging.broadcast_message(
+            sender, "Hello", "Subset", recipients=["Agent 1", "Agent 2"]
+        ))
+        
+        self.assertEqual(len(self.messaging.fetch_bus_messages("Agent 1")), 1)
+        self.assertEqual(len(self.messaging.fetch_bus_messages("Agent 2")), 1)
+        self.assertEqual(self.messaging.fetch_bus_messages("Agent 3"), [])
+    
+    def test_channel_message(self):
+        """Channel members read channel messages through the bus"""
+        channel = self.messaging.create_channel(
+            "#qa", "department", [a.name for a in self.agents[:3]]
+        )
+        asyncio.run(self.messaging.send_channel_message(channel.id, self.agents[0], "Standup"))
+        
+        self.assertEqual(len(self.messaging.fetch_bus_messages("Agent 1")), 1)
+        self.assertEqual(self.messaging.fetch_bus_messages("Agent 4"), [])
+        self.assertEqual(self.agents[1].memory.messages_received, [])
+    
+    def test_broadcast_reaches_work_cycle(self):
+        """Agents process broadcast and channel messages in their work cycle"""
+        received = []
+        
+        async def process_message(message):
+            received.append(message.subject)
+            self.agents[1].is_active = False
+        
+        self.agents[1].process_message = process_message
+        channel = self.messaging.create_channel("#qa", "department", [a.name for a in self.agents[:2]])
+        
+        async def scenario():
+            await self.messaging.broadcast_message(self.agents[0], "Hello", "Everyone")
+            await self.messaging.send_channel_message(channel.id, self.agents[0], "Standup")
+            self.assertEqual((await self.agents[1].get_status())["unread_messages"], 2)
+            await self.agents[1].work_cycle()
+        
+        previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+        try:
+            asyncio.run(scenario())
+        finally:
+            set_clock(previous)
+        self.assertEqual(received, ["Hello", "Message in #qa"])
+        self.assertEqual(self.messaging.get_unread_messages("Agent 1"), [])
+    
+    def test_mailbox_metrics_by_department(self):
+        """Mailbox metrics are aggregated per department"""
+        asyncio.run(self.messaging.send_message(self.agents[0], "Agent 1", "Hi", "There"))
+        metrics = self.messaging.get_mailbox_metrics()
+        
+        self.assertEqual(metrics["agents"]["Agent 1"]["messages"]["depth"], 1)
+        self.assertEqual(metrics["departments"]["qa"]["agents"], 5)
+        self.assertEqual(metrics["departments"]["qa"]["depth"], 1)
+    
+    def test_lagging_subscriber_drop_is_counted(self):
+        """Retention that skips an unread cursor is recorded per subscriber"""
+        messaging = MessagingSystem(segment_size=4, max_segments=2)
+        agents = make_agents(2)
+        for agent in agents:
+            messaging.register_agent(agent)
+        for i in range(20):
+            asyncio.run(messaging.broadcast_message(agents[0], "Ping", str(i)))
+        
+        received = messaging.fetch_bus_messages("Agent 1")
+        self.assertEqual(received[-1].content, "19")
+        self.assertEqual(len(received) + messaging.bus.dropped_unread["Agent 1"], 20)
+        metrics = messaging.get_mailbox_metrics()
+        self.assertEqual(metrics["bus_dropped_unread"]["Agent 1"], 20 - len(received))
+        self.assertEqual(metrics["departments"]["qa"]["dropped_unread"], 20 - len(received))
+    
+    def test_wait_wakes_subscriber(self):
+        """Waiting subscribers are woken by a publish"""
+        async def scenario():
+            waiter = asyncio.create_task(self.messaging.wait_for_messages("Agent 1", timeout=1))
+            await asyncio.sleep(0)
+            await self.messaging.broadcast_message(self.agents[0], "Ping", "Wake up")
+            return await waiter
+        
+        self.assertTrue(asyncio.run(scenario()))
+        self.assertFalse(asyncio.run(self.messaging.wait_for_messages("Agent 0", timeout=0.01)))
+
+
+
+def make_message(i: int, timestamp: datetime = None) -> Message:
+    return Message(
+        id=f"msg-{i}",
+        from_agent="Agent 0",
+        to_agent="#qa",
+        subject="Test",
+        content=str(i),
+        timestamp=timestamp or datetime.now()
+    )
+
+
+class TestSegmentedTopicLog(unittest.TestCase):
+    """Segmented channel storage test suite"""
+    
+    def test_count_retention(self):
+        """Memory stays bounded by segment count"""
+        log = TopicLog("#qa", segment_size=10, max_segments=3)
+        for i in range(1000):
+            log.append(make_message(i))
+        
+        self.assertLessEqual(len(log), 30)
+        self.assertEqual(log.end_offset, 1000)
+        self.assertEqual(log.tail(1)[0].content, "999")
+    
+    def test_age_retention(self):
+        """Old segments are dropped by age"""
+        log = TopicLog("#qa", segment_size=5, max_age=timedelta(hours=1))
+        start = datetime(2026, 1, 1)
+        for i in range(20):
+            log.append(make_message(i, start + timedelta(minutes=30 * i)))
+        
+        oldest = log.read_from(0)[0][0]
+        self.assertGreaterEqual(oldest.timestamp, start + timedelta(hours=5))
+    
+    def test_cursor_pagination(self):
+        """Cursor pages walk the log without gaps"""
+        log = TopicLog("#qa", segment_size=7)
+        for i in range(50):
+            log.append(make_message(i))
+        
+        seen, cursor = [], None
+        while True:
+            page = log.read_page(cursor, limit=12)
+            seen.extend(int(m.content) for m in page.messages)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        
+        self.assertEqual(seen, list(range(50)))
+    
+    def test_malformed_cursor_rejected(self):
+        """Non-integer and out-of-range cursors raise InvalidCursor"""
+        log = TopicLog("#qa", segment_size=5)
+        for i in range(8):
+            log.append(make_message(i))
+        
+        for cursor in ("abc", "1.5", "-1", "9"):
+            with self.assertRaises(InvalidCursor):
+                log.read_page(cursor)
+        self.assertFalse(log.read_page("8").messages)
+    
+    def test_stale_cursor_reports_gap(self):
+        """A cursor older than the retained range is clamped and flagged"""
+        log = TopicLog("#qa", segment_size=5, max_segments=2)
+        for i in range(30):
+            log.append(make_message(i))
+        
+        page = log.read_page("3", limit=3)
+        self.assertTrue(page.truncated)
+        self.assertEqual(page.skipped, log.start_offset - 3)
+        self.assertEqual(int(page.messages[0].content), log.start_offset)
+        self.assertFalse(log.read_page(page.next_cursor).truncated)
+    
+    def test_compressed_archive(self):
+        """Evicted segments stay readable from the on-disk tail"""
+        with tempfile.TemporaryDirectory() as tmp:
+            log = TopicLog("#qa", segment_size=10, max_segments=2, archive_dir=tmp)
+            for i in range(100):
+                log.append(make_message(i))
+            
+            self.assertLessEqual(len(log), 20)
+            page = log.read_page(limit=25)
+            self.assertEqual([int(m.content) for m in page.messages], list(range(25)))
+            page = log.read_page(page.next_cursor, limit=100)
+            self.assertEqual(int(page.messages[-1].content), 99)
+            self.assertIsNone(page.next_cursor)
+    
+    def test_channel_page_api(self):
+        """MessagingSystem exposes bounded channel reads"""
+        messaging = MessagingSystem(segment_size=4, max_segments=2)
+        agent = make_agents(1)[0]
+        messaging.register_agent(agent)
+        channel = messaging.create_channel("#qa", "department", [agent.name])
+        for i in range(20):
+            asyncio.run(messaging.send_channel_message(channel.id, agent, str(i)))
+        
+        self.assertLessEqual(len(messaging.get_channel_messages(channel.id)), 8)
+        self.assertEqual(len(messaging.get_channel_messages(channel.id, limit=3)), 3)
+        page = messaging.get_channel_page(channel.id, limit=5)
+        self.assertEqual(len(page.messages), 5)
+        self.assertIsNotNone(page.next_cursor)
+
+
+
+class TestCollaborationSystem(unittest.TestCase):
+    """Collaboration index and lifecycle test suite"""
+    
+    def setUp(self):
+        self.messaging = MessagingSystem()
+        self.agents = make_agents(6)
+        for agent in self.agents:
+            self.messaging.register_agent(agent)
+        self.collab = CollaborationSystem(self.messaging)
+    
+    def test_batch_runs_concurrently(self):
+        """Batch collaborations overlap instead of running one by one"""
+        requests = [
+            {"initiator": self.agents[i], "collaborator_name": self.agents[i + 1].name,
+             "topic": f"Topic {i % 2}", "context": "ctx"}
+            for i in range(5)
+        ]
+        
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            results = await self.collab.initiate_collaborations(requests)
+            return results, loop.time() - start
+        
+        results, elapsed = asyncio.run(scenario())
+        self.assertEqual(len(results), 5)
+        self.assertLess(elapsed, 0.2)
+    
+    def test_indexes_and_lifecycle(self):
+        """Collaborations are indexed and move through their lifecycle"""
+        first = asyncio.run(self.collab.initiate_collaboration(
+            self.agents[0], "Agent 1", "Launch", "ctx"))
+        asyncio.run(self.collab.initiate_collaboration(
+            self.agents[2], "Agent 1", "Budget", "ctx", ttl=timedelta(seconds=-1)))
+        
+        self.assertEqual(self.collab.get_collaboration(first["id"]).topic, "Launch")
+        self.assertEqual(len(self.collab.find_collaborations(participant="Agent 1")), 2)
+        self.assertEqual(len(self.collab.find_collaborations(topic="launch")), 1)
+        
+        expired = self.collab.find_collaborations(status=CollaborationStatus.EXPIRED)
+        self.assertEqual([c.topic for c in expired], ["Budget"])
+        
+        self.assertTrue(self.collab.close_collaboration(first["id"]))
+        self.assertEqual(self.collab.active_collaborations, [])
+
+
+class TestLLMConcurrencyLimiter(unittest.TestCase):
+    """Shared LLM concurrency limit test suite"""
+    
+    def test_limit_is_enforced(self):
+        """No more than max_concurrent calls run at once"""
+        limiter = LLMConcurrencyLimiter(max_concurrent=2)
+        
+        async def call():
+            async with limiter:
+                await asyncio.sleep(0.01)
+        
+        async def scenario():
+            await asyncio.gather(*(call() for _ in range(10)))
+        
+        asyncio.run(scenario())
+        self.assertEqual(limiter.peak_in_flight, 2)
+        self.assertEqual(limiter.total_calls, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
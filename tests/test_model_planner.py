@@ -0,0 +1,93 @@
+"""
+Unit Tests - Model Planner Tests
+"""
+import unittest
+import os
+from unittest import mock
+from systems.ai_provider import AIProvider
+from systems.model_planner import ModelOption, ModelPlanner, RoleDemand
+
+MODELS = [
+    ModelOption("demo/simulated", "demo", 0.0, 1),
+    ModelOption("cheap/basic", "basic", 0.001, 5, latency=1.0),
+    ModelOption("fast/pro", "pro", 0.005, 8, latency=2.0),
+    ModelOption("big/enterprise", "enterprise", 0.02, 10, latency=4.0)
+]
+
+
+class TestModelPlanner(unittest.TestCase):
+    """Budget-constrained planner test suite"""
+    
+    def test_unlimited_budget_gives_best_models(self):
+        """Without a budget every role gets the model that covers its difficulty"""
+        plan = ModelPlanner(MODELS).plan([
+            RoleDemand("CEO", difficulty=9),
+            RoleDemand("Support Agent", difficulty=3)
+        ])
+        self.assertEqual(plan.get("CEO").primary, "big/enterprise")
+        self.assertEqual(plan.get("Support Agent").primary, "cheap/basic")
+        self.assertAlmostEqual(plan.quality, 1.0)
+    
+    def test_budget_is_respected(self):
+        """Total cost stays within the daily budget"""
+        demands = [RoleDemand(f"Role {i}", difficulty=9, agents=5) for i in range(20)]
+        unlimited = ModelPlanner(MODELS).plan(demands)
+        
+        budget = unlimited.total_cost / 3
+        plan = ModelPlanner(MODELS, daily_budget=budget).plan(demands)
+        self.assertLessEqual(plan.total_cost, budget + 1e-9)
+        self.assertLess(plan.total_value, unlimited.total_value)
+        self.assertGreater(plan.total_value, ModelPlanner(MODELS, daily_budget=0).plan(demands).total_value)
+    
+    def test_rate_limits_respected(self):
+        """Provider call caps push remaining roles to other providers"""
+        demands = [RoleDemand(f"Lead {i}", difficulty=10, agents=1, calls_per_agent=100) for i in range(5)]
+        plan = ModelPlanner(MODELS, rate_limits={"big": 250}).plan(demands)
+        self.assertLessEqual(plan.provider_calls.get("big", 0), 250)
+        self.assertEqual(
+            sum(1 for p in plan.assignments.values() if p.primary == "big/enterprise"), 2
+        )
+    
+    def test_latency_cap_excludes_slow_models(self):
+        """Roles with a latency cap never get slower models"""
+        plan = ModelPlanner(MODELS).plan([RoleDemand("Support", difficulty=10, max_latency=2.0)])
+        self.assertEqual(plan.get("Support").primary, "fast/pro")
+    
+    def test_role_demands_carry_configured_latency(self):
+        """Per-role latency limits from config reach the planner"""
+        provider = AIProvider(auto_mode=False)
+        demands = provider.role_demands(
+            ["CTO", "Support Agent"], max_latency={"Support Agent": 2.0}
+        )
+        limits = {demand.role: demand.max_latency for demand in demands}
+        self.assertEqual(limits, {"CTO": None, "Support Agent": 2.0})
+    
+    def test_thousands_of_roles_in_milliseconds(self):
+        """Planning 5,000 roles finishes quickly"""
+        demands = [RoleDemand(f"Role {i}", difficulty=1 + i % 10, agents=1 + i % 7) for i in range(5000)]
+        plan = ModelPlanner(MODELS, daily_budget=500).plan(demands)
+        self.assertEqual(len(plan.assignments), 5000)
+        self.assertLess(plan.solve_ms, 500)
+
+
+class TestProviderPlan(unittest.TestCase):
+    """AIProvider plan integration test suite"""
+    
+    @mock.patch.dict(os.environ, {"OPENAI_API_KEY": "", "ANTHROPIC_API_KEY": "", "GOOGLE_API_KEY": ""})
+    def test_agents_consume_plan_and_replan_on_key_change(self):
+        """Assignments come from the plan and follow key changes"""
+        provider = AIProvider(auto_mode=False)
+        provider.plan_models(provider.role_demands(["CTO", "Support Agent"]), daily_budget=100)
+        self.assertEqual(provider.get_ai_for_role("CTO").primary_ai, "demo/simulated")
+        self.assertEqual(provider.get_ai_for_role("CTO").reasoning, "Budget plan")
+        
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test"}):
+            self.assertTrue(provider.refresh_api_keys())
+        self.assertEqual(provider.get_ai_for_role("CTO").primary_ai, "openai/gpt-4-turbo")
+        
+        provider.set_daily_budget(0)
+        self.assertEqual(provider.get_ai_for_role("CTO").primary_ai, "demo/simulated")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Unit Tests - Org Loader Tests
+"""
+import unittest
+import time
+from collections import Counter
+from agents.ai_agent import ExecutiveAgent, ManagerAgent
+from agents.factory import AgentFactory
+from agents.org_loader import (
+    AgentKind, classify_role, iter_org_specs, generate_synthetic_org
+)
+from systems.ai_provider import AIProvider
+
+
+class TestOrgLoader(unittest.TestCase):
+    """Data-driven org loader test suite"""
+    
+    def test_arbitrary_department_tree(self):
+        """Any department name works with flat teams and nested team trees"""
+        config = {
+            "research": {
+                "teams": {
+                    "lab": [
+                        {"role": "Lab Director", "name": "Dana"},
+                        {"role": "Researcher", "name": "Eli", "skills": ["science"]}
+                    ]
+                }
+            },
+            "ops": {"team": [{"role": "Operator", "name": "Fay", "kind": "manager"}]}
+        }
+        specs = list(iter_org_specs(config))
+        
+        self.assertEqual([s.name for s in specs], ["Dana", "Eli", "Fay"])
+        self.assertEqual(specs[0].department, "Research/lab")
+        self.assertEqual(specs[0].group, "research")
+        self.assertEqual(specs[0].kind, AgentKind.MANAGER)
+        self.assertEqual(specs[1].kind, AgentKind.MEMBER)
+        self.assertEqual(specs[2].kind, AgentKind.MANAGER)
+    
+    def test_classify_role(self):
+        """Executive titles are executives only in the executive department"""
+        self.assertEqual(classify_role("CEO", executive_department=True), AgentKind.EXECUTIVE)
+        self.assertEqual(classify_role("CFO"), AgentKind.MANAGER)
+        self.assertEqual(classify_role("HR Director"), AgentKind.MANAGER)
+        self.assertEqual(classify_role("Accountant"), AgentKind.MEMBER)
+    
+    def test_factory_assigns_team_members(self):
+        """Managers get the members of their own team"""
+        factory = AgentFactory(ai_provider_manager=AIProvider(auto_mode=False), config={})
+        factory.create_agents(generate_synthetic_org(departments=2, teams_per_department=2, team_size=4))
+        
+        manager = factory.get_agent("Manager 1-0-0")
+        self.assertIsInstance(manager, ManagerAgent)
+        self.assertEqual(sorted(manager.team_members), ["Agent 1-0-0", "Agent 1-0-1", "Agent 1-0-2"])
+        self.assertEqual(len(factory.get_executives()), 5)
+        self.assertIsInstance(factory.get_agent("CEO 0"), ExecutiveAgent)
+        self.assertEqual(len(factory.get_department_agents("department_0")), 8)
+
+
+class TestSyntheticOrg(unittest.TestCase):
+    """Synthetic org generator test suite"""
+    
+    def test_size_and_determinism(self):
+        """The same parameters and seed produce the same org"""
+        first = [(s.name, s.role) for s in generate_synthetic_org(3, 4, (5, 9), seed=7)]
+        second = [(s.name, s.role) for s in generate_synthetic_org(3, 4, (5, 9), seed=7)]
+        self.assertEqual(first, second)
+        self.assertEqual(len({name for name, _ in first}), len(first))
+    
+    def test_role_mix(self):
+        """Members follow the requested role mix"""
+        mix = {"Engineer": (0.8, ["python"]), "Designer": (0.2, ["figma"])}
+        roles = Counter(
+            s.role for s in generate_synthetic_org(10, 10, 21, role_mix=mix, with_executives=False)
+            if s.kind == AgentKind.MEMBER
+        )
+        self.assertEqual(sum(roles.values()), 2000)
+        self.assertAlmostEqual(roles["Engineer"] / 2000, 0.8, delta=0.05)
+    
+    def test_ten_thousand_agents(self):
+        """A 10k-agent org streams into the factory in well under two seconds"""
+        factory = AgentFactory(ai_provider_manager=AIProvider(auto_mode=False), config={})
+        
+        started = time.perf_counter()
+        factory.create_agents(generate_synthetic_org(departments=20, teams_per_department=50, team_size=10))
+        elapsed = time.perf_counter() - started
+        
+        self.assertEqual(len(factory.agents), 10005)
+        self.assertLess(elapsed, 2.0)
+        self.assertEqual(factory.get_materialization_stats()["materialized"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit Tests - Output Length Policy Tests
+"""
+import unittest
+import asyncio
+from datetime import datetime
+from unittest import mock
+from langchain_core.messages import HumanMessage, SystemMessage
+from agents.ai_agent import AIAgent
+from agents.base_agent import Task
+from systems.ai_provider import AIProvider
+from systems.output_policy import OutputPolicyEngine
+from systems.simulated_provider import SimulatedLLM
+from utils.clock import VirtualClock, get_clock, set_clock
+
+
+class TestPolicyTable(unittest.TestCase):
+    """Policy resolution test suite"""
+    
+    def test_tier_and_priority_scale_limits(self):
+        """Short call types get small limits; tier and priority scale them"""
+        engine = OutputPolicyEngine()
+        standup = engine.resolve("meeting_contribution", "basic", "low")
+        decision = engine.resolve("decision", "enterprise", "critical")
+        self.assertEqual(standup.name, "meeting_contribution/basic/low")
+        self.assertLess(standup.max_tokens, engine.resolve("meeting_contribution").max_tokens)
+        self.assertEqual(decision.max_tokens, 750)
+        self.assertEqual(OutputPolicyEngine(overrides={"decision": 200}).resolve("decision").max_tokens, 200)
+    
+    def test_brevity_appended_to_last_message(self):
+        """The instruction goes into the user message and keeps its type"""
+        policy = OutputPolicyEngine().resolve("collaboration")
+        messages = policy.apply([SystemMessage(content="sistem"), HumanMessage(content="soru")])
+        self.assertIsInstance(messages[-1], HumanMessage)
+        self.assertTrue(messages[-1].content.startswith("soru"))
+        self.assertIn(policy.brevity, messages[-1].content)
+        self.assertEqual(messages[0].content, "sistem")
+
+
+class TestAgentOutputPolicy(unittest.TestCase):
+    """Agent max_tokens test suite"""
+    
+    def setUp(self):
+        self.previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+        self.provider = AIProvider(auto_mode=False)
+        # Model her seferinde 600 token üretmek ister, token başına 20 ms
+        self.provider.create_client = lambda path: SimulatedLLM(
+            path, latency=0.5, jitter=0.0, output_tokens=600, seconds_per_token=0.02
+        )
+        self.agent = AIAgent("Ada", "Developer", "technology", ["python"], ai_provider_manager=self.provider)
+    
+    def tearDown(self):
+        set_clock(self.previous)
+    
+    def _standup_latency(self):
+        async def scenario():
+            started = get_clock().timestamp()
+            await self.agent.generate_meeting_contribution({"type": "standup", "agenda": ["durum"]})
+            return get_clock().timestamp() - started
+        return asyncio.run(scenario())
+    
+    def test_short_calls_are_capped_and_recorded(self):
+        """Standups stop at their token limit; truncation and latency are recorded per policy"""
+        capped = self._standup_latency()
+        with mock.patch.object(AIProvider, "output_policy_enabled", False):
+            uncapped = self._standup_latency()
+        self.assertAlmostEqual(capped, 0.5 + 200 * 0.02)
+        self.assertAlmostEqual(uncapped, 0.5 + 600 * 0.02)
+        
+        task = Task(id="t1", title="Rapor", description="Haftalık rapor", assigned_to="Ada",
+                    assigned_by="Lead", department="technology")
+        asyncio.run(self.agent.execute_task(task))
+        
+        stats = self.provider.output_policy.get_stats()
+        self.assertEqual(stats["meeting_contribution/demo/medium"]["truncation_rate"], 1.0)
+        self.assertEqual(stats["task/demo/medium"]["truncated"], 0)
+        self.assertAlmostEqual(stats["meeting_contribution/demo/medium"]["p50_latency"], capped)
+    
+    def test_prompts_defer_to_length_policy(self):
+        """With the policy active the base prompts no longer ask for detailed answers"""
+        self.assertNotIn("Detaylı", self.agent.system_prompt)
+        with mock.patch.object(AIProvider, "output_policy_enabled", False):
+            verbose = AIAgent("Bo", "Developer", "technology", ["python"], ai_provider_manager=self.provider)
+            self.assertIn("Detaylı ve açıklayıcı", verbose.system_prompt)
+        
+        seen = []
+        
+        class CapturingLLM(SimulatedLLM):
+            async def ainvoke(self, messages, **kwargs):
+                seen.append(messages[-1].content)
+                return await super().ainvoke(messages, **kwargs)
+        
+        task = Task(id="t1", title="Rapor", description="Haftalık rapor", assigned_to="Ada",
+                    assigned_by="Lead", department="technology")
+        self.agent.llm = CapturingLLM("capture", latency=0.0)
+        asyncio.run(self.agent.execute_task(task))
+        self.assertNotIn("Detaylı", seen[0])
+        self.assertIn("Uzunluk:", seen[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Unit Tests - Per-Call Tier Routing Tests
+"""
+import unittest
+import asyncio
+import os
+import statistics
+from datetime import datetime
+from unittest import mock
+from agents.ai_agent import AIAgent
+from agents.base_agent import Task
+from systems.ai_provider import AIProvider
+from systems.simulated_provider import SimulatedLLM
+from systems.task_router import TaskRouter, estimate_call_difficulty, tier_for_difficulty
+from utils.clock import VirtualClock, get_clock, set_clock
+
+# Tier başına simüle gecikme (sn)
+LATENCY = {"gpt-4-turbo": 4.0, "gpt-4": 2.5, "gpt-3.5-turbo": 1.0}
+
+
+class TestDifficultyClassifier(unittest.TestCase):
+    """Local difficulty classifier test suite"""
+    
+    def test_routine_vs_hard_prompts(self):
+        """Routine prompts score low, architecture decisions score high"""
+        easy = estimate_call_difficulty("Mesajı onayla ve teşekkür et", "task", "low")
+        hard = estimate_call_difficulty(
+            "Ödeme servisinin mimari tasarımını ve güvenlik riskini değerlendir", "decision", "critical"
+        )
+        self.assertLessEqual(easy, 4)
+        self.assertGreaterEqual(hard, 8)
+        self.assertEqual(tier_for_difficulty(easy), "basic")
+        self.assertEqual(tier_for_difficulty(hard), "enterprise")
+    
+    def test_router_never_upgrades(self):
+        """Calls never go above the role's assigned tier"""
+        router = TaskRouter({"basic": "cheap", "pro": "mid", "enterprise": "big"})
+        self.assertEqual(router.route("mid", "pro", 10), "mid")
+        self.assertEqual(router.route("big", "enterprise", 6), "mid")
+        self.assertEqual(router.route("big", "enterprise", 2), "cheap")
+        self.assertEqual(router.get_stats()["downgraded"], 2)
+
+
+class TestAgentTaskRouting(unittest.TestCase):
+    """Agent call routing test suite"""
+    
+    def setUp(self):
+        self.previous = set_clock(VirtualClock(datetime(2026, 1, 1)))
+        patcher = mock.patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test", "ANTHROPIC_API_KEY": "", "GOOGLE_API_KEY": ""})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.provider = AIProvider(auto_mode=True)
+        self.provider.reload()
+        self.addCleanup(self.provider.auto_config.reload)
+        self.provider.strategy = {**self.provider.strategy, "task_routing": {"enabled": True}}
+        self.provider.create_client = lambda path: SimulatedLLM(
+            path, latency=LATENCY[path.split("/")[1]], jitter=0.0
+        )
+        self.agent = AIAgent("Alex", "Lead Developer", "technology", ["architecture"],
+                             ai_provider_manager=self.provider)
+    
+    def tearDown(self):
+        set_clock(self.previous)
+    
+    def _task(self, title, description, priority="medium"):
+        return Task(id=title, title=title, description=description, assigned_to="Alex",
+                    assigned_by="CTO", department="technology", priority=priority)
+    
+    def _model_for(self, task):
+        messages = [type("Msg", (), {"content": f"{task.title}\n{task.description}"})()]
+        return self.agent._llm_for_call(messages, "task", task.priority).name
+    
+    def test_routing_is_opt_in(self):
+        """The shipped config keeps calls on the assigned model"""
+        self.assertFalse(AIProvider(auto_mode=False).task_routing_enabled)
+    
+    def test_routine_call_goes_to_basic_tier(self):
+        """A Lead Developer's trivial call uses the basic model, hard ones stay on enterprise"""
+        self.assertEqual(self.agent.assigned_ai, "gpt-4-turbo")
+        self.assertEqual(self._model_for(self._task("Ack", "Mesajı onayla", "low")), "openai/gpt-3.5-turbo")
+        self.assertEqual(
+            self._model_for(self._task("Mimari", "Yeni mimari tasarım ve güvenlik stratejisi", "critical")),
+            "openai/gpt-4-turbo"
+        )
+    
+    def test_median_latency_drops(self):
+        """Routing a realistic mix cuts the median call latency"""
+        tasks = [self._task(f"Durum {i}", "Durum güncellemesini onayla", "low") for i in range(6)]
+        tasks += [self._task(f"Analiz {i}", "Performans analizi ve optimizasyon planı") for i in range(2)]
+        tasks += [self._task(f"Mimari {i}", "Mimari tasarım güvenlik stratejisi", "critical") for i in range(2)]
+        
+        def median_latency():
+            async def scenario():
+                latencies = []
+                for task in tasks:
+                    started = get_clock().timestamp()
+                    await self.agent.execute_task(task)
+                    latencies.append(get_clock().timestamp() - started)
+                return latencies
+            return statistics.median(asyncio.run(scenario()))
+        
+        routed = median_latency()
+        with mock.patch.object(AIProvider, "task_routing_enabled", False):
+            pinned = median_latency()
+        self.assertLess(routed, pinned / 2)
+        self.assertGreater(self.provider.task_router.get_stats()["downgrade_rate"], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ Unit Tests - Utils Tests
 import unittest
 import logging
 import os
+import tempfile
 from pathlib import Path
 from utils.logging_config import setup_logging, get_logger
 from utils.error_handling import handle_errors, safe_get
@@ -98,6 +99,21 @@ class TestConfigHelper(unittest.TestCase):
         self.assertEqual(result, 'default')
         
         del os.environ['TEST_VAR']
+    
+    @unittest.skipUnless(YAML_AVAILABLE, "yaml module not available")
+    def test_update_env_file_rejects_line_breaks(self):
+        """Values with CR/LF cannot inject extra .env lines"""
+        with tempfile.TemporaryDirectory() as tmp:
+            env_file = Path(tmp) / '.env'
+            env_file.write_text("# keys\nOPENAI_API_KEY=old\n")
+            
+            for value in ("sk-a\nEXTRA=1", "sk-a\rEXTRA=1"):
+                with self.assertRaises(ValueError):
+                    Config.update_env_file(env_file, {'OPENAI_API_KEY': value})
+            self.assertEqual(env_file.read_text(), "# keys\nOPENAI_API_KEY=old\n")
+            
+            Config.update_env_file(env_file, {'OPENAI_API_KEY': 'sk-new', 'GOOGLE_API_KEY': 'g'})
+            self.assertEqual(env_file.read_text(), "# keys\nOPENAI_API_KEY=sk-new\nGOOGLE_API_KEY=g\n")
 
 if __name__ == '__main__':
     unittest.main()
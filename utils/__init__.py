@@ -3,18 +3,33 @@
 from .logging_config import setup_logging, get_logger
 from .error_handling import handle_errors, safe_get
 from .performance import timer, PerformanceMonitor
+from .ids import new_id, id_to_datetime, id_bounds, id_in_range
+from .clock import Clock, WallClock, VirtualClock, get_clock, set_clock
 
 # Config helper yaml gerektirir, optional import
 try:
     from .config_helper import Config
+    from .config_service import ConfigService, ConfigError, get_config_service
     __all__ = [
         'setup_logging',
         'get_logger',
         'handle_errors',
         'safe_get',
         'Config',
+        'ConfigService',
+        'ConfigError',
+        'get_config_service',
         'timer',
-        'PerformanceMonitor'
+        'PerformanceMonitor',
+        'new_id',
+        'id_to_datetime',
+        'id_bounds',
+        'id_in_range',
+        'Clock',
+        'WallClock',
+        'VirtualClock',
+        'get_clock',
+        'set_clock'
     ]
 except ImportError:
     __all__ = [
@@ -23,5 +38,14 @@ except ImportError:
         'handle_errors',
         'safe_get',
         'timer',
-        'PerformanceMonitor'
+        'PerformanceMonitor',
+        'new_id',
+        'id_to_datetime',
+        'id_bounds',
+        'id_in_range',
+        'Clock',
+        'WallClock',
+        'VirtualClock',
+        'get_clock',
+        'set_clock'
     ]
@@ -0,0 +1,170 @@
+"""
+Simulation Clock - Tüm alt sistemlerin kullandığı saat soyutlaması
+
+WallClock gerçek zamanı kullanır. VirtualClock ise simülasyon zamanını tutar:
+sleep çağrıları bir heap kuyruğuna yazılır ve event loop boşa çıktığında saat
+bir sonraki uyanma anına anında atlar. Böylece günler süren bir simülasyon,
+LLM çağrılarının izin verdiği hızda (stub provider ile milisaniyelerde) biter
+ve aynı başlangıç zamanıyla tekrar üretilebilir.
+
+VirtualClock saati yalnızca loop'taki hazır görevlere bakarak ilerletir;
+gerçek ağ G/Ç'si (ör. bir HTTP LLM çağrısı) bekleyen görevler loop'u meşgul
+tutmaz. Böyle bir çağrı sürerken saat bir sonraki uyuyana atlayabilir, yani
+sanal saat gerçek provider'larla deterministik değildir ve yalnızca
+simüle/kasetten oynatılan provider'larla kullanılmalıdır. Provider
+gecikmesi bu yüzden saatten değil call_latency ile gerçek süreden ölçülür.
+"""
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta
+import asyncio
+import heapq
+import itertools
+import time
+
+
+class Clock:
+    """Saat arayüzü"""
+
+    def now(self) -> datetime:
+        raise NotImplementedError
+
+    def timestamp(self) -> float:
+        """Unix zaman damgası (saniye)"""
+        return self.now().timestamp()
+
+    async def sleep(self, seconds: float):
+        raise NotImplementedError
+
+    async def wait_for(self, future: asyncio.Future, timeout: Optional[float]):
+        """future'ı bu saatin zamanıyla sınırlı bekle - süre dolarsa asyncio.TimeoutError"""
+        if timeout is None:
+            return await future
+        timer = asyncio.ensure_future(self.sleep(timeout))
+        try:
+            await asyncio.wait({future, timer}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            timer.cancel()
+        if not future.done():
+            future.cancel()
+            raise asyncio.TimeoutError()
+        return future.result()
+
+    @property
+    def is_virtual(self) -> bool:
+        return False
+
+
+class WallClock(Clock):
+    """Gerçek zaman"""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def timestamp(self) -> float:
+        return time.time()
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """Olaydan olaya atlayan simülasyon saati"""
+
+    # Saat ilerletilmeden önce hazır görevlere tanınan loop turu sayısı
+    IDLE_TICKS = 3
+
+    def __init__(self, start: Optional[datetime] = None):
+        self._now = start or datetime(2026, 1, 1, 9, 0)
+        self._sleepers: List[Tuple[datetime, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._advance_scheduled = False
+
+    @property
+    def is_virtual(self) -> bool:
+        return True
+
+    def now(self) -> datetime:
+        return self._now
+
+    def advance_to(self, when: datetime):
+        """Saati ileri al ve vakti gelen uyuyanları uyandır"""
+        if when > self._now:
+            self._now = when
+        while self._sleepers and self._sleepers[0][0] <= self._now:
+            _, _, waiter = heapq.heappop(self._sleepers)
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def advance(self, delta: timedelta):
+        """Saati verilen süre kadar ileri al"""
+        self.advance_to(self._now + delta)
+
+    async def sleep(self, seconds: float):
+        """Simülasyon zamanında uyu - gerçek bekleme yapılmaz"""
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        heapq.heappush(
+            self._sleepers,
+            (self._now + timedelta(seconds=seconds), next(self._seq), waiter)
+        )
+        self._schedule_advance(loop)
+        await waiter
+
+    def _schedule_advance(self, loop, ticks: int = IDLE_TICKS):
+        if not self._advance_scheduled:
+            self._advance_scheduled = True
+            loop.call_soon(self._auto_advance, loop, ticks)
+
+    def _auto_advance(self, loop, ticks: int):
+        """
+        Hazır görevlere birkaç tur tanıdıktan sonra en yakın uyanma anına atla
+
+        Bekleyen soket/HTTP G/Ç'si hazır görev sayılmaz; saat o sırada da atlar
+        (bkz. modül açıklaması).
+        """
+        if ticks > 0:
+            loop.call_soon(self._auto_advance, loop, ticks - 1)
+            return
+
+        self._advance_scheduled = False
+        # İptal edilmiş uyuyanları at
+        while self._sleepers and self._sleepers[0][2].done():
+            heapq.heappop(self._sleepers)
+        if self._sleepers:
+            self.advance_to(self._sleepers[0][0])
+        if self._sleepers:
+            self._schedule_advance(loop)
+
+
+def call_latency(started: float, response=None) -> float:
+    """
+    LLM çağrısının gecikmesi (sn) - started, time.perf_counter() değeridir
+
+    Simüle edilen yanıtlar (SimulatedLLM, gecikmeli kaset oynatma) gerçek
+    süre harcamadığı için gecikmelerini response_metadata['simulated_latency']
+    ile bildirir; diğer tüm yanıtlar için gerçek geçen süre kullanılır.
+    """
+    metadata = getattr(response, "response_metadata", None) or {}
+    if "simulated_latency" in metadata:
+        return float(metadata["simulated_latency"])
+    return time.perf_counter() - started
+
+
+_clock: Clock = WallClock()
+
+
+def get_clock() -> Clock:
+    """Aktif saati al"""
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Aktif saati değiştir, öncekini döndür"""
+    global _clock
+    previous = _clock
+    _clock = clock
+    return previous
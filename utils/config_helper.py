@@ -2,10 +2,13 @@
 Configuration Utilities - Path ve config yönetimi
 """
 import os
+import re
 from pathlib import Path
 import yaml
 from typing import Dict, Any
 
+_ENV_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
 class Config:
     """Merkezi konfigürasyon yöneticisi"""
     
@@ -35,6 +38,28 @@ class Config:
         """Environment variable'ı al"""
         return os.getenv(key, default)
     
+    @staticmethod
+    def update_env_file(env_file: Path, updates: Dict[str, str]):
+        """.env içindeki anahtarları güncelle, diğer satırları koru
+        
+        Satır sonu içeren değerler yeni .env satırları ekleyebileceği için reddedilir.
+        """
+        for name, value in updates.items():
+            if not _ENV_NAME.match(name):
+                raise ValueError(f"Geçersiz ortam değişkeni adı: {name!r}")
+            if any(char in str(value) for char in "\r\n\0"):
+                raise ValueError(f"{name} değeri satır sonu veya NUL karakteri içeremez")
+        
+        env_file = Path(env_file)
+        lines = env_file.read_text().splitlines() if env_file.exists() else []
+        remaining = dict(updates)
+        for i, line in enumerate(lines):
+            name = line.split('=', 1)[0].strip()
+            if name in remaining:
+                lines[i] = f"{name}={remaining.pop(name)}"
+        lines.extend(f"{name}={value}" for name, value in remaining.items())
+        env_file.write_text("\n".join(lines) + "\n")
+    
     @staticmethod
     def is_production() -> bool:
         """Production ortamında mı?"""
@@ -0,0 +1,264 @@
+"""
+Config Service - Tek seferde parse edilen, doğrulanan ve önbelleklenen konfigürasyon
+
+Her YAML dosyası süreç başına bir kez okunur ve tipli şemaya göre doğrulanır.
+Doğrulanmış sonuç JSON olarak diske yazılır: önbellek kaydı dosyanın
+mtime'ını ve içerik hash'ini taşır. Sonraki açılışlarda mtime aynıysa dosya
+hiç okunmaz; mtime değişmiş ama içerik aynıysa (ör. checkout) hash eşleşir ve
+yine YAML parse edilmez. Aynı süreç içindeki tüm alt sistemler aynı sözlüğü
+paylaşır.
+"""
+from typing import Any, Dict, List, Literal, Optional, Type
+from pathlib import Path
+import hashlib
+import json
+import os
+import re
+import threading
+import yaml
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Şema değişince eski önbellek kayıtları geçersiz olur
+SCHEMA_VERSION = 5
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "data" / "cache" / "config"
+
+_TIME_PATTERN = re.compile(r"^\d{1,2}:\d{2}$")
+
+
+class ConfigError(ValueError):
+    """Konfigürasyon dosyası şemaya uymuyor"""
+
+
+class _Section(BaseModel):
+    # Şemada tanımlanmayan alanlar korunur
+    model_config = ConfigDict(extra="allow")
+
+
+class MemberConfig(_Section):
+    role: str
+    name: str
+    skills: List[str] = Field(default_factory=list)
+
+
+class DepartmentConfig(_Section):
+    name: Optional[str] = None
+    manager: Optional[str] = None
+    team: List[MemberConfig] = Field(default_factory=list)
+    teams: Dict[str, List[MemberConfig]] = Field(default_factory=dict)
+
+
+class CompanyInfo(_Section):
+    name: str
+    vision: str = ""
+    mission: str = ""
+    goals: Dict[str, List[str]] = Field(default_factory=dict)
+
+
+class MeetingConfig(_Section):
+    time: Optional[str] = None
+    duration: int = Field(default=30, gt=0)
+    day: Optional[Any] = None
+
+    @field_validator("time")
+    @classmethod
+    def _check_time(cls, value):
+        if value is not None and not _TIME_PATTERN.match(str(value)):
+            raise ValueError(f"Saat HH:MM biçiminde olmalı: {value}")
+        return value
+
+
+class MailboxConfig(_Section):
+    capacity: int = Field(default=100, gt=0)
+    policy: Literal["block", "drop_oldest", "coalesce"] = "drop_oldest"
+    block_timeout: float = Field(default=5.0, ge=0)
+
+
+class MeetingRuntimeConfig(_Section):
+    transcript_ttl_days: float = Field(default=7, ge=0)
+    retention_days: Optional[float] = None
+    compaction_batch: int = Field(default=64, gt=0)
+    # Sadece katkıları LLM ile toplanan toplantı tipleri (bkz. systems.meeting.MODE_MEETING_TYPES)
+    modes: Dict[Literal["weekly_review"], Literal["individual", "synthesized"]] = Field(default_factory=dict)
+
+
+class GoalRuntimeConfig(_Section):
+    catalog_path: Optional[str] = None
+
+    @field_validator("catalog_path")
+    @classmethod
+    def _anchor_to_project(cls, value):
+        # Göreli yol çalışma dizinine değil proje köküne göre çözülür
+        if value is None or Path(value).is_absolute():
+            return value
+        return str(PROJECT_ROOT / value)
+
+
+class ModelRuntimeConfig(_Section):
+    daily_budget: Optional[float] = Field(default=None, ge=0)
+    calls_per_agent: float = Field(default=40, ge=0)
+    tokens_per_call: int = Field(default=1500, gt=0)
+    rate_limits: Dict[str, float] = Field(default_factory=dict)
+    max_latency: Dict[str, float] = Field(default_factory=dict)
+
+
+class RuntimeConfig(_Section):
+    clock: Literal["wall", "virtual"] = "wall"
+    mailbox: Optional[MailboxConfig] = None
+    meetings: Optional[MeetingRuntimeConfig] = None
+    goals: Optional[GoalRuntimeConfig] = None
+    models: Optional[ModelRuntimeConfig] = None
+    pacing: Dict[str, float] = Field(default_factory=dict)
+
+
+class CompanyConfig(_Section):
+    """company_config.yaml şeması"""
+    company: CompanyInfo
+    departments: Dict[str, DepartmentConfig] = Field(default_factory=dict)
+    meetings: Dict[str, MeetingConfig] = Field(default_factory=dict)
+    work_schedule: Dict[str, Any] = Field(default_factory=dict)
+    runtime: Optional[RuntimeConfig] = None
+
+
+class ProviderModelConfig(_Section):
+    tier: str
+    cost: Any = None
+    strengths: List[str] = Field(default_factory=list)
+    best_for: List[str] = Field(default_factory=list)
+    context_window: int = Field(default=4096, gt=0)
+
+
+class ProviderConfig(_Section):
+    models: Dict[str, ProviderModelConfig] = Field(default_factory=dict)
+
+
+class ProvidersConfig(_Section):
+    """ai_providers_config.yaml şeması"""
+    ai_providers: Dict[str, ProviderConfig] = Field(default_factory=dict)
+    role_assignments: Dict[str, Dict[str, Dict[str, Any]]] = Field(default_factory=dict)
+
+
+class ConfigService:
+    """YAML konfigürasyonlarını bir kez parse eden, doğrulayan ve önbellekleyen servis"""
+
+    def __init__(self, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # çözümlenmiş yol -> (mtime_ns, sha256, sözlük)
+        self._loaded: Dict[Path, tuple] = {}
+        self._lock = threading.Lock()
+        self.stats = {"parsed": 0, "disk_hits": 0, "memory_hits": 0}
+
+    def load(self, path, schema: Type[BaseModel]) -> Dict[str, Any]:
+        """Dosyayı doğrulanmış sözlük olarak döndür - süreç içinde paylaşılır"""
+        path = Path(path).resolve()
+        mtime_ns = path.stat().st_mtime_ns
+
+        with self._lock:
+            loaded = self._loaded.get(path)
+            if loaded and loaded[0] == mtime_ns:
+                self.stats["memory_hits"] += 1
+                return loaded[2]
+
+            data, digest = self._load_uncached(path, schema, mtime_ns)
+            self._loaded[path] = (mtime_ns, digest, data)
+            return data
+
+    def load_company(self, path=PROJECT_ROOT / "config" / "company_config.yaml") -> Dict[str, Any]:
+        """company_config.yaml"""
+        return self.load(path, CompanyConfig)
+
+    def load_providers(self, path=PROJECT_ROOT / "config" / "ai_providers_config.yaml") -> Dict[str, Any]:
+        """ai_providers_config.yaml"""
+        return self.load(path, ProvidersConfig)
+
+    def invalidate(self, path=None):
+        """Bellek önbelleğini temizle (disk önbelleği hash ile kendini doğrular)"""
+        with self._lock:
+            if path is None:
+                self._loaded.clear()
+            else:
+                self._loaded.pop(Path(path).resolve(), None)
+
+    def _cache_file(self, path: Path, schema: Type[BaseModel]) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        key = hashlib.sha256(f"{path}:{schema.__name__}".encode()).hexdigest()[:16]
+        return self.cache_dir / f"{path.stem}.{key}.json"
+
+    def _load_uncached(self, path: Path, schema: Type[BaseModel], mtime_ns: int):
+        cache_file = self._cache_file(path, schema)
+        entry = self._read_cache(cache_file)
+
+        # mtime aynıysa kaynak dosya okunmaz
+        if entry and entry["mtime_ns"] == mtime_ns:
+            self.stats["disk_hits"] += 1
+            return entry["data"], entry["sha256"]
+
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry and entry["sha256"] == digest:
+            self.stats["disk_hits"] += 1
+            self._write_cache(cache_file, mtime_ns, digest, entry["data"])
+            return entry["data"], digest
+
+        try:
+            validated = schema.model_validate(yaml.safe_load(raw) or {})
+        except ValidationError as e:
+            raise ConfigError(f"{path.name} geçersiz:\n{e}") from e
+        # Şema varsayılanları doldurulmuş haliyle paylaşılır; boş (None) alanlar
+        # yazılmaz, böylece tanımlanmayan bölümler .get() ile eskisi gibi okunur
+        data = validated.model_dump(exclude_none=True)
+        self.stats["parsed"] += 1
+        logger.debug(f"⚙️ Config parse edildi: {path}")
+
+        self._write_cache(cache_file, mtime_ns, digest, data)
+        return data, digest
+
+    def _read_cache(self, cache_file: Optional[Path]) -> Optional[Dict]:
+        if not cache_file or not cache_file.exists():
+            return None
+        try:
+            entry = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("schema_version") != SCHEMA_VERSION:
+            return None
+        return entry
+
+    def _write_cache(self, cache_file: Optional[Path], mtime_ns: int, digest: str, data: Dict):
+        if not cache_file:
+            return
+        entry = {
+            "schema_version": SCHEMA_VERSION,
+            "mtime_ns": mtime_ns,
+            "sha256": digest,
+            "data": data
+        }
+        try:
+            encoded = json.dumps(entry, ensure_ascii=False)
+            if json.loads(encoded)["data"] != data:
+                return  # JSON'da birebir temsil edilemiyor (ör. sayı anahtarları)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Yarım yazılmış kayıt okunmasın diye önce geçici dosyaya yaz
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(encoded, encoding="utf-8")
+            tmp.replace(cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            # Önbellek isteğe bağlı - JSON'a çevrilemeyen değerler veya salt okunur dizin
+            logger.debug(f"Config önbelleği yazılamadı: {e}")
+
+
+_config_service: Optional[ConfigService] = None
+
+
+def get_config_service() -> ConfigService:
+    """Paylaşılan config servisi"""
+    global _config_service
+    if _config_service is None:
+        _config_service = ConfigService()
+    return _config_service
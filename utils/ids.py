@@ -0,0 +1,125 @@
+"""
+ID Service - Monoton, çakışmasız ve zamana göre sıralanabilir kimlikler
+
+ULID formatı kullanılır: 48 bit milisaniye zaman damgası (aktif saatten,
+bkz. utils.clock) + 80 bit rastgelelik, Crockford base32 ile 26 karakter.
+Aynı milisaniye içinde üretilen kimlikler rastgele kısmı bir artırarak
+monoton kalır; fork sonrası çocuk process yeni bir rastgele başlangıç alır.
+Böylece kimlikler string olarak sıralandığında zaman sırasına girer ve
+zaman aralığı sorguları doğrudan kimlik üzerinde yapılabilir.
+"""
+import os
+import threading
+from datetime import datetime
+from typing import Optional, Tuple
+
+from utils.clock import get_clock
+
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_DECODE = {c: i for i, c in enumerate(_ALPHABET)}
+_ULID_LENGTH = 26
+_TIME_LENGTH = 10
+_RANDOM_BITS = 80
+_RANDOM_MAX = (1 << _RANDOM_BITS) - 1
+
+
+def _encode(value: int, length: int) -> str:
+    """Tamsayıyı sabit uzunlukta Crockford base32'ye çevir"""
+    chars = []
+    for _ in range(length):
+        chars.append(_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def _decode(text: str) -> int:
+    """Crockford base32 string'i tamsayıya çevir"""
+    value = 0
+    for char in text:
+        value = (value << 5) | _DECODE[char]
+    return value
+
+
+class IDGenerator:
+    """Thread-safe, monoton ULID üretici"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def _reset(self):
+        """Fork sonrası durumu sıfırla - çocuk process aynı diziyi üretmesin"""
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def _next_value(self) -> int:
+        with self._lock:
+            now_ms = int(get_clock().timestamp() * 1000)
+
+            if now_ms <= self._last_ms:
+                # Aynı milisaniye (veya saat geri gitti) - monoton artır
+                now_ms = self._last_ms
+                random_part = self._last_random + 1
+                if random_part > _RANDOM_MAX:
+                    now_ms += 1
+                    random_part = int.from_bytes(os.urandom(10), "big") >> 1
+            else:
+                # Taşmayı pratikte imkansız kılmak için üst bit boş bırakılır
+                random_part = int.from_bytes(os.urandom(10), "big") >> 1
+
+            self._last_ms = now_ms
+            self._last_random = random_part
+            return (now_ms << _RANDOM_BITS) | random_part
+
+    def new_ulid(self) -> str:
+        """Yeni ULID üret"""
+        return _encode(self._next_value(), _ULID_LENGTH)
+
+
+_generator = IDGenerator()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_generator._reset)
+
+
+def new_id(prefix: str = "") -> str:
+    """Yeni kimlik üret (örn: 'msg_01HV3K...')"""
+    ulid = _generator.new_ulid()
+    return f"{prefix}_{ulid}" if prefix else ulid
+
+
+def _ulid_part(entity_id: str) -> str:
+    """Önekli kimlikten ULID kısmını ayır"""
+    return entity_id.rsplit("_", 1)[-1]
+
+
+def id_to_datetime(entity_id: str) -> datetime:
+    """Kimliğin üretildiği zamanı döndür"""
+    ulid = _ulid_part(entity_id)
+    if len(ulid) != _ULID_LENGTH:
+        raise ValueError(f"Geçersiz kimlik: {entity_id}")
+    return datetime.fromtimestamp(_decode(ulid[:_TIME_LENGTH]) / 1000)
+
+
+def id_bounds(
+    start: datetime,
+    end: datetime,
+    prefix: str = ""
+) -> Tuple[str, str]:
+    """[start, end] zaman aralığını kapsayan en küçük ve en büyük kimlikler"""
+    low = _encode(int(start.timestamp() * 1000), _TIME_LENGTH) + "0" * 16
+    high = _encode(int(end.timestamp() * 1000), _TIME_LENGTH) + "Z" * 16
+    if prefix:
+        return f"{prefix}_{low}", f"{prefix}_{high}"
+    return low, high
+
+
+def id_in_range(entity_id: str, start: datetime, end: Optional[datetime] = None) -> bool:
+    """Kimlik verilen zaman aralığında mı üretildi?"""
+    ulid = _ulid_part(entity_id)
+    if end is None:
+        return id_bounds(start, start)[0] <= ulid
+    low, high = id_bounds(start, end)
+    return low <= ulid <= high